@@ -97,6 +97,21 @@ class Ui_CoreCycler(object):
         self.label_14.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
         self.label_14.setObjectName("label_14")
         self.gridLayout_3.addWidget(self.label_14, 0, 0, 1, 1)
+        self.pushButton_16 = QtWidgets.QPushButton(self.tab_1)
+        self.pushButton_16.setGeometry(QtCore.QRect(180, 234, 91, 23))
+        self.pushButton_16.setObjectName("pushButton_16")
+        self.pushButton_17 = QtWidgets.QPushButton(self.tab_1)
+        self.pushButton_17.setGeometry(QtCore.QRect(280, 234, 91, 23))
+        self.pushButton_17.setObjectName("pushButton_17")
+        self.pushButton_18 = QtWidgets.QPushButton(self.tab_1)
+        self.pushButton_18.setGeometry(QtCore.QRect(10, 380, 111, 23))
+        self.pushButton_18.setObjectName("pushButton_18")
+        self.pushButton_19 = QtWidgets.QPushButton(self.tab_1)
+        self.pushButton_19.setGeometry(QtCore.QRect(130, 380, 111, 23))
+        self.pushButton_19.setObjectName("pushButton_19")
+        self.pushButton_20 = QtWidgets.QPushButton(self.tab_1)
+        self.pushButton_20.setGeometry(QtCore.QRect(250, 380, 111, 23))
+        self.pushButton_20.setObjectName("pushButton_20")
         self.gridLayoutWidget_2 = QtWidgets.QWidget(self.tab_1)
         self.gridLayoutWidget_2.setGeometry(QtCore.QRect(10, 260, 471, 31))
         self.gridLayoutWidget_2.setObjectName("gridLayoutWidget_2")
@@ -113,6 +128,7 @@ class Ui_CoreCycler(object):
         self.comboBox_1.addItem("")
         self.comboBox_1.addItem("")
         self.comboBox_1.addItem("")
+        self.comboBox_1.addItem("")
         self.gridLayout_4.addWidget(self.comboBox_1, 0, 1, 1, 1)
         self.lineEdit_6 = QtWidgets.QLineEdit(self.gridLayoutWidget_2)
         self.lineEdit_6.setInputMask("")
@@ -215,6 +231,9 @@ class Ui_CoreCycler(object):
         self.lineEdit_11 = QtWidgets.QLineEdit(self.gridLayoutWidget_8)
         self.lineEdit_11.setObjectName("lineEdit_11")
         self.gridLayout_2.addWidget(self.lineEdit_11, 0, 1, 1, 1)
+        self.pushButton_15 = QtWidgets.QPushButton(self.gridLayoutWidget_8)
+        self.pushButton_15.setObjectName("pushButton_15")
+        self.gridLayout_2.addWidget(self.pushButton_15, 0, 2, 1, 1)
         self.gridLayoutWidget_9 = QtWidgets.QWidget(self.tab_1)
         self.gridLayoutWidget_9.setGeometry(QtCore.QRect(10, 340, 471, 31))
         self.gridLayoutWidget_9.setObjectName("gridLayoutWidget_9")
@@ -429,6 +448,12 @@ class Ui_CoreCycler(object):
         self.label_27 = QtWidgets.QLabel(self.tab_4)
         self.label_27.setGeometry(QtCore.QRect(100, 120, 51, 21))
         self.label_27.setObjectName("label_27")
+        self.label_34 = QtWidgets.QLabel(self.tab_4)
+        self.label_34.setGeometry(QtCore.QRect(20, 170, 421, 81))
+        self.label_34.setText("")
+        self.label_34.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_34.setWordWrap(True)
+        self.label_34.setObjectName("label_34")
         self.tabWidget.addTab(self.tab_4, "")
         self.tab_5 = QtWidgets.QWidget()
         self.tab_5.setObjectName("tab_5")
@@ -655,6 +680,9 @@ class Ui_CoreCycler(object):
         self.label_33 = QtWidgets.QLabel(self.tab_6)
         self.label_33.setGeometry(QtCore.QRect(10, 490, 91, 21))
         self.label_33.setObjectName("label_33")
+        self.pushButton_21 = QtWidgets.QPushButton(self.tab_6)
+        self.pushButton_21.setGeometry(QtCore.QRect(200, 510, 101, 23))
+        self.pushButton_21.setObjectName("pushButton_21")
         self.tabWidget.addTab(self.tab_6, "")
         self.tab_7 = QtWidgets.QWidget()
         self.tab_7.setObjectName("tab_7")
@@ -701,6 +729,17 @@ class Ui_CoreCycler(object):
         self.label_6 = QtWidgets.QLabel(self.tab_7)
         self.label_6.setGeometry(QtCore.QRect(360, 220, 131, 21))
         self.label_6.setObjectName("label_6")
+        self.line_9 = QtWidgets.QFrame(self.tab_7)
+        self.line_9.setGeometry(QtCore.QRect(-3, 250, 501, 20))
+        self.line_9.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_9.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_9.setObjectName("line_9")
+        self.pushButton_13 = QtWidgets.QPushButton(self.tab_7)
+        self.pushButton_13.setGeometry(QtCore.QRect(20, 280, 111, 23))
+        self.pushButton_13.setObjectName("pushButton_13")
+        self.pushButton_14 = QtWidgets.QPushButton(self.tab_7)
+        self.pushButton_14.setGeometry(QtCore.QRect(190, 280, 111, 23))
+        self.pushButton_14.setObjectName("pushButton_14")
         self.tabWidget.addTab(self.tab_7, "")
         self.tab_8 = QtWidgets.QWidget()
         self.tab_8.setObjectName("tab_8")
@@ -823,6 +862,16 @@ class Ui_CoreCycler(object):
         self.spinBox_9.setSuffix(_translate("CoreCycler", "m"))
         self.label_14.setToolTip(_translate("CoreCycler", "<html><head/><body><p>Path to config file.</p><p>configs\\configs\\quick-initial-test.yCruncher.config.ini</p></body></html>"))
         self.label_14.setText(_translate("CoreCycler", "Runtime Per Core:"))
+        self.pushButton_16.setToolTip(_translate("CoreCycler", "Suggest a runtime per core from the time to the first error in the logs"))
+        self.pushButton_16.setText(_translate("CoreCycler", "Suggest..."))
+        self.pushButton_17.setToolTip(_translate("CoreCycler", "Plan runtime, iterations and core order for a fixed time budget"))
+        self.pushButton_17.setText(_translate("CoreCycler", "Plan..."))
+        self.pushButton_18.setToolTip(_translate("CoreCycler", "Search the text of all logs in the logs folder"))
+        self.pushButton_18.setText(_translate("CoreCycler", "Search Logs..."))
+        self.pushButton_19.setToolTip(_translate("CoreCycler", "Open a log in the log viewer"))
+        self.pushButton_19.setText(_translate("CoreCycler", "View Log..."))
+        self.pushButton_20.setToolTip(_translate("CoreCycler", "Chart the CPU usage, FFT progress, CO values or Linpack GFlops of a run"))
+        self.pushButton_20.setText(_translate("CoreCycler", "Charts..."))
         self.label_4.setToolTip(_translate("CoreCycler", "<html><head/><body><p>Path to config file.</p><p>configs\\configs\\quick-initial-test.yCruncher.config.ini</p></body></html>"))
         self.label_4.setText(_translate("CoreCycler", "Core Test Order"))
         self.comboBox_1.setItemText(0, _translate("CoreCycler", "Default"))
@@ -830,6 +879,7 @@ class Ui_CoreCycler(object):
         self.comboBox_1.setItemText(2, _translate("CoreCycler", "Sequential"))
         self.comboBox_1.setItemText(3, _translate("CoreCycler", "Random"))
         self.comboBox_1.setItemText(4, _translate("CoreCycler", "Custom"))
+        self.comboBox_1.setItemText(5, _translate("CoreCycler", "Interleaved"))
         self.label_5.setText(_translate("CoreCycler", "Max Iterations"))
         self.label_7.setText(_translate("CoreCycler", "Delay Between Cores (sec)"))
         self.checkBox_8.setText(_translate("CoreCycler", "Look for WHEAs"))
@@ -847,6 +897,8 @@ class Ui_CoreCycler(object):
         self.checkBox_10.setText(_translate("CoreCycler", "Restart for Each Core"))
         self.checkBox_5.setText(_translate("CoreCycler", "Suspend Periodically"))
         self.checkBox_12.setText(_translate("CoreCycler", "Use Config File"))
+        self.pushButton_15.setToolTip(_translate("CoreCycler", "Browse the preset config files in the configs folder"))
+        self.pushButton_15.setText(_translate("CoreCycler", "Presets..."))
         self.label_3.setToolTip(_translate("CoreCycler", "<html><head/><body><p>Ignore certain cores</p><p>Comma separated list of cores that will not be tested</p><p>The enumeration of cores starts with 0</p><p><br/></p><p>Example: coresToIgnore = 0, 1, 2</p><p>Default: (empty)</p><p><br/></p></body></html>"))
         self.label_3.setText(_translate("CoreCycler", "Ignored Cores"))
         self.lineEdit.setToolTip(_translate("CoreCycler", "<html><head/><body><p>Ignore certain cores</p><p>Comma separated list of cores that will not be tested</p><p>The enumeration of cores starts with 0</p><p><br/></p><p>Example: coresToIgnore = 0, 1, 2</p><p>Default: (empty)</p><p><br/></p></body></html>"))
@@ -953,6 +1005,8 @@ class Ui_CoreCycler(object):
         self.label_32.setText(_translate("CoreCycler", "Test Duration (sec)"))
         self.checkBox_48.setText(_translate("CoreCycler", "Default"))
         self.label_33.setText(_translate("CoreCycler", "Memory (MB)"))
+        self.pushButton_21.setToolTip(_translate("CoreCycler", "Size the memory so the tests run in the L2, the L3 or out of the cache"))
+        self.pushButton_21.setText(_translate("CoreCycler", "Plan Memory..."))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_6), _translate("CoreCycler", "yCruncher"))
         self.pushButton_4.setText(_translate("CoreCycler", "Boost Tester"))
         self.pushButton_5.setText(_translate("CoreCycler", "PBO2 Tuner"))
@@ -963,6 +1017,8 @@ class Ui_CoreCycler(object):
         self.pushButton_12.setText(_translate("CoreCycler", "Helpers"))
         self.checkBox_14.setText(_translate("CoreCycler", "Enable Corecycler Update"))
         self.label_6.setText(_translate("CoreCycler", "Update Frequency (days)"))
+        self.pushButton_13.setText(_translate("CoreCycler", "Run Queue"))
+        self.pushButton_14.setText(_translate("CoreCycler", "Processes"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_7), _translate("CoreCycler", "Tools"))
         self.label_15.setText(_translate("CoreCycler", "File Name"))
         self.label_16.setText(_translate("CoreCycler", "Log Level"))
@@ -0,0 +1,232 @@
+# automode.py
+import os
+import sys
+import argparse
+from datetime import datetime, timedelta
+
+import loganalysis
+
+# ===========================================
+# Automatic Test Mode resume state
+# ===========================================
+# With enableResumeAfterUnexpectedExit = 1 the script writes a .automode file
+# into the script folder whenever it starts testing a core, and removes it when
+# the run ends normally. After a crash, helpers\automode-startup-script.ps1
+# reads it and restarts "Run CoreCycler.bat" with the core number. The file has
+# five lines: Unix timestamp, core, CoreCycler log, stress test log and the
+# current Curve Optimizer / voltage offset values separated by spaces.
+AUTOMODE_FILE = ".automode"
+AUTOMODE_MAX_AGE = timedelta(hours=12)  # The startup script refuses to resume older states
+TAIL_CHUNK_SIZE = 64 * 1024
+MAX_TAIL_BYTES = 8 * 1024 * 1024
+
+
+def read_automode_file(path):
+    """
+    Parse a .automode file.
+
+    Returns:
+        dict: The resume state, or None if there is no file
+
+    Raises:
+        ValueError: If the file doesn't have all five lines
+    """
+    try:
+        with open(path, "r", encoding="utf-8-sig", errors="replace") as automode:
+            lines = automode.read().strip().splitlines()
+    except FileNotFoundError:
+        return None
+    if len(lines) < 5:
+        raise ValueError(f"The .automode file doesn't have all required information: {path}")
+    return {
+        # Get-Date -UFormat %s of PowerShell 5.1 counts the local time as if it were UTC
+        "timestamp": datetime(1970, 1, 1) + timedelta(seconds=int(lines[0].strip())),
+        "core": int(lines[1].strip()),
+        "corecycler_log": lines[2].strip(),
+        "stress_test_log": lines[3].strip(),
+        "values": lines[4].split(),
+    }
+
+
+def write_automode_values(path, values):
+    """Replace the Curve Optimizer / voltage offset values the resumed run starts with."""
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as automode:
+        lines = automode.read().strip().splitlines()
+    lines[4] = " ".join(str(value) for value in values)
+    with open(path, "w", encoding="utf-8", newline="\r\n") as automode:
+        automode.write("\n".join(lines) + "\n")
+
+
+def local_log_path(logged_path, log_dir):
+    """
+    The .automode file has the log path of the test machine, look for the log in the logs folder if it isn't there.
+    """
+    if os.path.exists(logged_path):
+        return logged_path
+    candidate = os.path.join(log_dir, logged_path.replace("\\", "/").rsplit("/", 1)[-1])
+    return candidate if os.path.exists(candidate) else None
+
+
+def read_lines_backwards(path, max_bytes=MAX_TAIL_BYTES):
+    """Yield the lines of a file from the last one up, reading at most max_bytes from the end."""
+    with open(path, "rb") as log:
+        log.seek(0, os.SEEK_END)
+        position = log.tell()
+        limit = max(0, position - max_bytes)
+        remainder = b""
+        while position > limit:
+            size = min(TAIL_CHUNK_SIZE, position - limit)
+            position -= size
+            log.seek(position)
+            chunks = (log.read(size) + remainder).split(b"\n")
+            remainder = chunks.pop(0)
+            for chunk in reversed(chunks):
+                yield chunk.decode("utf-8", errors="replace").rstrip("\r")
+        if remainder:
+            yield remainder.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def reconstruct_run(corecycler_log):
+    """
+    Find where a run stopped by reading its log from the end.
+
+    Only the tail is read until the current core, iteration and last timestamp
+    are found, so even a log of a multi-day run is inspected in milliseconds.
+
+    Returns:
+        dict: "core", "iteration", "last_log_time", "core_started", "elapsed_seconds", "last_error"
+    """
+    info = loganalysis.parse_log_name(corecycler_log)
+    if info is None or info["family"] != "CoreCycler":
+        raise ValueError(f"Not a CoreCycler log file: {corecycler_log}")
+    state = {"core": None, "iteration": None, "last_log_time": None, "core_started": None,
+             "elapsed_seconds": None, "last_error": None}
+    last_time = None
+
+    for line in read_lines_backwards(corecycler_log):
+        text = line.strip()
+        match = loganalysis.CORECYCLER_TIME_PATTERN.match(text)
+        if match and last_time is None:
+            last_time = tuple(int(value) for value in match.groups())
+        if state["last_error"] is None:
+            match = loganalysis.ERROR_MESSAGE_PATTERN.match(text) or loganalysis.FATAL_ERROR_PATTERN.match(text)
+            if match:
+                state["last_error"] = match.group(1).strip()
+        if state["core"] is None:
+            match = loganalysis.CORE_SET_PATTERN.search(text)
+            if match:
+                state["core"] = int(match.group(1))
+                time_match = loganalysis.CORECYCLER_TIME_PATTERN.match(text)
+                if time_match:
+                    state["core_started"] = tuple(int(value) for value in time_match.groups())
+        if state["iteration"] is None:
+            match = loganalysis.ITERATION_PATTERN.search(text)
+            if match:
+                state["iteration"] = int(match.group(1))
+        if state["core"] is not None and state["iteration"] is not None and last_time is not None:
+            break
+
+    if last_time is not None:
+        # The log only has times of day, assume less than a day between them
+        last_log_time = info["started"].replace(hour=last_time[0], minute=last_time[1], second=last_time[2])
+        if last_log_time < info["started"]:
+            last_log_time += timedelta(days=1)
+        state["last_log_time"] = last_log_time
+        state["elapsed_seconds"] = (last_log_time - info["started"]).total_seconds()
+        if state["core_started"] is not None:
+            core_started = last_log_time.replace(hour=state["core_started"][0], minute=state["core_started"][1],
+                                                 second=state["core_started"][2])
+            if core_started > last_log_time:
+                core_started -= timedelta(days=1)
+            state["core_started"] = core_started
+    else:
+        state["core_started"] = None
+    state["run_started"] = info["started"]
+    return state
+
+
+def inspect_resume_state(script_root, log_dir=None, now=None):
+    """
+    Combine the .automode file with the end of the log of the crashed run.
+
+    Args:
+        script_root (str): The CoreCycler folder
+        log_dir (str): The logs folder, defaults to "logs" in the script folder
+        now (datetime): The current time, for the age check
+
+    Returns:
+        dict: The resume state with "log" (the reconstructed run, or None) and "expired", or None without a .automode file
+    """
+    state = read_automode_file(os.path.join(script_root, AUTOMODE_FILE))
+    if state is None:
+        return None
+    log_dir = log_dir or os.path.join(script_root, "logs")
+    now = now or datetime.now()
+    state["age"] = now - state["timestamp"]
+    state["expired"] = state["age"] > AUTOMODE_MAX_AGE
+    state["log_path"] = local_log_path(state["corecycler_log"], log_dir)
+    state["log"] = reconstruct_run(state["log_path"]) if state["log_path"] else None
+    return state
+
+
+def format_elapsed(seconds):
+    hours, rest = divmod(int(seconds), 3600)
+    return f"{hours:02d}h {rest // 60:02d}m {rest % 60:02d}s"
+
+
+def format_resume_state(state):
+    """Describe a resume state for the user."""
+    lines = [
+        f"Core being tested:   {state['core']}",
+        f"Values:              {' '.join(state['values']) or '(none)'}",
+        f"State written:       {state['timestamp']:%Y-%m-%d %H:%M:%S} "
+        f"({state['age'].total_seconds() / 3600:.1f} hours ago)",
+    ]
+    if state["expired"]:
+        lines.append(f"                     Older than {AUTOMODE_MAX_AGE.total_seconds() / 3600:.0f} hours, "
+                     "the startup task won't resume it")
+    log = state["log"]
+    if log is None:
+        lines.append(f"Log file:            {state['corecycler_log']} (not found)")
+        return "\n".join(lines)
+    lines.append(f"Log file:            {os.path.basename(state['log_path'])}")
+    lines.append(f"Run started:         {log['run_started']:%Y-%m-%d %H:%M:%S}")
+    if log["last_log_time"] is not None:
+        lines.append(f"Last log entry:      {log['last_log_time']:%Y-%m-%d %H:%M:%S} "
+                     f"({format_elapsed(log['elapsed_seconds'])} into the run)")
+    if log["iteration"] is not None:
+        lines.append(f"Iteration:           {log['iteration']}")
+    if log["core"] is not None and log["core_started"] is not None and log["last_log_time"] is not None:
+        lines.append(f"Core {log['core']} ran for:      "
+                     f"{format_elapsed((log['last_log_time'] - log['core_started']).total_seconds())} "
+                     "before the log ended")
+    if log["last_error"]:
+        lines.append(f"Last error:          {log['last_error']}")
+    return "\n".join(lines)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def build_parser():
+    parser = argparse.ArgumentParser(description="Show the Automatic Test Mode resume state after a crash.")
+    parser.add_argument("--root", default=".", help="The CoreCycler folder with the .automode file")
+    parser.add_argument("--logs", help="The logs folder, defaults to logs in the CoreCycler folder")
+    return parser
+
+
+def main(args):
+    try:
+        state = inspect_resume_state(args.root, args.logs)
+    except (OSError, ValueError) as e:
+        print(f"Could not read the resume state: {e}")
+        return 1
+    if state is None:
+        print("No .automode file, there is no run to resume")
+        return 0
+    print(format_resume_state(state))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(build_parser().parse_args()))
@@ -0,0 +1,419 @@
+# benchmark.py
+import io
+import os
+import sys
+import glob
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import configparser
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import loganalysis
+import presets
+
+# ===========================================
+# Benchmark runner
+# ===========================================
+# Runs headless, on a copy of the config files, so the benchmarks never touch
+# the real config.ini. Every run is appended to the history file, and the
+# results are compared with the previous run.
+BENCHMARK_HISTORY_FILE = "benchmark-history.json"
+DEFAULT_REPEAT = 5
+LOG_FAMILIES = ["CoreCycler", "Prime95", "yCruncher", "Linpack"]
+
+
+def measure(function, repeat):
+    """
+    Run a benchmark function several times.
+
+    Returns:
+        dict: {"median_ms", "min_ms", "runs"}
+    """
+    function()  # Warm up the file cache and imports
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(timings), "min_ms": min(timings), "runs": repeat}
+
+
+def source_version():
+    """Identify the code that was benchmarked."""
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True, text=True, timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return "unknown"
+
+
+# ===========================================
+# Benchmarks
+# ===========================================
+# Each suite returns (name, function, work units, unit name) tuples; the
+# throughput is the number of units per second of the median run.
+def config_benchmarks(script_root, work_dir):
+    config_file = os.path.join(work_dir, "config.ini")
+    shutil.copy(os.path.join(script_root, "config.ini"), config_file)
+    shutil.copytree(os.path.join(script_root, presets.CONFIG_DIR), os.path.join(work_dir, presets.CONFIG_DIR))
+    preset_files = sorted(glob.glob(os.path.join(work_dir, presets.CONFIG_DIR, "*.ini")))
+    output_file = os.path.join(work_dir, "patched.ini")
+
+    def load(paths):
+        def run():
+            for path in paths:
+                parser = configparser.ConfigParser()
+                parser.read(path)
+        return run
+
+    def patch_and_save(paths):
+        # Parse once, then patch one setting and write the whole file like the GUI does
+        parsers = []
+        for path in paths:
+            parser = configparser.ConfigParser()
+            parser.read(path)
+            parsers.append(parser)
+
+        def run():
+            for parser in parsers:
+                if "General" not in parser:
+                    parser["General"] = {}
+                parser["General"]["runtimePerCore"] = "5m"
+                with open(output_file, "w") as configfile:
+                    parser.write(configfile)
+        return run
+
+    def resolve_cold():
+        presets.ConfigResolver(
+            default_config=os.path.join(work_dir, presets.DEFAULT_CONFIG_FILE), user_config=config_file
+        ).resolve()
+
+    cached_resolver = presets.ConfigResolver(
+        default_config=os.path.join(work_dir, presets.DEFAULT_CONFIG_FILE), user_config=config_file
+    )
+
+    def resolve_cached():
+        for _ in range(1000):
+            cached_resolver.get("General", "runtimePerCore")
+
+    def scan_presets():
+        previous_dir = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            with redirect_stdout(io.StringIO()):
+                presets.PresetLibrary(presets.ConfigResolver()).scan()
+        finally:
+            os.chdir(previous_dir)
+
+    return [
+        ("config.load[config.ini]", load([config_file]), 1, "files"),
+        ("config.patch_save[config.ini]", patch_and_save([config_file]), 1, "files"),
+        ("config.load[configs]", load(preset_files), len(preset_files), "files"),
+        ("config.patch_save[configs]", patch_and_save(preset_files), len(preset_files), "files"),
+        ("config.resolve[cold]", resolve_cold, 1, "resolves"),
+        ("config.resolve[cached]", resolve_cached, 1000, "lookups"),
+        ("config.preset_scan[cold]", scan_presets, len(preset_files), "files"),
+    ]
+
+
+def log_benchmarks(log_dir):
+    benchmarks = []
+    for family in LOG_FAMILIES:
+        paths = []
+        for path in sorted(glob.glob(os.path.join(log_dir, f"{family}_*.log"))):
+            info = loganalysis.parse_log_name(path)
+            if info is not None:
+                paths.append((path, info["started"]))
+        if not paths:
+            continue
+        megabytes = sum(os.path.getsize(path) for path, started in paths) / (1024 * 1024)
+
+        def run(paths=paths, family=family):
+            for path, started in paths:
+                if family == "CoreCycler":
+                    events = loganalysis.read_corecycler_log(path, started, include_debug=True)
+                else:
+                    events = loganalysis.LOG_READERS[family](path, started)
+                for _ in events:
+                    pass
+
+        benchmarks.append((f"logs.parse[{family}]", run, megabytes, "MB"))
+    return benchmarks
+
+
+def summary_benchmarks(log_dir, work_dir):
+    logs = sorted(glob.glob(os.path.join(log_dir, "CoreCycler_*.log")))
+    if not logs:
+        return []
+    cache_dir = os.path.join(work_dir, loganalysis.SUMMARY_CACHE_DIR)
+
+    def summarize_archive():
+        for log in logs:
+            loganalysis.summarize_run(log)
+
+    def load_cached_archive():
+        for log in logs:
+            loganalysis.load_run_summary(log, cache_dir=cache_dir)
+
+    def merge_timelines():
+        for log in logs:
+            for _ in loganalysis.RunTimeline(log, include_debug=True).annotated_events():
+                pass
+
+    return [
+        ("summary.archive", summarize_archive, len(logs), "runs"),
+        ("summary.archive[cached]", load_cached_archive, len(logs), "runs"),
+        ("timeline.archive", merge_timelines, len(logs), "runs"),
+    ]
+
+
+def run_suite(benchmarks, repeat, only=None):
+    results = {}
+    for name, function, units, unit_name in benchmarks:
+        if only and only not in name:
+            continue
+        result = measure(function, repeat)
+        seconds = result["median_ms"] / 1000
+        result["units"] = units
+        result["unit"] = unit_name
+        result["per_second"] = units / seconds if seconds > 0 else None
+        results[name] = result
+        print(f"{name:<34} {result['median_ms']:>10.2f} ms   "
+              f"{result['per_second'] or 0:>12.1f} {unit_name}/s")
+    return results
+
+
+# ===========================================
+# GUI benchmarks
+# ===========================================
+# With --gui, CoreCyclerApp is started on the offscreen Qt platform in a copy of
+# the script folder and driven like a user would. For every step of a scenario
+# the synchronous handler time, the config writes it caused and the time the
+# event loop needs to get back to idle (the stall) are recorded.
+GUI_CORE_TEST_ORDER = "0, 8, 2, 10, 4, 12, 6, 14"
+
+
+def run_gui_benchmarks(script_root, work_dir, repeat, only=None):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5 import QtCore, QtWidgets
+    from PyQt5.QtTest import QTest
+
+    for name in ("config.ini", "topology.json"):
+        if os.path.exists(os.path.join(script_root, name)):
+            shutil.copy(os.path.join(script_root, name), os.path.join(work_dir, name))
+    if not os.path.exists(os.path.join(work_dir, presets.CONFIG_DIR)):
+        shutil.copytree(os.path.join(script_root, presets.CONFIG_DIR), os.path.join(work_dir, presets.CONFIG_DIR))
+
+    sys.path.insert(0, script_root)
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    import main as gui
+
+    def wait_for_idle():
+        """Return how long the event loop takes to process a zero timer posted now."""
+        fired = []
+        start = time.perf_counter()
+        QtCore.QTimer.singleShot(0, lambda: fired.append(time.perf_counter()))
+        while not fired:
+            application.processEvents(QtCore.QEventLoop.AllEvents, 50)
+        return (fired[0] - start) * 1000
+
+    class FirstFrame(QtCore.QObject):
+        def __init__(self):
+            super().__init__()
+            self.painted = None
+
+        def eventFilter(self, watched, event):
+            if event.type() == QtCore.QEvent.Paint and self.painted is None:
+                self.painted = time.perf_counter()
+            return False
+
+    def startup():
+        first_frame = FirstFrame()
+        start = time.perf_counter()
+        writes = sum(gui.config_writes.values())
+        with redirect_stdout(io.StringIO()):
+            window = gui.CoreCyclerApp()
+        window.installEventFilter(first_frame)
+        window.show()
+        deadline = time.perf_counter() + 10
+        while first_frame.painted is None and time.perf_counter() < deadline:
+            application.processEvents(QtCore.QEventLoop.AllEvents, 50)
+        painted = first_frame.painted or time.perf_counter()
+        return window, (painted - start) * 1000, sum(gui.config_writes.values()) - writes
+
+    def run_steps(steps):
+        """Run (description, action) steps and collect their latency, writes and stall."""
+        handler_ms, stall_ms, writes = [], [], []
+        for description, action in steps:
+            before = sum(gui.config_writes.values())
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                action()
+            handler_ms.append((time.perf_counter() - start) * 1000)
+            with redirect_stdout(io.StringIO()):
+                stall_ms.append(wait_for_idle())
+            writes.append(sum(gui.config_writes.values()) - before)
+        return {
+            "median_ms": statistics.median(handler_ms),
+            "max_ms": max(handler_ms),
+            "total_ms": sum(handler_ms),
+            "stall_max_ms": max(stall_ms),
+            "stall_median_ms": statistics.median(stall_ms),
+            "steps": len(steps),
+            "writes": sum(writes),
+            "max_writes_per_step": max(writes),
+        }
+
+    results = {}
+    try:
+        if not only or only in "gui.startup":
+            timings, startup_writes = [], []
+            for _ in range(max(repeat, 1)):
+                window, elapsed, writes = startup()
+                timings.append(elapsed)
+                startup_writes.append(writes)
+                window.close()
+                window.deleteLater()
+            results["gui.startup"] = {
+                "median_ms": statistics.median(timings), "min_ms": min(timings), "runs": len(timings),
+                "writes": max(startup_writes),
+            }
+
+        window, elapsed, writes = startup()
+        scenarios = {}
+
+        # Typing a custom coreTestOrder, one key at a time
+        with redirect_stdout(io.StringIO()):
+            window.comboBox_1.setCurrentIndex(4)
+            window.lineEdit_6.clear()
+        scenarios["gui.core_test_order_typing"] = [
+            (character, lambda character=character: QTest.keyClicks(window.lineEdit_6, character))
+            for character in GUI_CORE_TEST_ORDER
+        ]
+
+        # Dragging runtimePerCore up and back down
+        scenarios["gui.runtime_spinbox_drag"] = (
+            [("up", window.spinBox_9.stepUp) for _ in range(30)]
+            + [("down", window.spinBox_9.stepDown) for _ in range(30)]
+        )
+
+        # Switching through the stress test programs twice
+        buttons = [window.testButtonGroup.button(button_id) for button_id in (1, 2, 3, 4, 5)] * 2
+        scenarios["gui.test_program_switch"] = [
+            (button.text(), lambda button=button: QTest.mouseClick(button, QtCore.Qt.LeftButton))
+            for button in buttons
+        ]
+
+        # Toggling every yCruncher test on and off, with the matching version selected
+        checkboxes = [(window.radioButton_4, [getattr(window, f"checkBox_{index}") for index in range(29, 39)]),
+                      (window.radioButton_5, [getattr(window, f"checkBox_{index}") for index in range(39, 48)])]
+        steps = []
+        for radio_button, group in checkboxes:
+            steps.append((radio_button.text(), lambda radio_button=radio_button: radio_button.setChecked(True)))
+            for checkbox in group * 2:
+                steps.append((checkbox.text(), lambda checkbox=checkbox: QTest.mouseClick(checkbox, QtCore.Qt.LeftButton)))
+        scenarios["gui.ycruncher_tests_toggle"] = steps
+
+        for name, steps in scenarios.items():
+            if only and only not in name:
+                continue
+            results[name] = run_steps(steps)
+        window.close()
+    finally:
+        os.chdir(previous_dir)
+
+    for name, result in results.items():
+        stall = f"   stall max {result['stall_max_ms']:>7.2f} ms" if "stall_max_ms" in result else ""
+        print(f"{name:<34} {result['median_ms']:>10.2f} ms   {result['writes']:>5} writes{stall}")
+    return results
+
+
+# ===========================================
+# History
+# ===========================================
+def load_history(path):
+    try:
+        with open(path, "r", encoding="utf-8") as historyfile:
+            return json.load(historyfile)
+    except (OSError, ValueError):
+        return []
+
+
+def save_history(path, history):
+    with open(path, "w", encoding="utf-8") as historyfile:
+        json.dump(history, historyfile, indent=2)
+    print(f"Saved results to {path}")
+
+
+def format_comparison(previous, current):
+    """Compare the medians with a previous run, positive changes are slower."""
+    lines = [f"Compared to {previous['version']} ({previous['timestamp']}):"]
+    for name, result in current["results"].items():
+        before = previous["results"].get(name)
+        if before is None:
+            lines.append(f"  {name:<34} new")
+            continue
+        change = (result["median_ms"] - before["median_ms"]) / before["median_ms"] * 100 if before["median_ms"] else 0.0
+        lines.append(f"  {name:<34} {before['median_ms']:>10.2f} -> {result['median_ms']:>10.2f} ms  ({change:+.1f}%)")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark config I/O, log analysis and the GUI.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument("--only", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--logs", default="logs", help="Folder with the log archive")
+    parser.add_argument("--history", default=BENCHMARK_HISTORY_FILE, help="JSON file the results are appended to")
+    parser.add_argument("--no-save", action="store_true", help="Don't append the results to the history")
+    parser.add_argument("--gui", action="store_true", help="Also run the GUI benchmarks on the offscreen Qt platform")
+    return parser
+
+
+def main(args):
+    script_root = os.path.dirname(os.path.abspath(__file__))
+    log_dir = os.path.abspath(args.logs)
+    history_file = os.path.abspath(args.history)
+    history = load_history(history_file)
+
+    with tempfile.TemporaryDirectory(prefix="corecycler-benchmark-") as work_dir:
+        benchmarks = config_benchmarks(script_root, work_dir)
+        benchmarks += log_benchmarks(log_dir)
+        benchmarks += summary_benchmarks(log_dir, work_dir)
+        results = run_suite(benchmarks, args.repeat, args.only)
+        if args.gui:
+            results.update(run_gui_benchmarks(script_root, work_dir, args.repeat, args.only))
+
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "version": source_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if history:
+        print()
+        print(format_comparison(history[-1], entry))
+    if not args.no_save:
+        history.append(entry)
+        save_history(history_file, history)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(build_parser().parse_args()))
@@ -0,0 +1,312 @@
+# charts.py
+import re
+import sys
+import math
+import array
+import bisect
+import argparse
+from collections import namedtuple, OrderedDict
+
+import loganalysis
+import tickdata
+
+# ===========================================
+# Chart series
+# ===========================================
+# A series is a list of (x, y) points, x being the seconds since the run start.
+# Every reader returns a list of series, e.g. one per core.
+Series = namedtuple("Series", ["name", "xs", "ys"])
+
+LINPACK_GFLOPS_PATTERN = re.compile(r"^\s*\d+\s+\d+\s+\d+\s+([\d.]+)\s+([\d.]+)\s")
+
+
+def new_series(name):
+    return Series(name, array.array("d"), array.array("d"))
+
+
+def per_core_series(points, prefix="Core"):
+    """Turn {core: [(x, y), ...]} into one series per core, ordered by core."""
+    series = []
+    for core in sorted(points):
+        core_series = new_series(f"{prefix} {core}")
+        for x, y in points[core]:
+            core_series.xs.append(x)
+            core_series.ys.append(y)
+        series.append(core_series)
+    return series
+
+
+def cpu_usage_series(corecycler_log):
+    """The CPU time of the stress test per tick, one series per core."""
+    columns = tickdata.read_ticks(corecycler_log)
+    if not columns["timestamp"]:
+        return []
+    started = columns["timestamp"][0]
+    points = {}
+    for timestamp, core, usage in zip(columns["timestamp"], columns["core"], columns["cpu_usage_ms"]):
+        if usage != tickdata.MISSING:
+            points.setdefault(core, []).append((timestamp - started, usage))
+    return per_core_series(points)
+
+
+def fft_progress_series(corecycler_log):
+    """The number of FFT sizes already tested over time, one series per core."""
+    info = loganalysis.parse_log_name(corecycler_log)
+    points = {}
+    core = None
+    for event in loganalysis.read_corecycler_log(corecycler_log, info["started"], include_debug=True):
+        text = event.text.lstrip("+").strip()
+        match = loganalysis.CORE_SET_PATTERN.search(text)
+        if match:
+            core = int(match.group(1))
+            continue
+        match = loganalysis.FFT_SIZES_TESTED_PATTERN.search(text)
+        if match and core is not None:
+            points.setdefault(core, []).append(((event.timestamp - info["started"]).total_seconds(), int(match.group(1))))
+    return per_core_series(points)
+
+
+def co_value_series(corecycler_log):
+    """The Curve Optimizer values of the Automatic Test Mode, one series per core."""
+    info = loganalysis.parse_log_name(corecycler_log)
+    points = {}
+    values = []
+    x = 0.0
+    for event in loganalysis.read_corecycler_log(corecycler_log, info["started"], include_debug=True):
+        x = (event.timestamp - info["started"]).total_seconds()
+        updated = loganalysis.update_co_values(event.text.lstrip("+").strip(), values)
+        if updated is None:
+            continue
+        for core, value in enumerate(updated):
+            if core not in points:
+                points[core] = [(x, value)]
+            elif points[core][-1][1] != value:
+                # A step: the old value up to the adjustment, the new one from there
+                points[core].append((x, points[core][-1][1]))
+                points[core].append((x, value))
+        values = updated
+    # Carry the last values to the end of the log, so cores that were never adjusted still draw a line
+    for core_points in points.values():
+        if core_points[-1][0] < x:
+            core_points.append((x, core_points[-1][1]))
+    return per_core_series(points)
+
+
+def linpack_gflops_series(linpack_log):
+    """The GFlops of every Linpack trial."""
+    info = loganalysis.parse_log_name(linpack_log)
+    series = new_series("GFlops")
+    for event in loganalysis.read_linpack_log(linpack_log, info["started"]):
+        match = LINPACK_GFLOPS_PATTERN.match(event.text + " ")
+        if match:
+            series.xs.append((event.timestamp - info["started"]).total_seconds())
+            series.ys.append(float(match.group(2)))
+    return [series] if series.xs else []
+
+
+CHARTS = {
+    # family -> [(title, y axis label, reader)]
+    "CoreCycler": [
+        ("CPU usage per tick", "ms", cpu_usage_series),
+        ("FFT progress", "FFT sizes tested", fft_progress_series),
+        ("CO values", "CO value", co_value_series),
+    ],
+    "Linpack": [
+        ("Linpack GFlops per trial", "GFlops", linpack_gflops_series),
+    ],
+}
+
+
+# ===========================================
+# Downsampling
+# ===========================================
+def lttb(xs, ys, start, end, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling of the points start to end.
+
+    Keeps the first and last point and, from every bucket in between, the one
+    forming the largest triangle with the point kept before it and the average
+    of the next bucket, which preserves the peaks and dips of the line.
+
+    Returns:
+        tuple: (xs, ys) lists
+    """
+    count = end - start
+    if count <= threshold or threshold < 3:
+        return list(xs[start:end]), list(ys[start:end])
+
+    out_x = [xs[start]]
+    out_y = [ys[start]]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = start
+    for bucket in range(threshold - 2):
+        bucket_start = start + 1 + int(bucket * bucket_size)
+        bucket_end = start + 1 + int((bucket + 1) * bucket_size)
+        next_start = bucket_end
+        next_end = min(start + 1 + int((bucket + 2) * bucket_size), end)
+        if next_end <= next_start:
+            next_start, next_end = end - 1, end
+        next_count = next_end - next_start
+        average_x = sum(xs[next_start:next_end]) / next_count
+        average_y = sum(ys[next_start:next_end]) / next_count
+
+        previous_x = xs[previous]
+        previous_y = ys[previous]
+        largest = -1.0
+        chosen = bucket_start
+        for index in range(bucket_start, bucket_end):
+            area = abs((previous_x - average_x) * (ys[index] - previous_y)
+                       - (previous_x - xs[index]) * (average_y - previous_y))
+            if area > largest:
+                largest = area
+                chosen = index
+        out_x.append(xs[chosen])
+        out_y.append(ys[chosen])
+        previous = chosen
+    out_x.append(xs[end - 1])
+    out_y.append(ys[end - 1])
+    return out_x, out_y
+
+
+# ===========================================
+# DownsampleCache Class
+# ===========================================
+class DownsampleCache:
+    TILE_POINTS = 600
+    MAX_TILES = 512
+
+    def __init__(self, series):
+        """
+        Downsampled views of a set of series, cached per zoom level.
+
+        Zoom level n splits the x range into 2^n tiles, and every tile of every
+        series is downsampled to at most TILE_POINTS points once. A view only
+        needs the two or three tiles it overlaps, so drawing costs about the
+        same for a run of ten minutes and one of a day. Tiles that aren't
+        computed yet are stood in for by the nearest computed coarser tile and
+        queued, see refine().
+
+        Args:
+            series (list): The Series to draw
+        """
+        self.series = series
+        xs = [series_item.xs for series_item in series if series_item.xs]
+        self.x_min = min((values[0] for values in xs), default=0.0)
+        self.x_max = max((values[-1] for values in xs), default=1.0)
+        if self.x_max <= self.x_min:
+            # All points at the same time, e.g. the CO values of a run without Automatic Test Mode
+            self.x_min, self.x_max = self.x_min - 30.0, self.x_max + 30.0
+        ys = [series_item.ys for series_item in series if series_item.ys]
+        self.y_min = min((min(values) for values in ys), default=0.0)
+        self.y_max = max((max(values) for values in ys), default=1.0)
+        self.tiles = OrderedDict()
+        self.pending = OrderedDict()
+        self.max_level = 0
+        for series_item in series:
+            # Zooming in further than one tile per TILE_POINTS raw points shows the raw points anyway
+            if len(series_item.xs) > self.TILE_POINTS:
+                self.max_level = max(self.max_level, math.ceil(math.log2(len(series_item.xs) / self.TILE_POINTS)))
+
+    def level_for(self, x0, x1):
+        span = max(x1 - x0, 1e-9)
+        return min(self.max_level, max(0, int(math.floor(math.log2((self.x_max - self.x_min) / span)))))
+
+    def tile_range(self, level, tile):
+        width = (self.x_max - self.x_min) / 2 ** level
+        return self.x_min + tile * width, self.x_min + (tile + 1) * width
+
+    def compute_tile(self, series_index, level, tile):
+        series = self.series[series_index]
+        tile_x0, tile_x1 = self.tile_range(level, tile)
+        # One point beyond each end, so the tiles join up
+        start = max(bisect.bisect_left(series.xs, tile_x0) - 1, 0)
+        end = min(bisect.bisect_right(series.xs, tile_x1) + 1, len(series.xs))
+        points = lttb(series.xs, series.ys, start, end, self.TILE_POINTS)
+        self.tiles[(series_index, level, tile)] = points
+        if len(self.tiles) > self.MAX_TILES:
+            self.tiles.popitem(last=False)
+        return points
+
+    def tile(self, series_index, level, tile):
+        """A tile, or the nearest coarser one while it's being computed."""
+        key = (series_index, level, tile)
+        points = self.tiles.get(key)
+        if points is not None:
+            self.tiles.move_to_end(key)
+            return points, level
+        for coarser in range(level - 1, -1, -1):
+            points = self.tiles.get((series_index, coarser, tile >> (level - coarser)))
+            if points is not None:
+                self.pending[key] = True
+                return points, coarser
+        # Nothing to stand in, the whole x range is computed right away
+        return self.compute_tile(series_index, 0, 0), 0
+
+    def view(self, series_index, x0, x1):
+        """
+        The points of a series to draw for the x range x0 to x1.
+
+        Returns:
+            tuple: (xs, ys) lists, including the first point left and right of the range
+        """
+        level = self.level_for(x0, x1)
+        width = (self.x_max - self.x_min) / 2 ** level
+        first = max(int((x0 - self.x_min) // width), 0)
+        last = min(int((x1 - self.x_min) // width), 2 ** level - 1)
+        xs, ys = [], []
+        seen = set()
+        for tile in range(first, last + 1):
+            points, used_level = self.tile(series_index, level, tile)
+            key = (used_level, tile >> (level - used_level))
+            if key in seen:
+                continue  # A coarser tile standing in for several
+            seen.add(key)
+            tile_xs, tile_ys = points
+            if xs and tile_xs and tile_xs[0] <= xs[-1]:
+                # Drop the overlap with the previous tile
+                skip = bisect.bisect_right(tile_xs, xs[-1])
+                tile_xs, tile_ys = tile_xs[skip:], tile_ys[skip:]
+            xs.extend(tile_xs)
+            ys.extend(tile_ys)
+        return xs, ys
+
+    def refine(self, max_tiles=4):
+        """
+        Compute some of the tiles that were stood in for by coarser ones.
+
+        Returns:
+            bool: Whether tiles are still pending
+        """
+        for _ in range(min(max_tiles, len(self.pending))):
+            key, _ = self.pending.popitem(last=False)
+            if key not in self.tiles:
+                self.compute_tile(*key)
+        return bool(self.pending)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def build_parser():
+    parser = argparse.ArgumentParser(description="Show the chart series of a log and how they are downsampled.")
+    parser.add_argument("log", help="A CoreCycler or Linpack log")
+    parser.add_argument("--points", type=int, default=DownsampleCache.TILE_POINTS, help="Points per downsampled series")
+    return parser
+
+
+def main(args):
+    info = loganalysis.parse_log_name(args.log)
+    if info is None or info["family"] not in CHARTS:
+        print(f"No charts for {args.log}")
+        return 1
+    for title, unit, reader in CHARTS[info["family"]]:
+        print(title)
+        for series in reader(args.log):
+            xs, _ = lttb(series.xs, series.ys, 0, len(series.xs), args.points)
+            print(f"  {series.name:<10} {len(series.xs):>8} points, {len(xs):>5} after downsampling, "
+                  f"{min(series.ys):g} to {max(series.ys):g} {unit}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(build_parser().parse_args()))
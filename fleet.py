@@ -0,0 +1,265 @@
+# fleet.py
+import os
+import re
+import sys
+import json
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import loganalysis
+
+# ===========================================
+# Fleet report
+# ===========================================
+# Aggregates the runs of many machines, each with its own logs folder. The
+# runs are summarized in worker processes (using the cached summaries where
+# the log hasn't changed), and every worker only sends back a small record.
+# The records are folded into running totals as they arrive, with a bounded
+# number of runs in flight, so memory doesn't grow with the number of logs.
+DEFAULT_PRESET = "config.ini"
+UNC_HOST_PATTERN = re.compile(r"^\\\\([^\\]+)\\")
+USER_FOLDER_PATTERN = re.compile(r"^[A-Za-z]:\\Users\\([^\\]+)\\", re.IGNORECASE)
+
+
+def find_corecycler_logs(roots):
+    """
+    Yield the CoreCycler logs below the log roots, one at a time.
+
+    Args:
+        roots (list): Log folders, or CoreCycler folders containing a logs folder
+
+    Yields:
+        tuple: (root, path)
+    """
+    for root in roots:
+        for directory, subdirectories, files in os.walk(root):
+            subdirectories[:] = [name for name in subdirectories if name != loganalysis.SUMMARY_CACHE_DIR]
+            for name in sorted(files):
+                if name.startswith("CoreCycler_") and name.endswith(".log"):
+                    yield root, os.path.join(directory, name)
+
+
+def host_from_script_root(script_root):
+    """
+    Derive the machine a run was made on from the PSScriptRoot path in the log header.
+
+    The path doesn't contain the computer name, but the share name of a network
+    path and the user folder plus the installation folder tell the machines apart.
+
+    Args:
+        script_root (str): The PSScriptRoot, e.g. "C:\\Users\\name\\Desktop\\CoreCycler"
+
+    Returns:
+        str: The host name, or "" if there is no PSScriptRoot
+    """
+    script_root = script_root.strip().rstrip("\\")
+    if not script_root:
+        return ""
+    match = UNC_HOST_PATTERN.match(script_root)
+    if match:
+        return match.group(1)
+    folder = script_root.rsplit("\\", 1)[-1]
+    match = USER_FOLDER_PATTERN.match(script_root + "\\")
+    if match and match.group(1) != folder:
+        return f"{match.group(1)}/{folder}"
+    return folder
+
+
+def run_record(root, path, host_from):
+    """
+    Summarize one run into the record the fleet report is built from.
+
+    Runs in a worker process, so it only returns plain values.
+    """
+    try:
+        summary = loganalysis.load_run_summary(path)
+    except (OSError, ValueError) as e:
+        return {"path": path, "error": str(e)}
+
+    started = datetime.fromisoformat(summary["started"])
+    error_times = [
+        (datetime.fromisoformat(error["timestamp"]) - started).total_seconds()
+        for core in summary["cores"].values()
+        for error in core["errors"]
+    ]
+    if host_from == "log-root":
+        host = os.path.basename(os.path.normpath(root))
+    else:
+        host = host_from_script_root(summary["script_root"]) or os.path.basename(os.path.normpath(root))
+    # Without a custom config file the log names the script folder itself
+    config_file = summary.get("config_file", "").rsplit("\\", 1)[-1]
+
+    return {
+        "path": path,
+        "host": host,
+        "processor": summary["processor"] or "Unknown",
+        "program": summary["program"],
+        "preset": config_file or DEFAULT_PRESET,
+        "duration": summary["duration"],
+        "core_tests": sum(core["tests"] for core in summary["cores"].values()),
+        "failed_cores": sum(1 for core in summary["cores"].values() if core["errors"]),
+        "errors": len(error_times),
+        "time_to_first_error": min(error_times) if error_times else None,
+    }
+
+
+def new_totals():
+    return {
+        "runs": 0,
+        "failed_runs": 0,
+        "core_tests": 0,
+        "failed_cores": 0,
+        "hours": 0.0,
+        "first_error_sum": 0.0,
+        "first_error_min": None,
+    }
+
+
+def add_to_totals(totals, record):
+    totals["runs"] += 1
+    totals["core_tests"] += record["core_tests"]
+    totals["failed_cores"] += record["failed_cores"]
+    totals["hours"] += record["duration"] / 3600
+    first_error = record["time_to_first_error"]
+    if first_error is not None:
+        totals["failed_runs"] += 1
+        totals["first_error_sum"] += first_error
+        if totals["first_error_min"] is None or first_error < totals["first_error_min"]:
+            totals["first_error_min"] = first_error
+
+
+class FleetReport:
+    def __init__(self):
+        """Running totals over the runs of all machines."""
+        self.runs = 0
+        self.unreadable = []
+        self.hosts = {}
+        self.by_model = {}
+        self.by_preset = {}
+
+    def add(self, record):
+        if "error" in record:
+            self.unreadable.append(record["path"])
+            return
+        self.runs += 1
+        add_to_totals(self.hosts.setdefault(record["host"], new_totals()), record)
+        add_to_totals(self.by_model.setdefault(f"{record['processor']} | {record['program']}", new_totals()), record)
+        add_to_totals(self.by_preset.setdefault(record["preset"], new_totals()), record)
+
+    def collect(self, roots, workers=None, host_from="script-root"):
+        """
+        Summarize all runs below the log roots in parallel.
+
+        Args:
+            roots (list): The log roots
+            workers (int): Number of worker processes, defaults to the number of CPUs
+            host_from (str): "script-root" to take the host from the PSScriptRoot,
+                "log-root" to use the name of the log root folder
+        """
+        workers = workers or os.cpu_count() or 1
+        max_pending = workers * 4
+        logs = find_corecycler_logs(roots)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for root, path in logs:
+                pending.add(executor.submit(run_record, root, path, host_from))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.add(future.result())
+            for future in pending:
+                self.add(future.result())
+        return self
+
+    def rows(self, groups):
+        """Per group statistics, the groups with the highest failure rate first."""
+        rows = []
+        for name, totals in groups.items():
+            rows.append({
+                "name": name,
+                "runs": totals["runs"],
+                "failed_runs": totals["failed_runs"],
+                "failure_rate": totals["failed_runs"] / totals["runs"],
+                "core_tests": totals["core_tests"],
+                "core_failure_rate": totals["failed_cores"] / totals["core_tests"] if totals["core_tests"] else 0.0,
+                "hours": totals["hours"],
+                "failures_per_hour": totals["failed_runs"] / totals["hours"] if totals["hours"] else 0.0,
+                "mean_time_to_first_error": (totals["first_error_sum"] / totals["failed_runs"]
+                                             if totals["failed_runs"] else None),
+                "min_time_to_first_error": totals["first_error_min"],
+            })
+        return sorted(rows, key=lambda row: (-row["failure_rate"], row["name"]))
+
+    def preset_rows(self):
+        """The presets that catch errors earliest first, those that never caught one last."""
+        return sorted(self.rows(self.by_preset), key=lambda row: (
+            row["mean_time_to_first_error"] is None,
+            row["mean_time_to_first_error"] or 0.0,
+            row["name"],
+        ))
+
+    def as_dict(self):
+        return {
+            "runs": self.runs,
+            "unreadable": self.unreadable,
+            "hosts": self.rows(self.hosts),
+            "models": self.rows(self.by_model),
+            "presets": self.preset_rows(),
+        }
+
+
+def format_minutes(seconds):
+    return "-" if seconds is None else f"{seconds / 60:.1f}"
+
+
+def format_rows(title, rows):
+    lines = [title, f"{'':<56} {'Runs':>5} {'Failed':>6} {'Rate':>6} {'Core tests':>10} {'Hours':>7} "
+                    f"{'First error (min) mean/min':>26}"]
+    for row in rows:
+        first_error = f"{format_minutes(row['mean_time_to_first_error'])}/{format_minutes(row['min_time_to_first_error'])}"
+        lines.append(f"{row['name'][:56]:<56} {row['runs']:>5} {row['failed_runs']:>6} {row['failure_rate']:>6.0%} "
+                     f"{row['core_tests']:>10} {row['hours']:>7.1f} {first_error:>26}")
+    return "\n".join(lines)
+
+
+def format_report(report):
+    sections = [
+        f"{report.runs} runs on {len(report.hosts)} machines",
+        format_rows("Failure rate per machine", report.rows(report.hosts)),
+        format_rows("Failure rate per CPU model and test program", report.rows(report.by_model)),
+        format_rows("Presets by time to the first error", report.preset_rows()),
+    ]
+    if report.unreadable:
+        sections.append("Could not read:\n" + "\n".join(f" - {path}" for path in report.unreadable))
+    return "\n\n".join(sections)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def build_parser():
+    parser = argparse.ArgumentParser(description="Aggregate the CoreCycler runs of many machines.")
+    parser.add_argument("roots", nargs="+", help="Log folders, one or more per machine")
+    parser.add_argument("--workers", type=int, help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument("--host-from", choices=["script-root", "log-root"], default="script-root",
+                        help="Take the machine from the PSScriptRoot in the log, or from the log folder name")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser
+
+
+def main(args):
+    missing = [root for root in args.roots if not os.path.isdir(root)]
+    if missing:
+        print(f"Log folder not found: {', '.join(missing)}")
+        return 1
+    report = FleetReport().collect(args.roots, args.workers, args.host_from)
+    if args.json:
+        print(json.dumps(report.as_dict(), indent=2))
+    else:
+        print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(build_parser().parse_args()))
@@ -0,0 +1,1162 @@
+# loganalysis.py
+import os
+import re
+import sys
+import glob
+import json
+import mmap
+import array
+import heapq
+import bisect
+import argparse
+from datetime import datetime, timedelta
+from collections import namedtuple, OrderedDict
+
+# ===========================================
+# Log file names
+# ===========================================
+# Every log written by a run carries the run start in its file name, e.g.
+#   CoreCycler_2025-03-26_13-08-18_PRIME95_SSE.log
+#   Prime95_2025-03-26_13-08-18_SSE_ALL_FFT_4K-32768K.log
+#   yCruncher_2025-03-07_14-21-41_mode_19-ZN2 ~ KAGARI.log
+#   Linpack_2025-03-23_22-00-03_Version_2018_MEDIUM.log
+LOG_NAME_PATTERN = re.compile(
+    r"^(CoreCycler|Prime95|yCruncher|Linpack|Aida64)_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})_?(.*)\.log$"
+)
+
+LogEvent = namedtuple("LogEvent", ["timestamp", "source", "line_number", "text"])
+
+
+def parse_log_name(path):
+    """
+    Split a log file name into its family, run start and trailing description.
+
+    Args:
+        path (str): Path or file name of the log
+
+    Returns:
+        dict: {"family", "started", "suffix"}, or None if the name doesn't match
+    """
+    match = LOG_NAME_PATTERN.match(os.path.basename(path))
+    if not match:
+        return None
+    family, date_part, time_part, suffix = match.groups()
+    started = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H-%M-%S")
+    return {"family": family, "started": started, "suffix": suffix}
+
+
+def open_log(path):
+    """Open a log file for reading, tolerating the odd non-UTF-8 byte."""
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+# ===========================================
+# Per-format log readers
+# ===========================================
+# Each reader is a generator yielding LogEvent tuples in chronological order.
+# Lines without their own timestamp inherit the last one seen, so every event
+# can be placed on the timeline without buffering the file.
+CORECYCLER_TIME_PATTERN = re.compile(r"^(?:[\s+]*|ERROR: )(\d{2}):(\d{2}):(\d{2})(?: - |$)")
+PRIME95_TIME_PATTERN = re.compile(r"^\[(\w{3} \w{3}\s+\d{1,2} \d{2}:\d{2}:\d{2} \d{4})\]$")
+YCRUNCHER_START_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})$")
+YCRUNCHER_ELAPSED_PATTERN = re.compile(r"Total Elapsed Time:\s+([\d.]+) seconds")
+LINPACK_DATE_PATTERN = re.compile(r"^Current date/time:\s+(.+)$")
+LINPACK_TRIAL_PATTERN = re.compile(r"^\s*\d+\s+\d+\s+\d+\s+([\d.]+)\s+[\d.]+")
+
+
+def read_corecycler_log(path, run_start, include_debug=False):
+    """
+    Read a CoreCycler log, where timestamps look like "13:08:23 - ".
+
+    The date comes from the run start; a time earlier than the previous one
+    means the run crossed midnight.
+
+    Args:
+        path (str): Path to the CoreCycler_*.log file
+        run_start (datetime): Run start taken from the file name
+        include_debug (bool): Also yield the "+++" debug lines
+    """
+    current = run_start
+    with open_log(path) as log:
+        for line_number, line in enumerate(log, 1):
+            text = line.rstrip("\r\n")
+            match = CORECYCLER_TIME_PATTERN.match(text)
+            if match:
+                hours, minutes, seconds = (int(value) for value in match.groups())
+                stamp = current.replace(hour=hours, minute=minutes, second=seconds, microsecond=0)
+                while stamp < current - timedelta(hours=1):
+                    stamp += timedelta(days=1)
+                current = max(current, stamp)
+            if not text.strip():
+                continue
+            if not include_debug and text.lstrip().startswith("+++"):
+                continue
+            yield LogEvent(current, "CoreCycler", line_number, text.strip())
+
+
+def read_prime95_log(path, run_start):
+    """
+    Read a Prime95 results log, where timestamps look like "[Wed Mar 26 13:08:48 2025]".
+
+    Args:
+        path (str): Path to the Prime95_*.log file
+        run_start (datetime): Used for lines before the first timestamp
+    """
+    current = run_start
+    with open_log(path) as log:
+        for line_number, line in enumerate(log, 1):
+            text = line.strip()
+            if not text:
+                continue
+            match = PRIME95_TIME_PATTERN.match(text)
+            if match:
+                stamp = datetime.strptime(" ".join(match.group(1).split()), "%a %b %d %H:%M:%S %Y")
+                current = max(current, stamp)
+                continue
+            yield LogEvent(current, "Prime95", line_number, text)
+
+
+def read_ycruncher_log(path, run_start):
+    """
+    Read a y-cruncher log, which starts with "2025-03-07 14:21:45" and then
+    only reports the total elapsed time.
+
+    Args:
+        path (str): Path to the yCruncher_*.log file
+        run_start (datetime): Used until the start line has been seen
+    """
+    started = run_start
+    current = run_start
+    with open_log(path) as log:
+        for line_number, line in enumerate(log, 1):
+            text = line.strip()
+            if not text:
+                continue
+            match = YCRUNCHER_START_PATTERN.match(text)
+            if match:
+                started = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
+                current = max(current, started)
+                continue
+            match = YCRUNCHER_ELAPSED_PATTERN.search(text)
+            if match:
+                current = max(current, started + timedelta(seconds=float(match.group(1))))
+            yield LogEvent(current, "yCruncher", line_number, text)
+
+
+def read_linpack_log(path, run_start):
+    """
+    Read a Linpack log, which has one "Current date/time:" line and then
+    per-trial durations in its timing table.
+
+    Args:
+        path (str): Path to the Linpack_*.log file
+        run_start (datetime): Used until the date line has been seen
+    """
+    current = run_start
+    with open_log(path) as log:
+        for line_number, line in enumerate(log, 1):
+            text = line.strip()
+            if not text:
+                continue
+            match = LINPACK_DATE_PATTERN.match(text)
+            if match:
+                try:
+                    stamp = datetime.strptime(" ".join(match.group(1).split()), "%a %b %d %H:%M:%S %Y")
+                    current = max(current, stamp)
+                except ValueError:
+                    pass
+            else:
+                match = LINPACK_TRIAL_PATTERN.match(text)
+                if match:
+                    current += timedelta(seconds=float(match.group(1)))
+            yield LogEvent(current, "Linpack", line_number, text)
+
+
+LOG_READERS = {
+    "Prime95": read_prime95_log,
+    "yCruncher": read_ycruncher_log,
+    "Linpack": read_linpack_log,
+}
+
+# ===========================================
+# LogTail Class
+# ===========================================
+class LogTail:
+    def __init__(self, path):
+        """
+        Incrementally read the lines appended to a growing log file.
+
+        Only the bytes added since the last call are read, so polling a long
+        running log stays cheap no matter how large it gets.
+
+        Args:
+            path (str): Path to the log file
+        """
+        self.path = path
+        self.position = 0
+        self.partial = b""
+
+    def read_lines(self):
+        """Return the complete lines appended since the last call."""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return []
+        if size < self.position:
+            # The file was truncated or replaced, start over
+            self.position = 0
+            self.partial = b""
+        if size == self.position:
+            return []
+        with open(self.path, "rb") as log:
+            log.seek(self.position)
+            data = log.read()
+            self.position = log.tell()
+        chunks = (self.partial + data).split(b"\n")
+        self.partial = chunks.pop()
+        return [chunk.decode("utf-8", errors="replace").rstrip("\r") for chunk in chunks]
+
+
+def find_newest_log(log_dir, family="CoreCycler", since=None):
+    """
+    Find the most recently started log of a family.
+
+    Args:
+        log_dir (str): The logs directory
+        family (str): "CoreCycler", "Prime95", "yCruncher" or "Linpack"
+        since (datetime): Ignore logs of runs started before this time
+
+    Returns:
+        str: Path to the log, or None if there is none
+    """
+    newest = None
+    newest_start = None
+    for path in glob.glob(os.path.join(glob.escape(log_dir), f"{family}_*.log")):
+        info = parse_log_name(path)
+        if info is None or (since is not None and info["started"] < since):
+            continue
+        if newest_start is None or info["started"] > newest_start:
+            newest = path
+            newest_start = info["started"]
+    return newest
+
+
+# ===========================================
+# MappedLog Class
+# ===========================================
+# Random access to the lines of a log of any size, for the log viewer. The file
+# is memory-mapped, and the offset of only every LINE_BLOCK_SIZE-th line is
+# kept; the lines in between are found again when their block is displayed.
+# Lines are indexed on demand, as far as they are needed.
+LINE_BLOCK_SIZE = 64
+MAPPED_ERROR_PATTERN = re.compile(rb"^(?:ERROR: \d{2}:\d{2}:\d{2}|ERROR MESSAGE: |FATAL ERROR: )", re.MULTILINE)
+MAPPED_CORE_PATTERN = re.compile(rb"Set to Core (\d+) \(CPU ")
+
+
+class MappedLog:
+    BLOCK_CACHE_SIZE = 16
+
+    def __init__(self, path):
+        """
+        Memory-map a log file.
+
+        The mapping covers the file as it was when it was opened, reopen it to see
+        what was appended since.
+
+        Args:
+            path (str): Path to the log file
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        # An empty file can't be mapped
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.block_offsets = array.array("q", [0] if self.size else [])
+        self.line_count = 0  # Lines indexed so far
+        self.indexed_to = 0  # Where the next unindexed line starts
+        self.block_cache = OrderedDict()
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+    @property
+    def complete(self):
+        return self.indexed_to >= self.size
+
+    def index_lines(self, max_lines):
+        """
+        Index up to max_lines more lines.
+
+        Returns:
+            int: The number of lines indexed
+        """
+        data = self.data
+        position = self.indexed_to
+        added = 0
+        while added < max_lines and position < self.size:
+            end = data.find(b"\n", position)
+            position = self.size if end < 0 else end + 1
+            added += 1
+            if (self.line_count + added) % LINE_BLOCK_SIZE == 0 and position < self.size:
+                self.block_offsets.append(position)
+        self.line_count += added
+        self.indexed_to = position
+        return added
+
+    def index_to_offset(self, offset):
+        """Index the lines up to the one containing the byte offset."""
+        while self.indexed_to <= offset and not self.complete:
+            self.index_lines(LINE_BLOCK_SIZE * 16)
+
+    def line_starts(self, block):
+        """The offsets of the lines of a block, from the cache of recently used blocks."""
+        starts = self.block_cache.get(block)
+        if starts is not None:
+            self.block_cache.move_to_end(block)
+            return starts
+        position = self.block_offsets[block]
+        limit = min(LINE_BLOCK_SIZE, self.line_count - block * LINE_BLOCK_SIZE)
+        starts = []
+        for _ in range(limit):
+            starts.append(position)
+            end = self.data.find(b"\n", position)
+            position = self.size if end < 0 else end + 1
+        self.block_cache[block] = starts
+        if len(self.block_cache) > self.BLOCK_CACHE_SIZE:
+            self.block_cache.popitem(last=False)
+        return starts
+
+    def line_start(self, row):
+        return self.line_starts(row // LINE_BLOCK_SIZE)[row % LINE_BLOCK_SIZE]
+
+    def line_bytes(self, row):
+        """The bytes of an indexed line (0-based), without the line break."""
+        start = self.line_start(row)
+        end = self.data.find(b"\n", start)
+        if end < 0:
+            end = self.size
+        return self.data[start:end].rstrip(b"\r")
+
+    def line(self, row):
+        return self.line_bytes(row).decode("utf-8", errors="replace")
+
+    def row_at_offset(self, offset):
+        """The row of the line containing a byte offset, indexing as far as needed."""
+        self.index_to_offset(offset)
+        block = bisect.bisect_right(self.block_offsets, offset) - 1
+        starts = self.line_starts(block)
+        return block * LINE_BLOCK_SIZE + bisect.bisect_right(starts, offset) - 1
+
+    def find(self, pattern, row, backwards=False):
+        """
+        Find the next line matching a bytes pattern, wrapping around at the end.
+
+        Args:
+            pattern (re.Pattern): A bytes pattern, compiled with re.MULTILINE to match at line starts
+            row (int): Search after (or before) this row
+            backwards (bool): Search towards the beginning
+
+        Returns:
+            int: The row of the match, or None
+        """
+        if not self.size:
+            return None
+        row = min(max(row, 0), max(self.line_count - 1, 0))
+        if backwards:
+            current = self.line_start(row) if self.line_count else 0
+            matches = [match.start() for match in pattern.finditer(self.data, 0, current)]
+            if not matches:
+                matches = [match.start() for match in pattern.finditer(self.data, current)]
+            return self.row_at_offset(matches[-1]) if matches else None
+        if self.line_count:
+            end = self.data.find(b"\n", self.line_start(row))
+            start = self.size if end < 0 else end + 1
+        else:
+            start = 0
+        match = pattern.search(self.data, start) or pattern.search(self.data, 0, start)
+        return self.row_at_offset(match.start()) if match else None
+
+    def iter_lines(self):
+        """Yield (row, bytes) for all lines, indexing the whole file."""
+        while not self.complete:
+            self.index_lines(LINE_BLOCK_SIZE * 1024)
+        data = self.data
+        position = 0
+        row = 0
+        while position < self.size:
+            end = data.find(b"\n", position)
+            if end < 0:
+                end = self.size
+            yield row, data[position:end].rstrip(b"\r")
+            position = end + 1
+            row += 1
+
+    def cores(self):
+        """The cores the log switched to, in the order of their first test."""
+        return list(dict.fromkeys(int(match.group(1)) for match in MAPPED_CORE_PATTERN.finditer(self.data)))
+
+
+# ===========================================
+# RunTimeline Class
+# ===========================================
+COMPANION_LOG_PATTERN = re.compile(r"^ - (CoreCycler|Prime95|y-cruncher|Linpack|Aida64):\s+(.+\.log)\s*$")
+CORE_SET_PATTERN = re.compile(r"Set to Core (\d+) \(CPU ([\d ,and]+)\)")
+ITERATION_PATTERN = re.compile(r"\d{2}:\d{2}:\d{2} - Iteration (\d+)")
+ERROR_PATTERNS = {
+    "CoreCycler": re.compile(r"^ERROR( MESSAGE)?:|^FATAL ERROR"),
+    "Prime95": re.compile(r"FATAL ERROR|Hardware failure|ERROR"),
+    # y-cruncher's own messages only, its settings table has lines like "Stop on Error: Disabled"
+    "yCruncher": re.compile(r"^\s*(?:Exception Encountered:|Failed\s|Errors encountered\b)|error\(s\)", re.IGNORECASE),
+    "Linpack": re.compile(r"FAILED|failed|ERROR"),
+}
+
+
+class RunTimeline:
+    def __init__(self, corecycler_log, include_debug=False):
+        """
+        Build a chronological view over all logs written by one CoreCycler run.
+
+        Args:
+            corecycler_log (str): Path to the CoreCycler_*.log file of the run
+            include_debug (bool): Keep the "+++" debug lines of the CoreCycler log
+        """
+        info = parse_log_name(corecycler_log)
+        if info is None or info["family"] != "CoreCycler":
+            raise ValueError(f"Not a CoreCycler log file: {corecycler_log}")
+        self.corecycler_log = corecycler_log
+        self.run_start = info["started"]
+        self.include_debug = include_debug
+        self.sources = self.find_companion_logs()
+
+    def find_companion_logs(self):
+        """
+        Find the stress test logs belonging to this run.
+
+        The CoreCycler log lists them near its top; the logged directory is the one
+        on the test machine, so they are looked up next to the CoreCycler log instead.
+        Falls back to matching the run timestamp in the file name.
+        """
+        log_dir = os.path.dirname(os.path.abspath(self.corecycler_log))
+        sources = {}
+        with open_log(self.corecycler_log) as log:
+            for line in log:
+                match = COMPANION_LOG_PATTERN.match(line.rstrip("\r\n"))
+                if match:
+                    candidate = os.path.join(log_dir, match.group(2).strip())
+                    family = (parse_log_name(candidate) or {}).get("family")
+                    if family in LOG_READERS and os.path.exists(candidate):
+                        sources[family] = candidate
+                elif sources:
+                    break  # The list is a single block, stop reading after it
+
+        if not sources:
+            stamp = self.run_start.strftime("%Y-%m-%d_%H-%M-%S")
+            for family in LOG_READERS:
+                for candidate in sorted(glob.glob(os.path.join(glob.escape(log_dir), f"{family}_{stamp}*.log"))):
+                    sources[family] = candidate
+        return sources
+
+    def streams(self):
+        """Return one event generator per source, the CoreCycler log first."""
+        streams = [read_corecycler_log(self.corecycler_log, self.run_start, self.include_debug)]
+        for family, path in self.sources.items():
+            streams.append(LOG_READERS[family](path, self.run_start))
+        return streams
+
+    def events(self):
+        """
+        Merge all sources into one chronologically ordered event stream.
+
+        heapq.merge only holds the next pending event of each source, so memory is
+        bounded by the number of sources, not by the size of the logs. Events with
+        the same timestamp keep the source order (CoreCycler first).
+        """
+        return heapq.merge(*self.streams(), key=lambda event: event.timestamp)
+
+    def annotated_events(self):
+        """
+        Yield (event, state) pairs where state is what CoreCycler was doing at that moment.
+
+        The state dict holds "iteration", "core" and "cpu" as last announced by the
+        CoreCycler log, and is updated in place as the stream advances.
+        """
+        state = {"iteration": None, "core": None, "cpu": None}
+        for event in self.events():
+            if event.source == "CoreCycler":
+                match = CORE_SET_PATTERN.search(event.text)
+                if match:
+                    state["core"] = int(match.group(1))
+                    state["cpu"] = match.group(2).strip()
+                else:
+                    match = ITERATION_PATTERN.match(event.text)
+                    if match:
+                        state["iteration"] = int(match.group(1))
+            yield event, state
+
+    def failures(self):
+        """
+        Yield every error line of the run together with the core under test at that time.
+
+        Returns:
+            generator: (LogEvent, {"iteration", "core", "cpu"}) tuples
+        """
+        for event, state in self.annotated_events():
+            pattern = ERROR_PATTERNS.get(event.source)
+            if pattern and pattern.search(event.text):
+                yield event, dict(state)
+
+    def activity_at(self, when, window=timedelta(seconds=30)):
+        """
+        Describe what the run was doing around a point in time.
+
+        Args:
+            when (datetime): The moment of interest, e.g. a Prime95 error
+            window (timedelta): How far before and after "when" to collect events
+
+        Returns:
+            dict: {"state": state at "when", "events": events inside the window}
+        """
+        snapshot = None
+        nearby = []
+        for event, state in self.annotated_events():
+            if event.timestamp > when + window:
+                break
+            if event.timestamp <= when:
+                snapshot = dict(state)
+            if event.timestamp >= when - window:
+                nearby.append(event)
+        return {"state": snapshot, "events": nearby}
+
+
+def format_event(event, state=None):
+    """Render an event as a single timeline line."""
+    prefix = f"{event.timestamp:%Y-%m-%d %H:%M:%S} [{event.source:<10}] "
+    if state is not None and state.get("core") is not None:
+        prefix += f"(Core {state['core']}, Iteration {state['iteration']}) "
+    return prefix + event.text
+
+
+# ===========================================
+# Run summaries
+# ===========================================
+# A summary is a plain, JSON-serializable dict holding everything needed to
+# compare runs. Summaries are cached next to the logs and only rebuilt when
+# the CoreCycler log changes, so comparing long runs doesn't re-parse them.
+SUMMARY_CACHE_DIR = ".summaries"
+SUMMARY_VERSION = 3
+
+PARSED_SETTING_PATTERN = re.compile(r"^\+\+\+ \[(\w+)\] (\w+) = (.*)$")
+PROCESSOR_PATTERN = re.compile(r"^Detected processor: \.+ (.+)$")
+SCRIPT_ROOT_PATTERN = re.compile(r"^\+\+\+ PSScriptRoot: (.+)$")
+CUSTOM_CONFIG_PATTERN = re.compile(r"^\+\+\+ Custom config file: (.+)$")
+ITERATIONS_PATTERN = re.compile(r"^Iterations:\s+(\d+) started / (\d+) completed")
+CO_VALUES_PATTERN = re.compile(r"^CO values\s+(.+)$")
+CO_STARTING_PATTERN = re.compile(r"^Starting Curve Optimizer values:[\s.]*(-?\d+(?:,\s*-?\d+)*)\s*$")
+CO_MODIFIED_PATTERN = re.compile(r"Modifying the Curve Optimizer value for core (\d+) from (-?\d+) to (-?\d+)")
+CPU_USAGE_PATTERN = re.compile(r"Checking CPU usage: (\d+)ms \(expected: (\d+)ms, lower limit: (\d+)ms\)")
+PASSED_FFT_PATTERNS = {
+    "CoreCycler": re.compile(r"The last passed FFT size: (\d+)K"),
+    "Prime95": re.compile(r"Self-test (\d+)K passed"),
+}
+
+
+def update_co_values(text, values):
+    """
+    Apply a CoreCycler log line to the current Curve Optimizer values.
+
+    The run logs its starting values and then, with the Automatic Test Mode,
+    every adjustment of a core. The "CO values" line at the end only appears
+    when nothing was adjusted.
+
+    Args:
+        text (str): The log line without the "+" prefix
+        values (list): The current values, one per core
+
+    Returns:
+        list: The new values, or None if the line doesn't change them
+    """
+    match = CO_STARTING_PATTERN.match(text)
+    if match:
+        return [int(value) for value in match.group(1).split(",")]
+    match = CO_MODIFIED_PATTERN.search(text)
+    if match:
+        core = int(match.group(1))
+        if core >= len(values):
+            return None  # No starting values seen
+        updated = list(values)
+        updated[core] = int(match.group(3))
+        return updated
+    match = CO_VALUES_PATTERN.match(text)
+    if match:
+        return [int(value) for value in match.group(1).split("|") if value.strip()]
+    return None
+
+
+def new_core_summary():
+    return {
+        "tests": 0,
+        "runtime": 0.0,
+        "errors": [],
+        "fft_passed": [],
+        "cpu_samples": 0,
+        "cpu_usage_min": None,
+        "cpu_usage_dips": 0,
+    }
+
+
+def summarize_run(corecycler_log):
+    """
+    Parse one run (the CoreCycler log plus its stress test logs) into a summary.
+
+    Args:
+        corecycler_log (str): Path to the CoreCycler_*.log file
+
+    Returns:
+        dict: The run summary
+    """
+    timeline = RunTimeline(corecycler_log, include_debug=True)
+    info = parse_log_name(corecycler_log)
+    summary = {
+        "version": SUMMARY_VERSION,
+        "name": os.path.splitext(os.path.basename(corecycler_log))[0],
+        "program": info["suffix"].split("_", 1)[0],
+        "mode": info["suffix"].split("_", 1)[1] if "_" in info["suffix"] else "",
+        "started": info["started"].isoformat(),
+        "duration": 0.0,
+        "processor": "",
+        "script_root": "",
+        "config_file": "",
+        "config": {},
+        "iterations_started": 0,
+        "iterations_completed": 0,
+        "co_values": [],
+        "cores": {},
+    }
+    cores = {}
+    core_started = {}
+    fft_sets = {}
+    last_core = None
+    last_switch = None
+    last_timestamp = timeline.run_start
+
+    for event, state in timeline.annotated_events():
+        last_timestamp = event.timestamp
+        text = event.text
+        core = state["core"]
+
+        if event.source == "CoreCycler" and CORE_SET_PATTERN.search(text):
+            if last_core is not None:
+                cores[last_core]["runtime"] += (event.timestamp - last_switch).total_seconds()
+            cores.setdefault(core, new_core_summary())["tests"] += 1
+            core_started[core] = event.timestamp
+            last_core = core
+            last_switch = event.timestamp
+            continue
+
+        if event.source == "CoreCycler":
+            match = PARSED_SETTING_PATTERN.match(text)
+            if match and match.group(1) != "No":
+                summary["config"][f"{match.group(1)}.{match.group(2)}"] = match.group(3).strip()
+                continue
+            match = PROCESSOR_PATTERN.match(text)
+            if match:
+                summary["processor"] = match.group(1).strip()
+                continue
+            match = SCRIPT_ROOT_PATTERN.match(text)
+            if match:
+                summary["script_root"] = match.group(1).strip()
+                continue
+            match = CUSTOM_CONFIG_PATTERN.match(text)
+            if match:
+                summary["config_file"] = match.group(1).strip()
+                continue
+            match = ITERATIONS_PATTERN.match(text)
+            if match:
+                summary["iterations_started"] = int(match.group(1))
+                summary["iterations_completed"] = int(match.group(2))
+                continue
+            match = CO_VALUES_PATTERN.match(text)
+            if match:
+                summary["co_values"] = [int(value) for value in match.group(1).split("|") if value.strip()]
+                continue
+            match = CPU_USAGE_PATTERN.search(text)
+            if match and core is not None:
+                usage, expected, lower_limit = (int(value) for value in match.groups())
+                core_summary = cores[core]
+                core_summary["cpu_samples"] += 1
+                if core_summary["cpu_usage_min"] is None or usage < core_summary["cpu_usage_min"]:
+                    core_summary["cpu_usage_min"] = usage
+                if usage < lower_limit:
+                    core_summary["cpu_usage_dips"] += 1
+                continue
+
+        pattern = PASSED_FFT_PATTERNS.get(event.source)
+        if pattern and core is not None:
+            match = pattern.search(text)
+            if match:
+                fft_sets.setdefault(core, set()).add(int(match.group(1)))
+                continue
+
+        pattern = ERROR_PATTERNS.get(event.source)
+        if pattern and core is not None and pattern.search(text):
+            errors = cores[core]["errors"]
+            if errors and errors[-1]["iteration"] == state["iteration"]:
+                errors[-1]["messages"].append(text)
+            else:
+                errors.append({
+                    "iteration": state["iteration"],
+                    "time_to_error": (event.timestamp - core_started[core]).total_seconds(),
+                    "timestamp": event.timestamp.isoformat(),
+                    "messages": [text],
+                })
+
+    if last_core is not None:
+        cores[last_core]["runtime"] += (last_timestamp - last_switch).total_seconds()
+    for core, sizes in fft_sets.items():
+        cores[core]["fft_passed"] = sorted(sizes)
+
+    summary["duration"] = (last_timestamp - timeline.run_start).total_seconds()
+    summary["cores"] = {str(core): core_summary for core, core_summary in sorted(cores.items())}
+    return summary
+
+
+def load_run_summary(corecycler_log, cache_dir=None):
+    """
+    Return the summary of a run, using the cached copy if the log hasn't changed.
+
+    Args:
+        corecycler_log (str): Path to the CoreCycler_*.log file
+        cache_dir (str): Where summaries are cached, defaults to ".summaries" next to the log
+
+    Returns:
+        dict: The run summary
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(corecycler_log)), SUMMARY_CACHE_DIR)
+    stat = os.stat(corecycler_log)
+    cache_file = os.path.join(cache_dir, os.path.basename(corecycler_log) + ".json")
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as cached:
+            summary = json.load(cached)
+        if (summary.get("version") == SUMMARY_VERSION
+                and summary.get("source_mtime") == stat.st_mtime
+                and summary.get("source_size") == stat.st_size):
+            return summary
+    except (OSError, ValueError):
+        pass
+
+    summary = summarize_run(corecycler_log)
+    summary["source_mtime"] = stat.st_mtime
+    summary["source_size"] = stat.st_size
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as cached:
+            json.dump(summary, cached)
+    except OSError as e:
+        print(f"Error writing summary cache {cache_file}: {e}")
+    return summary
+
+
+# ===========================================
+# Live run state
+# ===========================================
+# RunState is fed the lines of a CoreCycler log as they are appended (see
+# LogTail) and keeps a JSON-serializable snapshot of where the run is, so a
+# status query never has to re-read the log.
+PROGRESS_PATTERN = re.compile(r"Progress (\d+)/(\d+) \| Iteration (\d+)/(\d+) \| Runtime (\d+)h (\d+)m (\d+)s")
+TICK_PATTERN = re.compile(r"- Tick (\d+) of max (\d+)")
+REMAINING_RUNTIME_PATTERN = re.compile(r"Remaining max runtime: (\d+)s")
+FFT_SIZES_TOTAL_PATTERN = re.compile(r"The number of FFT sizes to test:\s+(\d+)")
+FFT_SIZES_TESTED_PATTERN = re.compile(r"The number of FFT sizes already tested:\s+(\d+)")
+PID_PATTERN = re.compile(r"The script process id \(PID\):\s+(\d+)")
+ERROR_START_PATTERN = re.compile(r"^ERROR: \d{2}:\d{2}:\d{2}")
+ERROR_CORE_PATTERN = re.compile(r"^ERROR: At Core (\d+)")
+ERROR_MESSAGE_PATTERN = re.compile(r"^ERROR MESSAGE: (.*)$")
+FATAL_ERROR_PATTERN = re.compile(r"^FATAL ERROR: (.*)$")
+WHEA_CHECK_PATTERN = re.compile(r"^Check for WHEA errors: \.+ (\w+)")
+WHEA_CORES_PATTERN = re.compile(r"The number of cores with a WHEA error(?: so far)?: (\d+)")
+WHEA_MESSAGE_PATTERN = re.compile(r"^WHEA MESSAGE:\s+(.*)$")
+SUMMARY_HEADER_PATTERN = re.compile(r"┤ Summary ├")
+SUSPEND_PATTERN = re.compile(r"Suspending the stress test process for (\d+) milliseconds")
+# With enablePerformanceCounters the usage is a percentage with decimals, e.g. "6.21%"
+CPU_CHECK_PATTERN = re.compile(
+    r"Checking CPU usage(?: again \(#\d+\))?: ([\d.]+)(ms|%) \(expected: ([\d.]+)(?:ms|%), lower limit: ([\d.]+)"
+)
+
+
+class RunState:
+    def __init__(self, corecycler_log):
+        """
+        Track the progress of a running test from its CoreCycler log.
+
+        Args:
+            corecycler_log (str): Path to the CoreCycler_*.log file being written
+        """
+        info = parse_log_name(corecycler_log)
+        if info is None or info["family"] != "CoreCycler":
+            raise ValueError(f"Not a CoreCycler log file: {corecycler_log}")
+        self.run_start = info["started"]
+        self.current = info["started"]
+        self.lines = 0
+        self.fft_passed = {}
+        self.state = {
+            "log": os.path.basename(corecycler_log),
+            "program": info["suffix"].split("_", 1)[0],
+            "mode": info["suffix"].split("_", 1)[1] if "_" in info["suffix"] else "",
+            "started": info["started"].isoformat(),
+            "status": "starting",
+            "pid": None,
+            "processor": "",
+            "core": None,
+            "cpus": "",
+            "core_progress": None,
+            "cores_in_iteration": None,
+            "iteration": None,
+            "max_iterations": None,
+            "tick": None,
+            "max_ticks": None,
+            "remaining_max_runtime": None,
+            "last_passed_fft": None,
+            "fft_sizes_total": None,
+            "fft_sizes_tested": None,
+            "elapsed_seconds": 0.0,
+            "last_log_time": info["started"].isoformat(),
+            "errors": 0,
+            "errors_per_core": {},
+            "last_error": None,
+            "fatal_error": None,
+            "whea": {"checks": "", "lookups": 0, "new_errors": 0, "cores_with_errors": 0, "last_message": None},
+            "co_values": [],
+            "cores": {},
+        }
+
+    def core_counters(self):
+        """The counters of the core being tested, e.g. for the metrics export."""
+        key = str(self.state["core"])
+        if key not in self.state["cores"]:
+            self.state["cores"][key] = {
+                "tests": 0,
+                "ticks": 0,
+                "cpu_samples": 0,
+                "cpu_usage_dips": 0,
+                "cpu_usage_last": None,
+                "cpu_usage_expected": None,
+                "suspended_seconds": 0.0,
+                "fft_sizes_passed": 0,
+            }
+        return self.state["cores"][key]
+
+    def feed(self, lines):
+        """Update the state with newly appended log lines."""
+        for line in lines:
+            self.lines += 1
+            self.feed_line(line)
+        self.state["elapsed_seconds"] = (self.current - self.run_start).total_seconds()
+        self.state["last_log_time"] = self.current.isoformat()
+
+    def feed_line(self, line):
+        state = self.state
+        text = line.strip()
+        if not text:
+            return
+        match = CORECYCLER_TIME_PATTERN.match(text)
+        if match:
+            hours, minutes, seconds = (int(value) for value in match.groups())
+            stamp = self.current.replace(hour=hours, minute=minutes, second=seconds, microsecond=0)
+            while stamp < self.current - timedelta(hours=1):
+                stamp += timedelta(days=1)
+            self.current = max(self.current, stamp)
+        text = text.lstrip("+").strip()
+
+        match = TICK_PATTERN.search(text)
+        if match:
+            state["tick"], state["max_ticks"] = int(match.group(1)), int(match.group(2))
+            state["status"] = "running"
+            self.core_counters()["ticks"] += 1
+            return
+        match = REMAINING_RUNTIME_PATTERN.search(text)
+        if match:
+            state["remaining_max_runtime"] = int(match.group(1))
+            return
+        if text == "No new WHEA error":
+            state["whea"]["lookups"] += 1
+            return
+        if text == "New WHEA error found!":
+            state["whea"]["lookups"] += 1
+            state["whea"]["new_errors"] += 1
+            return
+        match = SUSPEND_PATTERN.search(text)
+        if match:
+            self.core_counters()["suspended_seconds"] += int(match.group(1)) / 1000
+            return
+        match = CPU_CHECK_PATTERN.search(text)
+        if match:
+            counters = self.core_counters()
+            counters["cpu_samples"] += 1
+            counters["cpu_usage_last"] = float(match.group(1))
+            counters["cpu_usage_expected"] = float(match.group(3))
+            if float(match.group(1)) < float(match.group(4)):
+                counters["cpu_usage_dips"] += 1
+            return
+        match = PASSED_FFT_PATTERNS["CoreCycler"].search(text)
+        if match:
+            state["last_passed_fft"] = int(match.group(1))
+            passed = self.fft_passed.setdefault(state["core"], set())
+            passed.add(int(match.group(1)))
+            self.core_counters()["fft_sizes_passed"] = len(passed)
+            return
+        match = FFT_SIZES_TOTAL_PATTERN.search(text)
+        if match:
+            state["fft_sizes_total"] = int(match.group(1))
+            return
+        match = FFT_SIZES_TESTED_PATTERN.search(text)
+        if match:
+            state["fft_sizes_tested"] = int(match.group(1))
+            return
+        match = CORE_SET_PATTERN.search(text)
+        if match:
+            state["core"] = int(match.group(1))
+            state["cpus"] = match.group(2).strip()
+            state["tick"] = None
+            state["remaining_max_runtime"] = None
+            state["last_passed_fft"] = None
+            state["fft_sizes_total"] = None
+            state["fft_sizes_tested"] = None
+            state["status"] = "running"
+            self.core_counters()["tests"] += 1
+            return
+        match = PROGRESS_PATTERN.search(text)
+        if match:
+            values = [int(value) for value in match.groups()]
+            state["core_progress"], state["cores_in_iteration"] = values[0], values[1]
+            state["iteration"], state["max_iterations"] = values[2], values[3]
+            return
+        match = ITERATION_PATTERN.search(text)
+        if match:
+            state["iteration"] = int(match.group(1))
+            return
+        if ERROR_START_PATTERN.match(text):
+            state["errors"] += 1
+            state["last_error"] = {"core": state["core"], "time": self.current.isoformat(), "message": ""}
+            self.count_core_error(state["core"], 1)
+            return
+        match = ERROR_CORE_PATTERN.match(text)
+        if match and state["last_error"] is not None:
+            # The error block names the core, which is more reliable than the last "Set to Core"
+            core = int(match.group(1))
+            if core != state["last_error"]["core"]:
+                self.count_core_error(state["last_error"]["core"], -1)
+                self.count_core_error(core, 1)
+                state["last_error"]["core"] = core
+            return
+        match = ERROR_MESSAGE_PATTERN.match(text)
+        if match and state["last_error"] is not None:
+            state["last_error"]["message"] = match.group(1).strip()
+            return
+        match = FATAL_ERROR_PATTERN.match(text)
+        if match:
+            state["fatal_error"] = match.group(1).strip()
+            return
+        match = WHEA_MESSAGE_PATTERN.match(text)
+        if match:
+            state["whea"]["last_message"] = match.group(1).strip()
+            return
+        match = WHEA_CORES_PATTERN.search(text)
+        if match:
+            state["whea"]["cores_with_errors"] = int(match.group(1))
+            return
+        match = WHEA_CHECK_PATTERN.match(text)
+        if match:
+            state["whea"]["checks"] = match.group(1)
+            return
+        match = PID_PATTERN.search(text)
+        if match:
+            state["pid"] = int(match.group(1))
+            return
+        match = PROCESSOR_PATTERN.match(text)
+        if match:
+            state["processor"] = match.group(1).strip()
+            return
+        co_values = update_co_values(text, state["co_values"])
+        if co_values is not None:
+            state["co_values"] = co_values
+            return
+        if text.endswith("Terminating the script..."):
+            state["status"] = "terminated"
+            return
+        if SUMMARY_HEADER_PATTERN.search(text):
+            state["status"] = "finished"
+
+    def count_core_error(self, core, amount):
+        key = str(core)
+        count = self.state["errors_per_core"].get(key, 0) + amount
+        if count > 0:
+            self.state["errors_per_core"][key] = count
+        else:
+            self.state["errors_per_core"].pop(key, None)
+
+    def snapshot(self):
+        """A copy of the current state that is safe to hand to another thread."""
+        snapshot = dict(self.state)
+        snapshot["errors_per_core"] = dict(self.state["errors_per_core"])
+        snapshot["whea"] = dict(self.state["whea"])
+        snapshot["co_values"] = list(self.state["co_values"])
+        snapshot["cores"] = {core: dict(counters) for core, counters in self.state["cores"].items()}
+        snapshot["last_error"] = dict(self.state["last_error"]) if self.state["last_error"] else None
+        snapshot["lines"] = self.lines
+        return snapshot
+
+
+# ===========================================
+# Run comparison
+# ===========================================
+def core_status(core_summary):
+    """Return "untested", "pass" or "fail" for a core entry of a summary."""
+    if core_summary is None or not core_summary["tests"]:
+        return "untested"
+    return "fail" if core_summary["errors"] else "pass"
+
+
+def compare_summaries(before, after):
+    """
+    Compare two run summaries.
+
+    Only works on the pre-parsed summaries, never on the logs themselves.
+
+    Args:
+        before (dict): Summary of the baseline run
+        after (dict): Summary of the run after the tuning change
+
+    Returns:
+        dict: {"config": {key: (before, after)}, "cores": {core: {...}}, "co_values": (before, after)}
+    """
+    config_delta = {}
+    for key in sorted(set(before["config"]) | set(after["config"])):
+        old_value = before["config"].get(key)
+        new_value = after["config"].get(key)
+        if old_value != new_value:
+            config_delta[key] = (old_value, new_value)
+
+    cores_delta = {}
+    for core in sorted(set(before["cores"]) | set(after["cores"]), key=int):
+        old_core = before["cores"].get(core)
+        new_core = after["cores"].get(core)
+        old_fft = set(old_core["fft_passed"]) if old_core else set()
+        new_fft = set(new_core["fft_passed"]) if new_core else set()
+        cores_delta[core] = {
+            "status": (core_status(old_core), core_status(new_core)),
+            "time_to_error": (
+                old_core["errors"][0]["time_to_error"] if old_core and old_core["errors"] else None,
+                new_core["errors"][0]["time_to_error"] if new_core and new_core["errors"] else None,
+            ),
+            "errors": (len(old_core["errors"]) if old_core else 0, len(new_core["errors"]) if new_core else 0),
+            "runtime": (old_core["runtime"] if old_core else 0.0, new_core["runtime"] if new_core else 0.0),
+            "fft_coverage": (len(old_fft), len(new_fft)),
+            "fft_only_before": sorted(old_fft - new_fft),
+            "fft_only_after": sorted(new_fft - old_fft),
+            "cpu_usage_dips": (
+                old_core["cpu_usage_dips"] if old_core else 0,
+                new_core["cpu_usage_dips"] if new_core else 0,
+            ),
+        }
+
+    return {
+        "before": before["name"],
+        "after": after["name"],
+        "config": config_delta,
+        "cores": cores_delta,
+        "co_values": (before["co_values"], after["co_values"]),
+    }
+
+
+def format_seconds(seconds):
+    """Render a duration in seconds, or "-" if there is none."""
+    return "-" if seconds is None else f"{seconds:.0f}s"
+
+
+def format_comparison(comparison):
+    """Render the result of compare_summaries() as text."""
+    lines = [f"Before: {comparison['before']}", f"After:  {comparison['after']}", ""]
+
+    lines.append("Config changes:")
+    if comparison["config"]:
+        for key, (old_value, new_value) in comparison["config"].items():
+            lines.append(f"  {key}: {old_value} -> {new_value}")
+    else:
+        lines.append("  (none)")
+    old_co, new_co = comparison["co_values"]
+    if old_co != new_co:
+        lines.append(f"  CO values: {old_co} -> {new_co}")
+    lines.append("")
+
+    lines.append("Core outcomes:")
+    for core, delta in comparison["cores"].items():
+        old_status, new_status = delta["status"]
+        marker = "  "
+        if old_status != "fail" and new_status == "fail":
+            marker = "!!"  # Regression
+        elif old_status == "fail" and new_status == "pass":
+            marker = "++"
+        line = f"{marker} Core {core:>2}: {old_status:>8} -> {new_status:<8}"
+        old_tte, new_tte = delta["time_to_error"]
+        if old_tte is not None or new_tte is not None:
+            line += f" | time to error {format_seconds(old_tte)} -> {format_seconds(new_tte)}"
+        line += f" | FFT sizes {delta['fft_coverage'][0]} -> {delta['fft_coverage'][1]}"
+        if any(delta["cpu_usage_dips"]):
+            line += f" | CPU usage dips {delta['cpu_usage_dips'][0]} -> {delta['cpu_usage_dips'][1]}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def run_timeline_command(args):
+    timeline = RunTimeline(args.log, include_debug=args.debug)
+    if args.failures:
+        for event, state in timeline.failures():
+            print(format_event(event, state))
+        return 0
+    for event, state in timeline.annotated_events():
+        if args.core is not None and state["core"] != args.core:
+            continue
+        print(format_event(event, state))
+    return 0
+
+
+def run_compare_command(args):
+    before = load_run_summary(args.before)
+    after = load_run_summary(args.after)
+    comparison = compare_summaries(before, after)
+    if args.json:
+        print(json.dumps(comparison, indent=2))
+    else:
+        print(format_comparison(comparison))
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Analyze CoreCycler log files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    timeline_parser = subparsers.add_parser("timeline", help="Merge all logs of a run into one timeline")
+    timeline_parser.add_argument("log", help="Path to a CoreCycler_*.log file")
+    timeline_parser.add_argument("--core", type=int, help="Only show events while this core was tested")
+    timeline_parser.add_argument("--failures", action="store_true", help="Only show error lines with the tested core")
+    timeline_parser.add_argument("--debug", action="store_true", help="Include the +++ debug lines")
+    timeline_parser.set_defaults(handler=run_timeline_command)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare the outcome and config of two runs")
+    compare_parser.add_argument("before", help="CoreCycler_*.log of the baseline run")
+    compare_parser.add_argument("after", help="CoreCycler_*.log of the run to compare")
+    compare_parser.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    compare_parser.set_defaults(handler=run_compare_command)
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
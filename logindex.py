@@ -0,0 +1,421 @@
+# logindex.py
+import os
+import re
+import sys
+import time
+import array
+import sqlite3
+import argparse
+
+import loganalysis
+
+# ===========================================
+# Log index
+# ===========================================
+# An inverted index from the words of the logs to the lines they appear on,
+# kept in an SQLite database next to the logs. Logs only ever grow while they
+# are written, so every update indexes just the bytes added since the last one
+# (a log that got smaller is indexed again from the start). A last line without
+# a newline is indexed too, and again once the log has grown.
+#
+# Words are runs of letters and digits, lowercased, so "0.4375" is indexed as
+# "0" and "4375". A search looks up the postings of its rarest word, joins the
+# others on (file, line) and then checks the text of each candidate line, so
+# the results are exactly the lines containing the search text.
+INDEX_DIR = ".index"
+INDEX_FILE = "logindex.sqlite3"
+INDEX_VERSION = 1
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+DEFAULT_MAX_RESULTS = 200
+DEFAULT_CONTEXT_LINES = 2
+READ_CHUNK_SIZE = 1024 * 1024
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS files (
+        id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL,
+        started TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime REAL NOT NULL,
+        lines INTEGER NOT NULL,
+        partial INTEGER NOT NULL,
+        offsets BLOB NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS tokens (
+        id INTEGER PRIMARY KEY,
+        token TEXT UNIQUE NOT NULL,
+        count INTEGER NOT NULL
+    )""",
+    # debug is 1 for the "+++" lines of the CoreCycler logs
+    """CREATE TABLE IF NOT EXISTS postings (
+        token INTEGER NOT NULL,
+        file INTEGER NOT NULL,
+        line INTEGER NOT NULL,
+        debug INTEGER NOT NULL,
+        PRIMARY KEY (token, file, line)
+    ) WITHOUT ROWID""",
+]
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def index_path(log_dir):
+    return os.path.join(log_dir, INDEX_DIR, INDEX_FILE)
+
+
+def is_debug_line(text):
+    return text.lstrip().startswith("+++")
+
+
+# ===========================================
+# LogIndex Class
+# ===========================================
+class LogIndex:
+    def __init__(self, log_dir, path=None):
+        """
+        Open (or create) the index of a logs folder.
+
+        A LogIndex holds one SQLite connection, so it belongs to the thread that
+        created it. Several can be open on the same index, e.g. one updating it
+        in a worker thread while another one searches.
+
+        Args:
+            log_dir (str): The logs folder
+            path (str): The index database, defaults to .index/logindex.sqlite3 in the logs folder
+        """
+        self.log_dir = log_dir
+        self.path = path or index_path(log_dir)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            # An index written by another version is rebuilt rather than migrated
+            with self.connection:
+                for table in ("postings", "tokens", "files"):
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+        with self.connection:
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+            self.connection.execute(f"PRAGMA user_version={INDEX_VERSION}")
+        self.offsets_cache = {}
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # -------------------------------------------
+    # Updating
+    # -------------------------------------------
+    def log_files(self):
+        for name in sorted(os.listdir(self.log_dir)):
+            if loganalysis.parse_log_name(name) is not None:
+                yield name
+
+    def update(self, progress=None):
+        """
+        Index what was added to the logs since the last update.
+
+        Args:
+            progress (callable): Called with (done, total, name) before each log
+
+        Returns:
+            dict: {"files": logs (re)indexed, "lines": lines added, "removed": logs no longer there}
+        """
+        names = list(self.log_files())
+        known = {row[0]: row[1:] for row in self.connection.execute("SELECT name, id, size, mtime FROM files")}
+        result = {"files": 0, "lines": 0, "removed": 0}
+        for name in set(known) - set(names):
+            self.remove_file(known[name][0])
+            result["removed"] += 1
+        for done, name in enumerate(names):
+            path = os.path.join(self.log_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if name in known and known[name][1:] == (stat.st_size, stat.st_mtime):
+                continue
+            if progress is not None:
+                progress(done, len(names), name)
+            result["lines"] += self.index_file(name, path, stat, known.get(name))
+            result["files"] += 1
+        return result
+
+    def remove_file(self, file_id):
+        with self.connection:
+            self.connection.execute(
+                "UPDATE tokens SET count = count - "
+                "(SELECT COUNT(*) FROM postings WHERE postings.token = tokens.id AND postings.file = ?) "
+                "WHERE id IN (SELECT token FROM postings WHERE file = ?)",
+                (file_id, file_id),
+            )
+            self.connection.execute("DELETE FROM postings WHERE file = ?", (file_id,))
+            self.connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        self.offsets_cache.pop(file_id, None)
+
+    def index_file(self, name, path, stat, known):
+        """Index the lines a log gained since it was last indexed."""
+        if known is not None and stat.st_size < known[1]:
+            # The log was replaced, start over
+            self.remove_file(known[0])
+            known = None
+        if known is None:
+            started = loganalysis.parse_log_name(name)["started"].isoformat()
+            with self.connection:
+                file_id = self.connection.execute(
+                    "INSERT INTO files (name, started, size, mtime, lines, partial, offsets) "
+                    "VALUES (?, ?, 0, 0, 0, 0, ?)",
+                    (name, started, b""),
+                ).lastrowid
+            offsets = array.array("q")
+        else:
+            file_id = known[0]
+            offsets = array.array("q", self.line_offsets(file_id))
+        self.offsets_cache.pop(file_id, None)
+        position, partial = self.connection.execute(
+            "SELECT size, partial FROM files WHERE id = ?", (file_id,)
+        ).fetchone()
+
+        # A partial last line is indexed again below, but it isn't a new line
+        indexed_lines = len(offsets)
+        with open(path, "rb") as log:
+            if partial:
+                # The last line had no newline yet, it's indexed again with what was added to it
+                log.seek(offsets[-1])
+                self.remove_postings(file_id, len(offsets), log.read(position - offsets[-1]))
+                position = offsets.pop()
+            line_number = len(offsets)
+            postings = []
+            counts = {}
+
+            def add_line(line):
+                nonlocal line_number
+                offsets.append(position)
+                line_number += 1
+                text = line.decode("utf-8", errors="replace")
+                debug = 1 if is_debug_line(text) else 0
+                for token in set(tokenize(text)):
+                    postings.append((token, line_number, debug))
+                    counts[token] = counts.get(token, 0) + 1
+
+            log.seek(position)
+            remainder = b""
+            while True:
+                chunk = log.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                lines = (remainder + chunk).split(b"\n")
+                remainder = lines.pop()
+                for line in lines:
+                    add_line(line)
+                    position += len(line) + 1
+            if remainder:
+                add_line(remainder)
+                position += len(remainder)
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO tokens (token, count) VALUES (?, ?) "
+                "ON CONFLICT(token) DO UPDATE SET count = count + excluded.count",
+                counts.items(),
+            )
+            token_ids = self.token_ids()
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO postings (token, file, line, debug) VALUES (?, ?, ?, ?)",
+                ((token_ids[token], file_id, line, debug) for token, line, debug in postings),
+            )
+            self.connection.execute(
+                "UPDATE files SET size = ?, mtime = ?, lines = ?, partial = ?, offsets = ? WHERE id = ?",
+                (position, stat.st_mtime, line_number, 1 if remainder else 0, offsets.tobytes(), file_id),
+            )
+        return line_number - indexed_lines
+
+    def token_ids(self):
+        return dict(self.connection.execute("SELECT token, id FROM tokens"))
+
+    def remove_postings(self, file_id, line_number, line):
+        """Remove the postings of one line, given its text."""
+        token_ids = self.token_ids()
+        tokens = [token_ids[token] for token in set(tokenize(line.decode("utf-8", errors="replace"))) if token in token_ids]
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM postings WHERE token = ? AND file = ? AND line = ?",
+                ((token, file_id, line_number) for token in tokens),
+            )
+            self.connection.executemany("UPDATE tokens SET count = count - 1 WHERE id = ?", ((token,) for token in tokens))
+
+    # -------------------------------------------
+    # Searching
+    # -------------------------------------------
+    def line_offsets(self, file_id):
+        offsets = self.offsets_cache.get(file_id)
+        if offsets is None:
+            offsets = array.array("q")
+            offsets.frombytes(self.connection.execute("SELECT offsets FROM files WHERE id = ?", (file_id,)).fetchone()[0])
+            self.offsets_cache[file_id] = offsets
+        return offsets
+
+    def search(self, query, include_debug=False, max_results=DEFAULT_MAX_RESULTS, context=DEFAULT_CONTEXT_LINES):
+        """
+        Find the lines containing the search text, newest logs first.
+
+        The match is case-insensitive and the whitespace in the search text
+        matches any whitespace. Words are matched as whole words at the ends
+        of the search text too, so "Core 1" doesn't find "Core 11".
+
+        Args:
+            query (str): The text to search for
+            include_debug (bool): Also search the "+++" debug lines
+            max_results (int): Stop after this many lines
+            context (int): Lines of context before and after each match
+
+        Returns:
+            list: One dict per match with "log", "line", "text", "before" and "after"
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        rows = self.connection.execute(
+            f"SELECT id, count FROM tokens WHERE token IN ({','.join('?' * len(set(words)))})", list(set(words))
+        ).fetchall()
+        if len(rows) < len(set(words)):
+            return []  # A word that is in no log
+        rows.sort(key=lambda row: row[1])
+        rarest, others = rows[0][0], [row[0] for row in rows[1:]]
+
+        joins = "".join(
+            f" JOIN postings p{number} ON p{number}.token = ? AND p{number}.file = p.file AND p{number}.line = p.line"
+            for number in range(len(others))
+        )
+        debug_filter = "" if include_debug else " AND p.debug = 0"
+        candidates = self.connection.execute(
+            f"SELECT files.id, files.name, p.line FROM postings p{joins} JOIN files ON files.id = p.file "
+            f"WHERE p.token = ?{debug_filter} ORDER BY files.started DESC, files.name, p.line",
+            others + [rarest],
+        )
+
+        pattern = search_pattern(query)
+        results = []
+        open_files = {}
+        try:
+            for file_id, name, line in candidates:
+                log = open_files.get(file_id)
+                if log is None:
+                    log = open_files[file_id] = open(os.path.join(self.log_dir, name), "rb")
+                lines = self.read_lines(log, file_id, line - context, line + context)
+                text = lines.get(line)
+                if text is None or not pattern.search(text):
+                    continue
+                results.append({
+                    "log": name,
+                    "line": line,
+                    "text": text,
+                    "before": [lines[number] for number in range(line - context, line) if number in lines],
+                    "after": [lines[number] for number in range(line + 1, line + context + 1) if number in lines],
+                })
+                if len(results) >= max_results:
+                    break
+        finally:
+            for log in open_files.values():
+                log.close()
+        return results
+
+    def read_lines(self, log, file_id, first, last):
+        """Read the lines first to last (1-based, clipped to the indexed lines) of an open log."""
+        offsets = self.line_offsets(file_id)
+        first = max(first, 1)
+        last = min(last, len(offsets))
+        if first > last:
+            return {}
+        log.seek(offsets[first - 1])
+        end = offsets[last] if last < len(offsets) else None
+        data = log.read() if end is None else log.read(end - offsets[first - 1])
+        texts = data.decode("utf-8", errors="replace").split("\n")
+        return {first + index: text.rstrip("\r") for index, text in enumerate(texts[:last - first + 1])}
+
+    def stats(self):
+        files, lines = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(lines), 0) FROM files").fetchone()
+        tokens = self.connection.execute("SELECT COUNT(*) FROM tokens WHERE count > 0").fetchone()[0]
+        return {"files": files, "lines": lines, "tokens": tokens, "size": os.path.getsize(self.path)}
+
+
+def search_pattern(query):
+    """The regular expression a candidate line has to match."""
+    pattern = r"\s+".join(re.escape(part) for part in query.split())
+    if query.strip()[:1].isalnum():
+        pattern = r"(?<![0-9A-Za-z])" + pattern
+    if query.strip()[-1:].isalnum():
+        pattern += r"(?![0-9A-Za-z])"
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def format_results(results):
+    lines = []
+    for result in results:
+        lines.append(f"{result['log']}:{result['line']}")
+        for number, text in enumerate(result["before"], result["line"] - len(result["before"])):
+            lines.append(f"  {number:>6}  {text}")
+        lines.append(f"> {result['line']:>6}  {result['text']}")
+        for number, text in enumerate(result["after"], result["line"] + 1):
+            lines.append(f"  {number:>6}  {text}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def run_update_command(args):
+    started = time.perf_counter()
+    with LogIndex(args.logs) as index:
+        result = index.update()
+        stats = index.stats()
+    print(f"Indexed {result['lines']} new lines in {result['files']} logs in {time.perf_counter() - started:.2f}s"
+          + (f", removed {result['removed']} deleted logs" if result["removed"] else ""))
+    print(f"{stats['files']} logs, {stats['lines']} lines, {stats['tokens']} words, "
+          f"{stats['size'] / 1024 / 1024:.1f} MB index")
+    return 0
+
+
+def run_search_command(args):
+    with LogIndex(args.logs) as index:
+        if not args.no_update:
+            index.update()
+        started = time.perf_counter()
+        results = index.search(" ".join(args.query), args.debug, args.max, args.context)
+        elapsed = time.perf_counter() - started
+    print(format_results(results))
+    print(f"{len(results)} matches in {elapsed * 1000:.0f} ms")
+    return 0 if results else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Search the text of all logs through an incrementally updated index.")
+    parser.add_argument("--logs", default="logs", help="The logs folder")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    update_parser = subparsers.add_parser("update", help="Index the logs added or grown since the last update")
+    update_parser.set_defaults(handler=run_update_command)
+
+    search_parser = subparsers.add_parser("search", help="Show the lines containing a text, newest logs first")
+    search_parser.add_argument("query", nargs="+", help="The text to search for")
+    search_parser.add_argument("--debug", action="store_true", help="Also search the \"+++\" debug lines")
+    search_parser.add_argument("--max", type=int, default=DEFAULT_MAX_RESULTS, help="Maximum number of matches")
+    search_parser.add_argument("--context", type=int, default=DEFAULT_CONTEXT_LINES, help="Lines of context")
+    search_parser.add_argument("--no-update", action="store_true", help="Don't update the index first")
+    search_parser.set_defaults(handler=run_search_command)
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
@@ -3,9 +3,296 @@ import sys
 import configparser
 import subprocess
 import os
-import glob
-from PyQt5 import QtWidgets, QtCore
+import re
+import time
+import math
+import threading
+import array
+import bisect
+import collections
+from datetime import datetime
+from PyQt5 import QtWidgets, QtCore, QtGui
 from CoreCycler import Ui_CoreCycler  # Import generated GUI class
+import loganalysis
+import topology
+import presets
+import tracing
+import planning
+import automode
+import logindex
+import charts
+import sizing
+
+# ===========================================
+# Config writes and signal bindings
+# ===========================================
+# Number of times each config file was written, to verify that only user changes write to disk
+config_writes = collections.Counter()
+
+
+def save_config(config, config_file):
+    """Write the whole config to disk and count the write."""
+    with tracing.tracer.span(f"write {config_file}", "disk", file=config_file):
+        with open(config_file, 'w') as configfile:
+            config.write(configfile)
+    config_writes[config_file] += 1
+    tracing.tracer.count("writes")
+
+
+def export_trace(tracer):
+    """Print the handler summary and save the trace when the GUI is closed."""
+    print(tracer.summary())
+    tracer.export_chrome_trace(f"trace_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
+
+
+class SignalBindings:
+    def __init__(self):
+        """
+        Change handlers of the settings widgets.
+
+        While the widgets are loaded from config.ini the handlers are only collected,
+        so setting the initial values can't trigger a config write. connect_all()
+        connects them once everything is loaded; later bindings connect right away.
+        """
+        self.bindings = []
+        self.connected = False
+
+    def add(self, signal, slot, name=None):
+        """
+        Args:
+            signal: The bound signal, e.g. checkBox_2.stateChanged
+            slot (callable): The change handler
+            name (str): Name of the handler in traces, defaults to the function name
+        """
+        if tracing.tracer.enabled:
+            slot = tracing.tracer.wrap(slot, name)
+        self.bindings.append((signal, slot))
+        if self.connected:
+            signal.connect(slot)
+
+    def connect_all(self):
+        if self.connected:
+            return
+        for signal, slot in self.bindings:
+            signal.connect(slot)
+        self.connected = True
+
+
+# ===========================================
+# Widget binding registry
+# ===========================================
+# Each row binds one widget to one setting: (widget, section, key, codec), and
+# optionally the name of a radio button that has to be checked for changes to be
+# written. The widget names are resolved once at startup; a change only
+# re-encodes the one setting its widget is bound to.
+WidgetBinding = collections.namedtuple("WidgetBinding", ["widget", "section", "key", "codec", "only_when"], defaults=(None,))
+
+
+class CheckBoxCodec:
+    """A checkbox stored as 1 / 0."""
+
+    def __init__(self, default="0"):
+        self.default = default
+
+    def signal(self, widget):
+        return widget.stateChanged
+
+    def load(self, widget, value):
+        widget.setChecked(value.strip().lower() in ("1", "true", "yes", "on"))
+
+    def encode(self, widget, current):
+        return "1" if widget.isChecked() else "0"
+
+
+class SpinBoxCodec:
+    """A spin box stored as a number."""
+
+    def __init__(self, default="0"):
+        self.default = default
+
+    def signal(self, widget):
+        return widget.valueChanged
+
+    def load(self, widget, value):
+        try:
+            widget.setValue(int(float(value)))
+        except ValueError:
+            widget.setValue(int(self.default))
+
+    def encode(self, widget, current):
+        return str(widget.value())
+
+
+class CheckBoxList:
+    """The checkboxes that make up one comma separated list, e.g. the yCruncher tests."""
+
+    def __init__(self, order, empty=""):
+        """
+        Args:
+            order (list): All items of the list, in the order they are written
+            empty (str): Value to write if no checkbox is checked
+        """
+        self.order = order
+        self.empty = empty
+        self.selected = set()
+
+    def codec(self, item, default=""):
+        return ListItemCodec(item, self, default)
+
+    def encode(self):
+        return ", ".join(item for item in self.order if item in self.selected) or self.empty
+
+
+class ListItemCodec:
+    """A checkbox that adds or removes one item of a CheckBoxList."""
+
+    def __init__(self, item, checkbox_list, default=""):
+        self.item = item
+        self.checkbox_list = checkbox_list
+        self.default = default
+
+    def signal(self, widget):
+        return widget.stateChanged
+
+    def load(self, widget, value):
+        widget.setChecked(self.item in [entry.strip() for entry in value.split(",")])
+        self.update_selection(widget)
+
+    def update_selection(self, widget):
+        """Add or remove this item, called on every toggle, also when the change isn't written."""
+        if widget.isChecked():
+            self.checkbox_list.selected.add(self.item)
+        else:
+            self.checkbox_list.selected.discard(self.item)
+
+    def encode(self, widget, current):
+        return self.checkbox_list.encode()
+
+
+class RadioValueCodec:
+    """A radio button that selects one value of a setting, e.g. the yCruncher mode."""
+
+    def __init__(self, value, default=""):
+        self.value = value
+        self.default = default
+
+    def signal(self, widget):
+        return widget.toggled
+
+    def load(self, widget, value):
+        if value == self.value:
+            widget.setChecked(True)
+
+    def encode(self, widget, current):
+        # The button that is unchecked doesn't write, the newly checked one does
+        return self.value if widget.isChecked() else None
+
+
+YCRUNCHER_TESTS = ["BKT", "BBP", "SFT", "SFTv4", "SNT", "SVT", "FFT", "FFTv4", "N63", "VT3"]
+YCRUNCHER_OLD_TESTS = ["BKT", "BBP", "SFT", "FFT", "N32", "N64", "HNT", "VST", "C17"]
+YCRUNCHER_MODES = [
+    "04-P4P", "05-A64 ~ Kasumi", "08-NHM ~ Ushio", "11-SNB ~ Hina", "12-BD2 ~ Miyu", "13-HSW ~ Airi",
+    "14-BDW ~ Kurumi", "17-SKX ~ Kotori", "17-ZN1 ~ Yukina", "18-CNL ~ Shinoa", "19-ZN2 ~ Kagari",
+    "22-ZN4 ~ Kizuna", "24-ZN5 ~ Komari",
+]
+AIDA64_MODES = ["CACHE", "CPU", "FPU", "RAM"]
+
+
+def widget_bindings():
+    """
+    The binding rows of the main window.
+
+    Every call creates its own CheckBoxList objects, so each WidgetRegistry keeps its own selections.
+    """
+    ycruncher_tests = CheckBoxList(YCRUNCHER_TESTS)
+    ycruncher_old_tests = CheckBoxList(YCRUNCHER_OLD_TESTS)
+    aida64_modes = CheckBoxList(AIDA64_MODES, empty="CACHE")
+    return [
+        # [General]
+        WidgetBinding("checkBox_2", "General", "skipCoreOnError", CheckBoxCodec()),
+        WidgetBinding("checkBox_3", "General", "stopOnError", CheckBoxCodec()),
+        WidgetBinding("checkBox_4", "General", "assignBothVirtualCoresForSingleThread", CheckBoxCodec()),
+        WidgetBinding("checkBox_5", "General", "suspendPeriodically", CheckBoxCodec()),
+        WidgetBinding("checkBox_6", "General", "beepOnError", CheckBoxCodec()),
+        WidgetBinding("checkBox_7", "General", "flashOnError", CheckBoxCodec()),
+        WidgetBinding("checkBox_8", "General", "lookForWheaErrors", CheckBoxCodec()),
+        WidgetBinding("checkBox_9", "General", "treatWheaWarningAsError", CheckBoxCodec()),
+        WidgetBinding("checkBox_10", "General", "restartTestProgramForEachCore", CheckBoxCodec()),
+        WidgetBinding("spinBox1", "General", "numberOfThreads", SpinBoxCodec(default="1")),
+        # [yCruncher], the tests checkboxes only write while their yCruncher version is selected
+        *[WidgetBinding(f"checkBox_{29 + index}", "yCruncher", "tests", ycruncher_tests.codec(test), "radioButton_4")
+          for index, test in enumerate(YCRUNCHER_TESTS)],
+        *[WidgetBinding(f"checkBox_{39 + index}", "yCruncher", "tests", ycruncher_old_tests.codec(test), "radioButton_5")
+          for index, test in enumerate(YCRUNCHER_OLD_TESTS)],
+        *[WidgetBinding(f"radioButton_{10 + index}", "yCruncher", "mode", RadioValueCodec(mode, default="04-P4P"))
+          for index, mode in enumerate(YCRUNCHER_MODES)],
+        WidgetBinding("spinBox_8", "yCruncher", "testDuration", SpinBoxCodec(default="60")),
+        WidgetBinding("checkBox_49", "yCruncher", "enableYCruncherLoggingWrapper", CheckBoxCodec()),
+        # [Aida64], at least one mode is always written
+        *[WidgetBinding(f"checkBox_{24 + index}", "Aida64", "mode", aida64_modes.codec(mode, default="CACHE"))
+          for index, mode in enumerate(AIDA64_MODES)],
+        WidgetBinding("checkBox_28", "Aida64", "useAVX", CheckBoxCodec()),
+        WidgetBinding("spinBox_7", "Aida64", "maxMemory", SpinBoxCodec(default="90")),
+    ]
+
+
+class WidgetRegistry:
+    def __init__(self, app, rows=None):
+        """
+        Resolve the binding rows to the widgets of the main window.
+
+        Args:
+            app (CoreCyclerApp): The main window with the widgets and the config
+            rows (list): WidgetBinding rows, defaults to widget_bindings()
+        """
+        rows = widget_bindings() if rows is None else rows
+        self.app = app
+        self.config = app.config
+        self.config_file = app.config_file
+        self.bindings = []
+        for row in rows:
+            widget = getattr(app, row.widget, None)
+            if widget is None:
+                print(f"Warning: {row.widget} not found in the UI")
+                continue
+            only_when = getattr(app, row.only_when) if row.only_when else None
+            self.bindings.append((widget, row, only_when))
+
+    def load(self):
+        """Show the config values in the widgets."""
+        for widget, row, only_when in self.bindings:
+            value = self.config.get(row.section, row.key, fallback=row.codec.default)
+            row.codec.load(widget, value)
+
+    def connect(self):
+        """Register the change handlers, they are connected once all widgets are loaded."""
+        for binding in self.bindings:
+            widget, row, only_when = binding
+            self.app.bindings.add(row.codec.signal(widget), lambda *args, binding=binding: self.on_changed(binding),
+                                  name=f"{row.widget} -> [{row.section}] {row.key}")
+
+    def on_changed(self, binding):
+        widget, row, only_when = binding
+        update_selection = getattr(row.codec, "update_selection", None)
+        if update_selection is not None:
+            # Before the only_when check, so the list stays current while its writes are skipped
+            update_selection(widget)
+        if only_when is not None and not only_when.isChecked():
+            return
+        current = self.config.get(row.section, row.key, fallback=row.codec.default)
+        value = row.codec.encode(widget, current)
+        if value is None:
+            return
+        try:
+            if row.section not in self.config:
+                self.config[row.section] = {}
+            self.config[row.section][row.key] = value
+            save_config(self.config, self.config_file)
+            print(f"Updated config.ini: [{row.section}] {row.key} = {value}")
+        except Exception as e:
+            print(f"Error writing to config.ini: {e}")
+            QtWidgets.QMessageBox.critical(self.app, "Error", f"Failed to update config: {str(e)}")
+
 
 # ===========================================
 # LinpackSettings Class (originally from linpack.py)
@@ -33,6 +320,7 @@ class LinpackSettings:
         self.setup_version_settings()
         self.setup_mode_settings()
         self.setup_memory_settings()  # New method for comboBox_7
+        self.setup_estimate()
 
     def setup_version_settings(self):
         """Set up comboBox_5 for the 'version' setting in [Linpack]."""
@@ -47,14 +335,14 @@ class LinpackSettings:
             for version in self.version_map.values():
                 self.app.comboBox_5.addItem(version)
         
-        current_version = self.config["Linpack"].get("memory", "2018")
+        current_version = self.config["Linpack"].get("version", "2018")
         reverse_map = {v: k for k, v in self.version_map.items()}
         if current_version in reverse_map:
             self.app.comboBox_5.setCurrentIndex(reverse_map[current_version])
         else:
             self.app.comboBox_5.setCurrentIndex(0)
         
-        self.app.comboBox_5.currentIndexChanged.connect(self.update_version)
+        self.app.bindings.add(self.app.comboBox_5.currentIndexChanged, self.update_version)
 
     def setup_mode_settings(self):
         """Set up comboBox_6 for the 'mode' setting in [Linpack]."""
@@ -77,7 +365,7 @@ class LinpackSettings:
         else:
             self.app.comboBox_6.setCurrentIndex(0)
         
-        self.app.comboBox_6.currentIndexChanged.connect(self.update_mode)
+        self.app.bindings.add(self.app.comboBox_6.currentIndexChanged, self.update_mode)
 
     def setup_memory_settings(self):
         """Set up comboBox_7 for the 'memory' setting in [Linpack]."""
@@ -108,7 +396,35 @@ class LinpackSettings:
             self.app.comboBox_7.setCurrentIndex(0)  # Default to 2GB
         
         # Connect the comboBox_7 signal to update the config
-        self.app.comboBox_7.currentIndexChanged.connect(self.update_memory)
+        self.app.bindings.add(self.app.comboBox_7.currentIndexChanged, self.update_memory)
+
+    def setup_estimate(self):
+        """Show the problem size, memory footprint and trials per core of the selection in label_34."""
+        log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.model = sizing.linpack_model(sizing.calibrate_linpack(log_dir) if os.path.isdir(log_dir) else {})
+        font = self.app.label_34.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.app.label_34.setFont(font)
+
+        # Only updates the label, so it doesn't wait for the config bindings
+        for signal in (self.app.comboBox_5.currentIndexChanged, self.app.comboBox_6.currentIndexChanged,
+                       self.app.comboBox_7.currentIndexChanged, self.app.spinBox1.valueChanged,
+                       self.app.spinBox_9.valueChanged):
+            signal.connect(self.update_estimate)
+        self.update_estimate()
+
+    def update_estimate(self, *args):
+        version = self.app.comboBox_5.currentText()
+        mode = self.app.comboBox_6.currentText().upper()
+        memory = self.app.comboBox_7.currentText()
+        threads = 2 if self.app.spinBox1.value() == 2 else 1
+        estimate = self.model.get((version, sizing.linpack_mode(version, mode), memory, threads))
+        # The spin box shows 0 for "auto"
+        runtime_seconds = self.app.spinBox_9.value() * 60 or None
+        topology = getattr(self.app, "topology", None)
+        cores = len(topology.core_to_cpus) if topology is not None else None
+        self.app.label_34.setText(sizing.format_linpack_estimate(estimate, runtime_seconds, cores))
 
     def update_version(self, index):
         """Update the 'version' setting in [Linpack] based on comboBox_5 selection."""
@@ -131,8 +447,7 @@ class LinpackSettings:
             if section not in self.config:
                 self.config[section] = {}
             self.config[section][option] = str(value)
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            save_config(self.config, self.config_file)
             print(f"Updated config.ini: [{section}] {option} = {value}")
         except Exception as e:
             print(f"Error writing to config.ini: {e}")
@@ -188,7 +503,7 @@ class Prime95Settings:
             self.app.comboBox_2.setCurrentIndex(0)
         else:
             self.app.comboBox_2.setCurrentIndex(0)
-        self.app.comboBox_2.currentIndexChanged.connect(self.update_mode)
+        self.app.bindings.add(self.app.comboBox_2.currentIndexChanged, self.update_mode)
 
     def setup_fft_size_settings(self):
         """Set up comboBox_8 and lineEdit_4 for the 'fftSize' setting."""
@@ -215,14 +530,14 @@ class Prime95Settings:
         else:
             self.app.comboBox_8.setCurrentIndex(8)
             self.app.lineEdit_4.setText(current_fft_size)
-        self.app.comboBox_8.currentIndexChanged.connect(self.update_fft_size_from_combobox)
-        self.app.lineEdit_4.textChanged.connect(self.update_fft_size_from_lineedit)
+        self.app.bindings.add(self.app.comboBox_8.currentIndexChanged, self.update_fft_size_from_combobox)
+        self.app.bindings.add(self.app.lineEdit_4.textChanged, self.update_fft_size_from_lineedit)
 
     def setup_checkbox_settings(self):
         """Set up checkBox_11 to override 'mode' to 'custom' when checked."""
         current_mode = self.config["Prime95"].get("mode", "SSE")
         self.app.checkBox_11.setChecked(current_mode == "custom")
-        self.app.checkBox_11.stateChanged.connect(self.update_mode_from_checkbox)
+        self.app.bindings.add(self.app.checkBox_11.stateChanged, self.update_mode_from_checkbox)
 
     def setup_custom_torture_settings(self):
         """Set up lineEdit_7, lineEdit_8, lineEdit_9, and lineEdit_10 for custom Prime95 settings."""
@@ -234,113 +549,60 @@ class Prime95Settings:
         self.app.lineEdit_8.setText(max_fft)
         self.app.lineEdit_9.setText(torture_mem)
         self.app.lineEdit_10.setText(torture_time)
-        self.app.lineEdit_7.textChanged.connect(lambda text: self.update_custom_setting("mintorturefft", text))
-        self.app.lineEdit_8.textChanged.connect(lambda text: self.update_custom_setting("maxtorturefft", text))
-        self.app.lineEdit_9.textChanged.connect(lambda text: self.update_custom_setting("torturemem", text))
-        self.app.lineEdit_10.textChanged.connect(lambda text: self.update_custom_setting("torturetime", text))
+        self.app.bindings.add(self.app.lineEdit_7.textChanged, lambda text: self.update_custom_setting("mintorturefft", text))
+        self.app.bindings.add(self.app.lineEdit_8.textChanged, lambda text: self.update_custom_setting("maxtorturefft", text))
+        self.app.bindings.add(self.app.lineEdit_9.textChanged, lambda text: self.update_custom_setting("torturemem", text))
+        self.app.bindings.add(self.app.lineEdit_10.textChanged, lambda text: self.update_custom_setting("torturetime", text))
 
     def setup_cpu_support_settings(self):
         """Set up radio buttons to control CPU support settings in a mutually exclusive group."""
-        self.cpu_support_group = QtWidgets.QButtonGroup(self.app)
-        
-        if hasattr(self.app, "radioButton_23"):
-            self.cpu_support_group.addButton(self.app.radioButton_23, id=0)
-        else:
-            print("Warning: radioButton_23 not found in the UI")
-
-        if hasattr(self.app, "radioButton_6"):
-            self.cpu_support_group.addButton(self.app.radioButton_6, id=1)
-        else:
-            print("Warning: radioButton_6 not found in the UI")
-
-        if hasattr(self.app, "radioButton_7"):
-            self.cpu_support_group.addButton(self.app.radioButton_7, id=2)
-        else:
-            print("Warning: radioButton_7 not found in the UI")
-
-        if hasattr(self.app, "radioButton_8"):
-            self.cpu_support_group.addButton(self.app.radioButton_8, id=3)
-        else:
-            print("Warning: radioButton_8 not found in the UI")
+        # Button id: (radio button, [Prime95Custom] values), from the lowest to the highest level
+        self.cpu_support_levels = {
+            0: ("radioButton_23", {"cpusupportsavx": "0", "cpusupportsavx2": "0", "cpusupportsfma3": "0", "cpusupportsavx512": "0"}),  # SSE
+            1: ("radioButton_6", {"cpusupportsavx": "1", "cpusupportsavx2": "0", "cpusupportsfma3": "0", "cpusupportsavx512": "0"}),  # AVX
+            2: ("radioButton_7", {"cpusupportsavx": "1", "cpusupportsavx2": "1", "cpusupportsfma3": "0", "cpusupportsavx512": "0"}),  # AVX2
+            3: ("radioButton_8", {"cpusupportsavx": "1", "cpusupportsavx2": "1", "cpusupportsfma3": "1", "cpusupportsavx512": "0"}),  # FMA3
+            4: ("radioButton_9", {"cpusupportsavx": "1", "cpusupportsavx2": "1", "cpusupportsfma3": "1", "cpusupportsavx512": "1"}),  # AVX512
+        }
 
-        if hasattr(self.app, "radioButton_9"):
-            self.cpu_support_group.addButton(self.app.radioButton_9, id=4)
-        else:
-            print("Warning: radioButton_9 not found in the UI")
+        self.cpu_support_group = QtWidgets.QButtonGroup(self.app)
+        for button_id, (button_name, settings) in self.cpu_support_levels.items():
+            self.cpu_support_group.addButton(getattr(self.app, button_name), id=button_id)
 
-        self.cpu_support_group.buttonToggled.connect(self.update_cpu_support_config)
         self.set_initial_cpu_support_state()
+        self.app.bindings.add(self.cpu_support_group.buttonToggled, self.update_cpu_support_config)
 
     def set_initial_cpu_support_state(self):
-        """Set the initial state of the radio buttons based on the config."""
-        avx = self.config["Prime95Custom"].getboolean("cpusupportsavx", fallback=False)
-        avx2 = self.config["Prime95Custom"].getboolean("cpusupportsavx2", fallback=False)
-        fma3 = self.config["Prime95Custom"].getboolean("cpusupportsfma3", fallback=False)
-        avx512 = self.config["Prime95Custom"].getboolean("cpusupportsavx512", fallback=False)
-
-        if avx512 and fma3 and avx2 and avx:
-            if hasattr(self.app, "radioButton_9"):
-                self.app.radioButton_9.setChecked(True)
-        elif fma3 and avx2 and avx:
-            if hasattr(self.app, "radioButton_8"):
-                self.app.radioButton_8.setChecked(True)
-        elif avx2 and avx:
-            if hasattr(self.app, "radioButton_7"):
-                self.app.radioButton_7.setChecked(True)
-        elif avx:
-            if hasattr(self.app, "radioButton_6"):
-                self.app.radioButton_6.setChecked(True)
-        else:
-            if hasattr(self.app, "radioButton_23"):
-                self.app.radioButton_23.setChecked(True)
+        """Check the highest level whose instruction sets are all enabled in the config."""
+        checked_id = 0
+        for button_id, (button_name, settings) in self.cpu_support_levels.items():
+            if all(self.config["Prime95Custom"].getboolean(option, fallback=False)
+                   for option, value in settings.items() if value == "1"):
+                checked_id = button_id
+        self.cpu_support_group.button(checked_id).setChecked(True)
 
     def update_cpu_support_config(self, button, checked):
-        """Update CPU support settings in [Prime95Custom] based on the selected radio button."""
+        """Update the CPU support settings in [Prime95Custom] that differ from the selected radio button."""
         if not checked:
             return
 
         button_id = self.cpu_support_group.id(button)
-        
-        if button_id == 0:  # radioButton_23 (SSE)
-            settings = {
-                "cpusupportsavx": "0",
-                "cpusupportsavx2": "0",
-                "cpusupportsfma3": "0",
-                "cpusupportsavx512": "0"
-            }
-        elif button_id == 1:  # radioButton_6 (AVX)
-            settings = {
-                "cpusupportsavx": "1",
-                "cpusupportsavx2": "0",
-                "cpusupportsfma3": "0",
-                "cpusupportsavx512": "0"
-            }
-        elif button_id == 2:  # radioButton_7 (AVX2)
-            settings = {
-                "cpusupportsavx": "1",
-                "cpusupportsavx2": "1",
-                "cpusupportsfma3": "0",
-                "cpusupportsavx512": "0"
-            }
-        elif button_id == 3:  # radioButton_8 (FMA3)
-            settings = {
-                "cpusupportsavx": "1",
-                "cpusupportsavx2": "1",
-                "cpusupportsfma3": "1",
-                "cpusupportsavx512": "0"
-            }
-        elif button_id == 4:  # radioButton_9 (AVX512)
-            settings = {
-                "cpusupportsavx": "1",
-                "cpusupportsavx2": "1",
-                "cpusupportsfma3": "1",
-                "cpusupportsavx512": "1"
-            }
-        else:
+        if button_id not in self.cpu_support_levels:
             return
 
-        for option, value in settings.items():
-            self.update_config("Prime95Custom", option, value)
+        button_name, settings = self.cpu_support_levels[button_id]
+        changed = {option: value for option, value in settings.items()
+                   if self.config["Prime95Custom"].get(option) != value}
+        if not changed:
+            return
+        try:
+            self.config["Prime95Custom"].update(changed)
+            save_config(self.config, self.config_file)
+            for option, value in changed.items():
+                print(f"Updated config.ini: [Prime95Custom] {option} = {value}")
+        except Exception as e:
+            print(f"Error writing to config.ini: {e}")
+            QtWidgets.QMessageBox.critical(self.app, "Error", f"Failed to update config: {str(e)}")
         print(f"Updated CPU support settings for button {button_id} in [Prime95Custom]")
 
     def update_mode(self, index):
@@ -400,8 +662,7 @@ class Prime95Settings:
             if section not in self.config:
                 self.config[section] = {}
             self.config[section][option] = str(value)
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            save_config(self.config, self.config_file)
             print(f"Updated config.ini: [{section}] {option} = {value}")
         except Exception as e:
             print(f"Error writing to config.ini: {e}")
@@ -426,257 +687,68 @@ class YCruncherSettings:
         self.setup_yCruncher_settings()
 
     def setup_yCruncher_settings(self):
-        """Set up all yCruncher-related settings and connect signals."""
+        """Set up the yCruncher settings that aren't plain rows of widget_bindings()."""
         if "yCruncher" not in self.config:
             self.config["yCruncher"] = {}
 
         self.setup_mode_settings()
-        self.setup_tests_settings()  # For checkBox_29 to checkBox_38
-        self.setup_old_tests_settings()  # New method for checkBox_39 to checkBox_47
         self.setup_test_duration_settings()
-        self.setup_logging_wrapper_settings()
         self.setup_memory_settings()
 
     def setup_mode_settings(self):
-        """Set up radio buttons (10-22) for the 'mode' setting in [yCruncher]."""
-        self.mode_map = {
-            10: "04-P4P",
-            11: "05-A64 ~ Kasumi",
-            12: "08-NHM ~ Ushio",
-            13: "11-SNB ~ Hina",
-            14: "12-BD2 ~ Miyu",
-            15: "13-HSW ~ Airi",
-            16: "14-BDW ~ Kurumi",
-            17: "17-SKX ~ Kotori",
-            18: "17-ZN1 ~ Yukina",
-            19: "18-CNL ~ Shinoa",
-            20: "19-ZN2 ~ Kagari",
-            21: "22-ZN4 ~ Kizuna",
-            22: "24-ZN5 ~ Komari"
-        }
-        
+        """Group radio buttons (10-22) for the 'mode' setting, the values are bound in widget_bindings()."""
         self.mode_group = QtWidgets.QButtonGroup(self.app)
-        
-        for i in range(10, 23):
-            rb_name = f"radioButton_{i}"
-            if hasattr(self.app, rb_name):
-                self.mode_group.addButton(getattr(self.app, rb_name), id=i)
-            else:
-                print(f"Warning: {rb_name} not found in the UI")
-        
-        self.mode_group.buttonToggled.connect(self.update_mode_config)
-        self.set_initial_mode_state()
-
-    def setup_tests_settings(self):
-        """Set up checkboxes (29-38) for the 'tests' setting in [yCruncher] when radioButton_4 is selected."""
-        self.tests_map = {
-            29: "BKT",
-            30: "BBP",
-            31: "SFT",
-            32: "SFTv4",
-            33: "SNT",
-            34: "SVT",
-            35: "FFT",
-            36: "FFTv4",
-            37: "N63",
-            38: "VT3"
-        }
-        
-        for i in range(29, 39):
-            cb_name = f"checkBox_{i}"
-            if hasattr(self.app, cb_name):
-                checkbox = getattr(self.app, cb_name)
-                checkbox.stateChanged.connect(self.update_tests_config)
-            else:
-                print(f"Warning: {cb_name} not found in the UI")
-        
-        self.set_initial_tests_state()
-
-    def setup_old_tests_settings(self):
-        """Set up checkboxes (39-47) for the 'tests' setting in [yCruncher] when radioButton_5 is selected."""
-        self.old_tests_map = {
-            39: "BKT",
-            40: "BBP",
-            41: "SFT",
-            42: "FFT",
-            43: "N32",
-            44: "N64",
-            45: "HNT",
-            46: "VST",
-            47: "C17"
-        }
-        
-        for i in range(39, 48):
-            cb_name = f"checkBox_{i}"
-            if hasattr(self.app, cb_name):
-                checkbox = getattr(self.app, cb_name)
-                checkbox.stateChanged.connect(self.update_old_tests_config)
-            else:
-                print(f"Warning: {cb_name} not found in the UI")
-        
-        self.set_initial_old_tests_state()
+        for index in range(len(YCRUNCHER_MODES)):
+            self.mode_group.addButton(getattr(self.app, f"radioButton_{10 + index}"), id=10 + index)
 
-    def set_initial_tests_state(self):
-        """Set the initial state of the checkboxes (29-38) based on the config."""
-        current_tests = self.config["yCruncher"].get("tests", "")
-        selected_tests = [test.strip() for test in current_tests.split(",") if test.strip()]
-        
-        for cb_id, test in self.tests_map.items():
-            cb_name = f"checkBox_{cb_id}"
-            if hasattr(self.app, cb_name):
-                checkbox = getattr(self.app, cb_name)
-                checkbox.setChecked(test in selected_tests)
-
-    def set_initial_old_tests_state(self):
-        """Set the initial state of the checkboxes (39-47) based on the config."""
-        current_tests = self.config["yCruncher"].get("tests", "")
-        selected_tests = [test.strip() for test in current_tests.split(",") if test.strip()]
-        
-        for cb_id, test in self.old_tests_map.items():
-            cb_name = f"checkBox_{cb_id}"
-            if hasattr(self.app, cb_name):
-                checkbox = getattr(self.app, cb_name)
-                checkbox.setChecked(test in selected_tests)
+        # Unknown modes fall back to the first button
+        if self.config["yCruncher"].get("mode", "04-P4P") not in YCRUNCHER_MODES:
+            self.app.radioButton_10.setChecked(True)
 
     def setup_test_duration_settings(self):
-        """Set up spinBox_8 for the 'testDuration' setting in [yCruncher]."""
-        if hasattr(self.app, "spinBox_8"):
-            self.app.spinBox_8.setMinimum(1)
-            self.app.spinBox_8.setMaximum(6000)
-            current_duration = self.config["yCruncher"].getint("testDuration", 60)
-            if current_duration < 1:
-                current_duration = 1
-            elif current_duration > 6000:
-                current_duration = 6000
-            self.app.spinBox_8.setValue(current_duration)
-            self.app.spinBox_8.valueChanged.connect(self.update_test_duration)
-        else:
-            print("Warning: spinBox_8 not found in the UI")
-
-    def setup_logging_wrapper_settings(self):
-        """Set up checkBox_49 for the 'enableycruncherloggingwrapper' setting in [yCruncher]."""
-        if hasattr(self.app, "checkBox_49"):
-            current_state = self.config["yCruncher"].getboolean("enableycruncherloggingwrapper", False)
-            self.app.checkBox_49.setChecked(current_state)
-            self.app.checkBox_49.stateChanged.connect(self.update_logging_wrapper)
-        else:
-            print("Warning: checkBox_49 not found in the UI")
+        """Set the range of spinBox_8 for the 'testDuration' setting in [yCruncher]."""
+        self.app.spinBox_8.setMinimum(1)
+        self.app.spinBox_8.setMaximum(6000)
 
     def setup_memory_settings(self):
         """Set up doubleSpinBox_2 and checkBox_48 for the 'memory' setting in [yCruncher]."""
-        if hasattr(self.app, "doubleSpinBox_2"):
-            # Set range: 0 to 1024
-            self.app.doubleSpinBox_2.setMinimum(0)
-            self.app.doubleSpinBox_2.setMaximum(1024)
-            
-            # Set initial value, default to 256 if not "Default"
-            current_memory = self.config["yCruncher"].get("memory", "256")
-            if current_memory != "Default":
-                try:
-                    memory_value = float(current_memory)
-                    if memory_value < 0:
-                        memory_value = 0
-                    elif memory_value > 1024:
-                        memory_value = 1024
-                    self.app.doubleSpinBox_2.setValue(memory_value)
-                except ValueError:
-                    self.app.doubleSpinBox_2.setValue(256)  # Fallback to 256 if invalid
-            else:
-                self.app.doubleSpinBox_2.setValue(256)  # Default value when "Default" is set
-            
-            # Connect signal
-            self.app.doubleSpinBox_2.valueChanged.connect(self.update_memory_config)
-        else:
-            print("Warning: doubleSpinBox_2 not found in the UI")
-
-        if hasattr(self.app, "checkBox_48"):
-            # Set initial state: checked if "Default", unchecked otherwise
-            current_memory = self.config["yCruncher"].get("memory", "256")
-            self.app.checkBox_48.setChecked(current_memory == "Default")
-            
-            # Connect signal
-            self.app.checkBox_48.stateChanged.connect(self.update_memory_config)
-        else:
-            print("Warning: checkBox_48 not found in the UI")
-
-    def set_initial_mode_state(self):
-        """Set the initial state of the radio buttons based on the config."""
-        current_mode = self.config["yCruncher"].get("mode", "04-P4P")
-        reverse_map = {v: k for k, v in self.mode_map.items()}
-        
-        if current_mode in reverse_map:
-            button_id = reverse_map[current_mode]
-            if hasattr(self.app, f"radioButton_{button_id}"):
-                getattr(self.app, f"radioButton_{button_id}").setChecked(True)
-        else:
-            if hasattr(self.app, "radioButton_10"):
-                self.app.radioButton_10.setChecked(True)
+        # Set range: 0 to 1024
+        self.app.doubleSpinBox_2.setMinimum(0)
+        self.app.doubleSpinBox_2.setMaximum(1024)
 
-    def update_mode_config(self, button, checked):
-        """Update the 'mode' setting in [yCruncher] based on the selected radio button."""
-        if not checked:
-            return
-        
-        button_id = self.mode_group.id(button)
-        selected_mode = self.mode_map.get(button_id, "04-P4P")
-        self.update_config("yCruncher", "mode", selected_mode)
-        print(f"Updated yCruncher mode to: {selected_mode}")
-
-    def update_tests_config(self):
-        """Update the 'tests' setting in [yCruncher] based on selected checkboxes, only if radioButton_4 is selected."""
-        if hasattr(self.app, "radioButton_4") and self.app.radioButton_4.isChecked():
-            selected_tests = []
-            for cb_id, test in self.tests_map.items():
-                cb_name = f"checkBox_{cb_id}"
-                if hasattr(self.app, cb_name):
-                    checkbox = getattr(self.app, cb_name)
-                    if checkbox.isChecked():
-                        selected_tests.append(test)
-            
-            tests_string = ", ".join(selected_tests) if selected_tests else ""
-            self.update_config("yCruncher", "tests", tests_string)
-            print(f"Updated yCruncher tests to: {tests_string} (radioButton_4 selected)")
-        else:
-            print("yCruncher not selected (radioButton_4), skipping tests update.")
-
-    def update_old_tests_config(self):
-        """Update the 'tests' setting in [yCruncher] based on selected checkboxes, only if radioButton_5 is selected."""
-        if hasattr(self.app, "radioButton_5") and self.app.radioButton_5.isChecked():
-            selected_tests = []
-            for cb_id, test in self.old_tests_map.items():
-                cb_name = f"checkBox_{cb_id}"
-                if hasattr(self.app, cb_name):
-                    checkbox = getattr(self.app, cb_name)
-                    if checkbox.isChecked():
-                        selected_tests.append(test)
-            
-            tests_string = ", ".join(selected_tests) if selected_tests else ""
-            self.update_config("yCruncher", "tests", tests_string)
-            print(f"Updated yCruncher tests to: {tests_string} (radioButton_5 selected)")
+        # Set initial value, default to 256 if not "Default"
+        current_memory = self.config["yCruncher"].get("memory", "256")
+        if current_memory != "Default":
+            try:
+                if re.search(r"[a-zA-Z]", current_memory):
+                    # "64MB", "1.5 GiB": the field is in MB
+                    memory_value = sizing.parse_byte_size(current_memory) / 1000 ** 2
+                else:
+                    memory_value = float(current_memory)
+                if memory_value < 0:
+                    memory_value = 0
+                elif memory_value > 1024:
+                    memory_value = 1024
+                self.app.doubleSpinBox_2.setValue(memory_value)
+            except (TypeError, ValueError):
+                self.app.doubleSpinBox_2.setValue(256)  # Fallback to 256 if invalid
         else:
-            print("yCruncher Old not selected (radioButton_5), skipping tests update.")
+            self.app.doubleSpinBox_2.setValue(256)  # Default value when "Default" is set
 
-    def update_test_duration(self, value):
-        """Update the 'testDuration' setting in [yCruncher] based on spinBox_8 value."""
-        self.update_config("yCruncher", "testDuration", value)
-        print(f"Updated yCruncher testDuration to: {value}")
+        # Set initial state: checked if "Default", unchecked otherwise
+        self.app.checkBox_48.setChecked(current_memory == "Default")
 
-    def update_logging_wrapper(self, state):
-        """Update the 'enableycruncherloggingwrapper' setting in [yCruncher] based on checkBox_49 state."""
-        value = "1" if state else "0"
-        self.update_config("yCruncher", "enableycruncherloggingwrapper", value)
-        print(f"Updated yCruncher enableycruncherloggingwrapper to: {value}")
+        self.app.bindings.add(self.app.doubleSpinBox_2.valueChanged, self.update_memory_config)
+        self.app.bindings.add(self.app.checkBox_48.stateChanged, self.update_memory_config)
 
     def update_memory_config(self):
         """Update the 'memory' setting in [yCruncher] based on doubleSpinBox_2 and checkBox_48."""
-        if hasattr(self.app, "checkBox_48") and self.app.checkBox_48.isChecked():
+        if self.app.checkBox_48.isChecked():
             memory_value = "Default"
         else:
-            if hasattr(self.app, "doubleSpinBox_2"):
-                memory_value = self.app.doubleSpinBox_2.value()
-            else:
-                memory_value = 256  # Fallback if doubleSpinBox_2 is missing
-        
+            # The script reads a plain number as bytes
+            memory_value = f"{self.app.doubleSpinBox_2.value():g}MB"
+
         self.update_config("yCruncher", "memory", memory_value)
         print(f"Updated yCruncher memory to: {memory_value}")
 
@@ -686,8 +758,7 @@ class YCruncherSettings:
             if section not in self.config:
                 self.config[section] = {}
             self.config[section][option] = str(value)
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            save_config(self.config, self.config_file)
             print(f"Updated config.ini: [{section}] {option} = {value}")
         except Exception as e:
             print(f"Error writing to config.ini: {e}")
@@ -704,69 +775,13 @@ class Aida64Settings:
         self.setup_aida64_settings()
 
     def setup_aida64_settings(self):
-        """Set up the Aida64 settings and connect checkbox and spinbox signals."""
+        """Set up the Aida64 settings; mode, useAVX and maxMemory are bound in widget_bindings()."""
         # Ensure [Aida64] section exists in config
         if "Aida64" not in self.config:
             self.config["Aida64"] = {}
 
-        # Load initial mode from config
-        initial_mode = self.config["Aida64"].get("mode", "CACHE")
-        mode_list = [m.strip()for m in initial_mode.split(",")]
-
-        # Map checkboxes to their corresponding mode values
-        self.checkbox_map = {
-            "CACHE": self.app.checkBox_24,
-            "CPU": self.app.checkBox_25,
-            "FPU": self.app.checkBox_26,
-            "RAM": self.app.checkBox_27
-        }
-
-        # Set initial checkbox states based on config
-        for mode, checkbox in self.checkbox_map.items():
-            checkbox.setChecked(mode in mode_list)
-
-        # Connect checkbox signals to update_config method
-        self.app.checkBox_24.stateChanged.connect(self.update_mode)
-        self.app.checkBox_25.stateChanged.connect(self.update_mode)
-        self.app.checkBox_26.stateChanged.connect(self.update_mode)
-        self.app.checkBox_27.stateChanged.connect(self.update_mode)
-
-        # Load and set initial state for useavx checkbox (checkBox_28)
-        use_avx = self.config["Aida64"].getboolean("useavx", fallback=False)
-        self.app.checkBox_28.setChecked(use_avx)
-        # Connect checkBox_28 signal to update_useavx method
-        self.app.checkBox_28.stateChanged.connect(self.update_useavx)
-
-        # Load and set initial value for maxmemory spinbox (spinBox_7)
-        max_memory = self.config["Aida64"].getint("maxmemory", fallback=90)
-        self.app.spinBox_7.setRange(0, 100)  # Set range from 0 to 100
-        self.app.spinBox_7.setValue(max_memory)  # Set initial value
-        # Connect spinBox_7 signal to update_maxmemory method
-        self.app.spinBox_7.valueChanged.connect(self.update_maxmemory)
-
-    def update_mode(self):
-        """Update the 'mode' setting in [Aida64] section based on checkbox states."""
-        selected_modes = []
-        for mode, checkbox in self.checkbox_map.items():
-            if checkbox.isChecked():
-                selected_modes.append(mode)
-
-        # If no modes are selected, default to "CACHE"
-        if not selected_modes:
-            selected_modes.append("CACHE")
-
-        # Join selected modes with commas
-        mode_value = ", ".join(selected_modes)
-        self.update_config("mode", mode_value)
-
-    def update_useavx(self, state):
-        """Update the 'useavx' setting in [Aida64] section based on checkBox_28 state."""
-        value = 1 if state else 0
-        self.update_config("useavx", value)
-
-    def update_maxmemory(self, value):
-        """Update the 'maxmemory' setting in [Aida64] section based on spinBox_7 value."""
-        self.update_config("maxmemory", value)
+        # Set range of the maxmemory spinbox (spinBox_7) from 0 to 100
+        self.app.spinBox_7.setRange(0, 100)
 
     def update_config(self, option, value):
         """Update a setting in the [Aida64] section of config.ini and save it."""
@@ -774,8 +789,7 @@ class Aida64Settings:
             if "Aida64" not in self.config:
                 self.config["Aida64"] = {}
             self.config["Aida64"][option] = str(value)
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            save_config(self.config, self.config_file)
             print(f"Updated config.ini: [Aida64] {option} = {value}")
         except Exception as e:
             print(f"Error writing to config.ini: {e}")
@@ -795,8 +809,7 @@ class GeneralSettings:
             if "General" not in self.config:
                 self.config["General"] = {}
             self.config["General"][option] = str(value)
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            save_config(self.config, self.config_file)
             print(f"Updated config.ini: [General] {option} = {value}")
         except Exception as e:
             print(f"Error writing to config.ini: {e}")
@@ -808,14 +821,6 @@ class GeneralSettings:
         selected_program = self.config["General"].get("stressTestProgram", "PRIME95")
         return selected_program
 
-    def load_checkbox_settings(self, checkboxes):
-        """Load checkbox settings from [General] section."""
-        settings = {}
-        for option, checkbox in checkboxes.items():
-            value = self.config.get("General", option, fallback="0")
-            settings[option] = value == "1"
-        return settings
-
     def get_runtime_per_core(self):
         """Get runtimePerCore setting from [General] section."""
         return self.config["General"].get("runtimePerCore", "auto")
@@ -831,17 +836,17 @@ class GeneralSettings:
         # Load and set up spinBox_12 for maxIterations
         max_iterations = self.config.getint("General", "maxIterations", fallback=5)
         self.app.spinBox_12.setValue(max_iterations)
-        self.app.spinBox_12.valueChanged.connect(self.update_max_iterations)
+        self.app.bindings.add(self.app.spinBox_12.valueChanged, self.update_max_iterations)
 
         # Load and set up spinBox_2 for delayBetweenCores
         delay_between_cores = self.config.getint("General", "delayBetweenCores", fallback=15)
         self.app.spinBox_2.setValue(delay_between_cores)
-        self.app.spinBox_2.valueChanged.connect(self.update_delay_between_cores)
+        self.app.bindings.add(self.app.spinBox_2.valueChanged, self.update_delay_between_cores)
 
         # Load and set up lineEdit for coresToIgnore
         ignored_cores = self.config.get("General", "coresToIgnore", fallback="")
         self.app.lineEdit.setText(ignored_cores)
-        self.app.lineEdit.textChanged.connect(self.update_ignored_cores)
+        self.app.bindings.add(self.app.lineEdit.textChanged, self.update_ignored_cores)
 
         # Existing coreTestOrder setup
         self.setup_core_test_order_controls(app)
@@ -870,15 +875,17 @@ class GeneralSettings:
             1: "Alternate",
             2: "Sequential",
             3: "Random",
-            4: "Custom"
+            4: "Custom",
+            5: "Interleaved"
         }
         
         # Reverse map for setting comboBox_1 index
-        reverse_map = {v: k for k, v in self.order_map.items()}
+        # "Interleaved" is saved as a custom list, the script doesn't know it
+        self.order_index = {v: k for k, v in self.order_map.items() if v != "Interleaved"}
 
         # Set initial state of comboBox_1 and lineEdit_6
-        if core_test_order in reverse_map:
-            app.comboBox_1.setCurrentIndex(reverse_map[core_test_order])
+        if core_test_order in self.order_index:
+            app.comboBox_1.setCurrentIndex(self.order_index[core_test_order])
             if core_test_order != "Custom":
                 app.lineEdit_6.setText("")  # Clear lineEdit_6 for predefined options
             else:
@@ -889,10 +896,10 @@ class GeneralSettings:
             app.lineEdit_6.setText(core_test_order)  # Display custom value
 
         # Connect lineEdit_6 signal
-        app.lineEdit_6.textChanged.connect(self.update_core_test_order_from_lineedit)
+        app.bindings.add(app.lineEdit_6.textChanged, self.update_core_test_order_from_lineedit)
 
         # Connect comboBox_1 signal
-        app.comboBox_1.currentIndexChanged.connect(self.update_core_test_order_from_combobox)
+        app.bindings.add(app.comboBox_1.currentIndexChanged, self.update_core_test_order_from_combobox)
 
     def update_core_test_order_from_lineedit(self, text):
         """Update coreTestOrder from lineEdit_6 input when comboBox_1 is on Custom."""
@@ -910,10 +917,59 @@ class GeneralSettings:
             # Use the current text in lineEdit_6, or "Custom" if empty
             custom_value = self.app.lineEdit_6.text().strip()
             self.update_config("coreTestOrder", custom_value if custom_value else "Custom")
+        elif value == "Interleaved":
+            self.apply_interleaved_order()
         else:
             self.update_config("coreTestOrder", value)
             self.app.lineEdit_6.setText("")  # Clear lineEdit_6 for non-Custom options
 
+    def get_core_clusters(self):
+        """
+        Get the CCD / cluster groups of the cores.
+
+        A topology.ini file takes precedence over the topology detected by APICID.exe.
+
+        Returns:
+            dict: {cluster name: [cores]}, or None if the topology is unknown
+        """
+        clusters = topology.load_topology_file()
+        if clusters:
+            cluster_to_cores = {}
+            for core in sorted(clusters):
+                cluster_to_cores.setdefault(clusters[core], []).append(core)
+            return cluster_to_cores
+        if self.app.topology is not None:
+            return self.app.topology.cluster_to_cores
+        return None
+
+    def apply_interleaved_order(self):
+        """Save a core order that takes turns between the CCDs / clusters as a custom coreTestOrder."""
+        cluster_to_cores = self.get_core_clusters()
+        if not cluster_to_cores:
+            QtWidgets.QMessageBox.warning(
+                self.app, "Unknown Topology",
+                "The CPU topology is unknown.\n\n"
+                f"Run APICID from the Tools tab or describe the CCDs in {topology.TOPOLOGY_FILE}."
+            )
+            # Nothing was saved, so show the saved order again
+            saved_order = self.config.get("General", "coreTestOrder", fallback="Default")
+            self.app.comboBox_1.blockSignals(True)
+            self.app.comboBox_1.setCurrentIndex(self.order_index.get(saved_order, 4))
+            self.app.comboBox_1.blockSignals(False)
+            return
+
+        cores_to_ignore = [int(core) for core in re.findall(r"\d+", self.app.lineEdit.text())]
+        results = topology.compare_core_orders(cluster_to_cores, cores_to_ignore)
+        order = next(order for name, order, score in results if name == "Interleaved")
+        value = ", ".join(str(core) for core in order)
+
+        self.app.lineEdit_6.setText(value)
+        self.update_config("coreTestOrder", value)
+
+        scores = ", ".join(f"{name} {score:.2f}" for name, order, score in results)
+        self.app.comboBox_1.setToolTip(f"Predicted thermal adjacency (lower is better): {scores}")
+        self.app.statusbar.showMessage(f"Interleaved core order saved. Thermal adjacency: {scores}", 10000)
+
 # ===========================================
 # AutomatedSettings Class (already in main.py)
 # ===========================================
@@ -945,16 +1001,16 @@ class AutomatedSettings:
             self.app.lineEdit_3.setText(start_values)
 
         # Connect checkbox signals
-        self.app.checkBox_1.stateChanged.connect(lambda state: self.update_config("enableAutomaticAdjustment", 1 if state else 0))
-        self.app.checkBox_17.stateChanged.connect(lambda state: self.update_config("repeatCoreOnError", 1 if state else 0))
-        self.app.checkBox_18.stateChanged.connect(lambda state: self.update_config("enableResumeAfterUnexpectedExit", 1 if state else 0))
+        self.app.bindings.add(self.app.checkBox_1.stateChanged, lambda state: self.update_config("enableAutomaticAdjustment", 1 if state else 0))
+        self.app.bindings.add(self.app.checkBox_17.stateChanged, lambda state: self.update_config("repeatCoreOnError", 1 if state else 0))
+        self.app.bindings.add(self.app.checkBox_18.stateChanged, lambda state: self.update_config("enableResumeAfterUnexpectedExit", 1 if state else 0))
         
         # Connect spin box signals
-        self.app.spinBox_11.valueChanged.connect(lambda value: self.update_config("maxValue", value))
-        self.app.spinBox_10.valueChanged.connect(lambda value: self.update_config("incrementBy", value))
+        self.app.bindings.add(self.app.spinBox_11.valueChanged, lambda value: self.update_config("maxValue", value))
+        self.app.bindings.add(self.app.spinBox_10.valueChanged, lambda value: self.update_config("incrementBy", value))
 
         # Connect lineEdit_3 signal
-        self.app.lineEdit_3.textChanged.connect(self.update_start_values)
+        self.app.bindings.add(self.app.lineEdit_3.textChanged, self.update_start_values)
 
     def update_config(self, option, value):
         """Update a setting in the [AutomaticTestMode] section of config.ini and save it."""
@@ -962,8 +1018,7 @@ class AutomatedSettings:
             if "AutomaticTestMode" not in self.config:
                 self.config["AutomaticTestMode"] = {}
             self.config["AutomaticTestMode"][option] = str(value)
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            save_config(self.config, self.config_file)
             print(f"Updated config.ini: [AutomaticTestMode] {option} = {value}")
         except Exception as e:
             print(f"Error writing to config.ini: {e}")
@@ -975,6 +1030,1746 @@ class AutomatedSettings:
             value = "Default"
         self.update_config("startValues", value)
 
+# ===========================================
+# TextReportDialog Class
+# ===========================================
+class TextReportDialog(QtWidgets.QDialog):
+    def __init__(self, title, text, parent=None):
+        """
+        Read-only dialog for showing a text report.
+
+        Args:
+            title (str): Window title
+            text (str): The report
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.resize(640, 480)
+        self.text_edit = QtWidgets.QPlainTextEdit(self)
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        font = self.text_edit.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.text_edit.setFont(font)
+        self.text_edit.setPlainText(text)
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.text_edit)
+        layout.addWidget(close_button, alignment=QtCore.Qt.AlignRight)
+
+
+# ===========================================
+# ProcessLauncher Class
+# ===========================================
+def is_user_admin():
+    """Check whether the GUI itself is running with admin rights."""
+    if os.name != "nt":
+        return os.geteuid() == 0
+    import ctypes
+    try:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
+        return False
+
+
+def shell_execute_elevated(program, arguments, working_dir):
+    """
+    Start a program with the "runas" verb (UAC prompt) and return its process handle.
+
+    This is what "Start-Process -Verb RunAs" does, minus the PowerShell instance.
+    Blocks while the UAC prompt is shown, so call it from a worker thread.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class SHELLEXECUTEINFOW(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("fMask", wintypes.ULONG),
+            ("hwnd", wintypes.HWND),
+            ("lpVerb", wintypes.LPCWSTR),
+            ("lpFile", wintypes.LPCWSTR),
+            ("lpParameters", wintypes.LPCWSTR),
+            ("lpDirectory", wintypes.LPCWSTR),
+            ("nShow", ctypes.c_int),
+            ("hInstApp", wintypes.HINSTANCE),
+            ("lpIDList", ctypes.c_void_p),
+            ("lpClass", wintypes.LPCWSTR),
+            ("hkeyClass", wintypes.HKEY),
+            ("dwHotKey", wintypes.DWORD),
+            ("hIconOrMonitor", wintypes.HANDLE),
+            ("hProcess", wintypes.HANDLE),
+        ]
+
+    SEE_MASK_NOCLOSEPROCESS = 0x00000040
+    SW_SHOWNORMAL = 1
+    info = SHELLEXECUTEINFOW()
+    info.cbSize = ctypes.sizeof(info)
+    info.fMask = SEE_MASK_NOCLOSEPROCESS
+    info.lpVerb = "runas"
+    info.lpFile = program
+    info.lpParameters = subprocess.list2cmdline(arguments)
+    info.lpDirectory = working_dir
+    info.nShow = SW_SHOWNORMAL
+    if not ctypes.windll.shell32.ShellExecuteExW(ctypes.byref(info)):
+        raise ctypes.WinError()
+    return info.hProcess
+
+
+def poll_process_handle(handle):
+    """Return the exit code of a finished process handle, or None if it is still running."""
+    import ctypes
+    WAIT_OBJECT_0 = 0
+    kernel32 = ctypes.windll.kernel32
+    if kernel32.WaitForSingleObject(handle, 0) != WAIT_OBJECT_0:
+        return None
+    exit_code = ctypes.c_ulong()
+    kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+    kernel32.CloseHandle(handle)
+    return exit_code.value
+
+
+class ProcessLauncher(QtCore.QObject):
+    """
+    Shared, non-blocking launcher for the external tools.
+
+    Children are started directly (no intermediate shell). When admin rights
+    are needed and the GUI doesn't have them, the UAC prompt is raised from a
+    worker thread so the UI never waits on it. Every launch is recorded with
+    its status, exit code, start latency and the last lines of its output.
+    """
+    process_started = QtCore.pyqtSignal(dict)
+    process_finished = QtCore.pyqtSignal(dict)
+    output_received = QtCore.pyqtSignal(dict, str)
+    elevated_started = QtCore.pyqtSignal(dict, object, str)
+
+    MAX_OUTPUT_LINES = 500
+    POLL_INTERVAL_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records = []
+        self.is_admin = is_user_admin()
+        self.elevated_handles = {}
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(self.poll_elevated_processes)
+        self.elevated_started.connect(self.on_elevated_started)
+
+    def launch(self, name, program, arguments=None, working_dir=None, elevated=False, callback=None):
+        """
+        Start a program and return its record.
+
+        Args:
+            name (str): Display name of the tool
+            program (str): Path to the executable or batch file
+            arguments (list): Command line arguments
+            working_dir (str): Working directory, defaults to the program's directory
+            elevated (bool): Whether the program needs admin rights
+            callback (callable): Called with the record once the process has ended
+
+        Returns:
+            dict: The launch record, updated in place as the process runs
+        """
+        arguments = list(arguments or [])
+        program = os.path.abspath(program)
+        if not os.path.exists(program):
+            raise FileNotFoundError(f"Could not find {program}")
+        if working_dir is None:
+            working_dir = os.path.dirname(program)
+
+        record = {
+            "name": name,
+            "program": program,
+            "status": "starting",
+            "exit_code": None,
+            "start_latency": None,
+            "launched_at": time.perf_counter(),
+            "output": collections.deque(maxlen=self.MAX_OUTPUT_LINES),
+            "callback": callback,
+        }
+        self.records.append(record)
+
+        if elevated and not self.is_admin and os.name == "nt":
+            record["status"] = "waiting for UAC"
+            thread = threading.Thread(
+                target=self.run_elevated, args=(record, program, arguments, working_dir), daemon=True
+            )
+            thread.start()
+            return record
+
+        if program.lower().endswith((".bat", ".cmd")):
+            # Batch files need cmd.exe to run, there's no way around that one
+            arguments = ["/c", program] + arguments
+            program = os.environ.get("COMSPEC", "cmd.exe")
+
+        process = QtCore.QProcess(self)
+        process.setWorkingDirectory(working_dir)
+        record["process"] = process
+        process.started.connect(lambda: self.on_started(record))
+        process.readyReadStandardOutput.connect(
+            lambda: self.on_output(record, process.readAllStandardOutput())
+        )
+        process.readyReadStandardError.connect(
+            lambda: self.on_output(record, process.readAllStandardError())
+        )
+        process.finished.connect(lambda exit_code, exit_status: self.on_finished(record, exit_code, exit_status))
+        process.errorOccurred.connect(lambda error: self.on_error(record, error))
+        process.start(program, arguments)
+        process.closeWriteChannel()  # Nothing is ever sent, so "press any key" prompts don't hang
+        return record
+
+    def run_elevated(self, record, program, arguments, working_dir):
+        """Worker thread: raise the UAC prompt and hand the process handle back to the UI thread."""
+        try:
+            handle = shell_execute_elevated(program, arguments, working_dir)
+            self.elevated_started.emit(record, handle, "")
+        except Exception as e:
+            self.elevated_started.emit(record, None, str(e))
+
+    def on_elevated_started(self, record, handle, error):
+        if error:
+            record["status"] = "failed to start"
+            print(f"Error launching {record['name']}: {error}")
+            self.emit_finished(record)
+            return
+        self.on_started(record)
+        if handle:
+            self.elevated_handles[id(record)] = (record, handle)
+            self.poll_timer.start()
+
+    def poll_elevated_processes(self):
+        for key, (record, handle) in list(self.elevated_handles.items()):
+            exit_code = poll_process_handle(handle)
+            if exit_code is not None:
+                del self.elevated_handles[key]
+                self.record_exit(record, exit_code)
+        if not self.elevated_handles:
+            self.poll_timer.stop()
+
+    def on_started(self, record):
+        record["status"] = "running"
+        record["start_latency"] = time.perf_counter() - record["launched_at"]
+        print(f"Launched {record['name']} in {record['start_latency'] * 1000:.0f} ms")
+        self.process_started.emit(record)
+
+    def on_output(self, record, data):
+        text = bytes(data).decode("utf-8", errors="replace")
+        for line in text.splitlines():
+            if line.strip():
+                record["output"].append(line)
+                self.output_received.emit(record, line)
+
+    def on_finished(self, record, exit_code, exit_status):
+        if exit_status == QtCore.QProcess.CrashExit:
+            record["status"] = "crashed"
+            record["exit_code"] = exit_code
+            print(f"{record['name']} crashed")
+            self.emit_finished(record)
+            return
+        self.record_exit(record, exit_code)
+
+    def record_exit(self, record, exit_code):
+        record["status"] = "finished"
+        record["exit_code"] = exit_code
+        print(f"{record['name']} exited with code {exit_code}")
+        self.emit_finished(record)
+
+    def emit_finished(self, record):
+        if record["callback"] is not None:
+            record["callback"](record)
+        self.process_finished.emit(record)
+
+    def on_error(self, record, error):
+        if error == QtCore.QProcess.FailedToStart:
+            record["status"] = "failed to start"
+            print(f"Error launching {record['name']}: {record['process'].errorString()}")
+            self.emit_finished(record)
+
+
+class ProcessMonitorDialog(QtWidgets.QDialog):
+    def __init__(self, launcher, parent=None):
+        """
+        Dialog listing every tool launched in this session and its output.
+
+        Args:
+            launcher (ProcessLauncher): The launcher whose records are shown
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.launcher = launcher
+        self.setWindowTitle("Processes")
+        self.resize(640, 420)
+
+        self.table = QtWidgets.QTableWidget(0, 4, self)
+        self.table.setHorizontalHeaderLabels(["Tool", "Status", "Exit Code", "Start Latency"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.output = QtWidgets.QPlainTextEdit(self)
+        self.output.setReadOnly(True)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addWidget(self.output)
+
+        self.table.currentCellChanged.connect(lambda *args: self.show_output())
+        self.launcher.process_started.connect(self.refresh)
+        self.launcher.process_finished.connect(self.refresh)
+        self.launcher.output_received.connect(self.on_output)
+        self.refresh()
+
+    def done(self, result):
+        # The launcher outlives the dialog, so drop the connections made in __init__
+        self.launcher.process_started.disconnect(self.refresh)
+        self.launcher.process_finished.disconnect(self.refresh)
+        self.launcher.output_received.disconnect(self.on_output)
+        super().done(result)
+
+    def refresh(self, *args):
+        records = self.launcher.records
+        self.table.setRowCount(len(records))
+        for row, record in enumerate(records):
+            latency = record["start_latency"]
+            values = [
+                record["name"],
+                record["status"],
+                "" if record["exit_code"] is None else str(record["exit_code"]),
+                "" if latency is None else f"{latency * 1000:.0f} ms",
+            ]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+        self.show_output()
+
+    def show_output(self):
+        row = self.table.currentRow()
+        if 0 <= row < len(self.launcher.records):
+            self.output.setPlainText("\n".join(self.launcher.records[row]["output"]))
+
+    def on_output(self, record, line):
+        row = self.table.currentRow()
+        if 0 <= row < len(self.launcher.records) and self.launcher.records[row] is record:
+            self.output.appendPlainText(line)
+
+
+# ===========================================
+# RunQueue Class
+# ===========================================
+def is_process_running(pid):
+    """Check whether a process with the given ID is still alive."""
+    if os.name == "nt":
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        try:
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        finally:
+            kernel32.CloseHandle(handle)
+        return exit_code.value == STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def terminate_process_tree(pid):
+    """Terminate a process and all of its children."""
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+    else:
+        os.kill(pid, 15)
+
+
+class RunQueue(QtCore.QObject):
+    """
+    Run several config presets one after another.
+
+    For each entry, [General] useConfigFile is pointed at the preset and a
+    CoreCycler run is started. The run's log is then tailed until the script
+    terminates, fails or exceeds the entry's time budget, and the next entry
+    is started automatically.
+    """
+    entry_started = QtCore.pyqtSignal(int)
+    entry_finished = QtCore.pyqtSignal(int, str)
+    queue_finished = QtCore.pyqtSignal()
+
+    POLL_INTERVAL_MS = 5000
+    START_TIMEOUT_SECONDS = 180
+    DELAY_BETWEEN_ENTRIES_MS = 15000
+
+    PID_PATTERN = re.compile(r"The script process id \(PID\):\s+(\d+)")
+    ERROR_PATTERN = re.compile(r"^ERROR: At Core (\d+)")
+
+    def __init__(self, app, queue_file="runqueue.ini"):
+        """
+        Initialize the run queue.
+
+        Args:
+            app (CoreCyclerApp): Reference to the main application instance
+            queue_file (str): Path to the file the queue entries are stored in
+        """
+        super().__init__(app)
+        self.app = app
+        self.queue_file = queue_file
+        self.log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.entries = []
+        self.current_index = -1
+        self.running = False
+        self.original_config_file = ""
+        self.launch_time = None
+        self.current_log = None
+        self.current_tail = None
+        self.current_pid = None
+        self.current_errors = 0
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(self.POLL_INTERVAL_MS)
+        self.timer.timeout.connect(self.poll)
+        # Kept, so stopping the queue during the delay also cancels the next entry
+        self.next_entry_timer = QtCore.QTimer(self)
+        self.next_entry_timer.setSingleShot(True)
+        self.next_entry_timer.setInterval(self.DELAY_BETWEEN_ENTRIES_MS)
+        self.next_entry_timer.timeout.connect(self.start_next_entry)
+        self.load_entries()
+
+    def load_entries(self):
+        """Load the queue entries from the queue file."""
+        queue_config = configparser.ConfigParser()
+        queue_config.read(self.queue_file)
+        self.entries = []
+        for section in sorted(queue_config.sections(), key=lambda name: int(name) if name.isdigit() else 0):
+            self.entries.append({
+                "config_file": queue_config[section].get("configFile", ""),
+                "time_budget": queue_config[section].getint("timeBudget", fallback=60),
+                "status": "pending",
+            })
+
+    def save_entries(self):
+        """Save the queue entries to the queue file."""
+        queue_config = configparser.ConfigParser()
+        for index, entry in enumerate(self.entries, 1):
+            queue_config[str(index)] = {
+                "configFile": entry["config_file"],
+                "timeBudget": str(entry["time_budget"]),
+            }
+        try:
+            with open(self.queue_file, 'w') as queuefile:
+                queue_config.write(queuefile)
+        except Exception as e:
+            print(f"Error writing to {self.queue_file}: {e}")
+
+    def start(self):
+        """Start processing the queue from the first entry."""
+        if self.running or not self.entries:
+            return
+        for entry in self.entries:
+            entry["status"] = "pending"
+        self.running = True
+        self.original_config_file = self.app.general.get_config_file_path()
+        self.current_index = -1
+        self.start_next_entry()
+
+    def stop(self):
+        """Stop the queue, terminating the run that is currently in progress."""
+        if not self.running:
+            return
+        entry = self.entries[self.current_index] if 0 <= self.current_index < len(self.entries) else None
+        if entry is not None and entry["status"] in ("starting", "running"):
+            if self.current_pid is not None and is_process_running(self.current_pid):
+                terminate_process_tree(self.current_pid)
+            # Not running anymore, so finishing the entry doesn't schedule the next one
+            self.running = False
+            self.finish_entry("stopped")
+        self.finish_queue()
+
+    def start_next_entry(self):
+        """Point useConfigFile at the next entry and start CoreCycler."""
+        if not self.running:
+            return
+        self.current_index += 1
+        if self.current_index >= len(self.entries):
+            self.finish_queue()
+            return
+
+        entry = self.entries[self.current_index]
+        self.app.set_config_file_path(entry["config_file"])
+        self.launch_time = datetime.now().replace(microsecond=0)
+        self.current_log = None
+        self.current_tail = None
+        self.current_pid = None
+        self.current_errors = 0
+        entry["status"] = "starting"
+        self.app.launch_core_cycler()
+        print(f"Run queue: started entry {self.current_index + 1} ({entry['config_file']})")
+        self.entry_started.emit(self.current_index)
+        self.timer.start()
+
+    def poll(self):
+        """Check the current run's log and process for completion, failure or timeout."""
+        entry = self.entries[self.current_index]
+        elapsed = (datetime.now() - self.launch_time).total_seconds()
+
+        if self.current_tail is None:
+            # The log name holds the run start, which can't be earlier than our launch
+            self.current_log = loganalysis.find_newest_log(self.log_dir, since=self.launch_time)
+            if self.current_log is None:
+                if elapsed > self.START_TIMEOUT_SECONDS:
+                    self.finish_entry("failed to start")
+                return
+            self.current_tail = loganalysis.LogTail(self.current_log)
+            entry["status"] = "running"
+
+        for line in self.current_tail.read_lines():
+            match = self.PID_PATTERN.search(line)
+            if match:
+                self.current_pid = int(match.group(1))
+            elif self.ERROR_PATTERN.match(line):
+                self.current_errors += 1
+            elif line.startswith("FATAL ERROR"):
+                self.finish_entry("failed")
+                return
+            elif line.endswith(" - Terminating the script...") and not line.lstrip().startswith("+"):
+                self.finish_entry(f"completed ({self.current_errors} errors)")
+                return
+
+        if elapsed > entry["time_budget"] * 60:
+            if self.current_pid is None:
+                # The run can't be stopped without its PID, so don't start another one next to it
+                print("Run queue: the time budget was exceeded, but the script process id is unknown")
+                self.running = False
+                self.finish_entry(f"time budget exceeded, not stopped ({self.current_errors} errors)")
+                self.finish_queue()
+                return
+            terminate_process_tree(self.current_pid)
+            self.finish_entry(f"time budget exceeded ({self.current_errors} errors)")
+        elif self.current_pid is not None and not is_process_running(self.current_pid):
+            self.finish_entry("exited unexpectedly")
+
+    def finish_entry(self, status):
+        """Record the outcome of the current entry and schedule the next one."""
+        self.timer.stop()
+        if 0 <= self.current_index < len(self.entries):
+            self.entries[self.current_index]["status"] = status
+            print(f"Run queue: entry {self.current_index + 1} finished: {status}")
+            self.entry_finished.emit(self.current_index, status)
+        if self.running:
+            # Give the script time to close the stress test program before the next run
+            self.next_entry_timer.start()
+
+    def finish_queue(self):
+        """Restore the original useConfigFile setting once the queue is done."""
+        self.running = False
+        self.timer.stop()
+        self.next_entry_timer.stop()
+        self.app.set_config_file_path(self.original_config_file)
+        print("Run queue: finished")
+        self.queue_finished.emit()
+
+
+class RunQueueDialog(QtWidgets.QDialog):
+    def __init__(self, run_queue, parent=None):
+        """
+        Dialog to edit and start the run queue.
+
+        Args:
+            run_queue (RunQueue): The queue to edit
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.run_queue = run_queue
+        self.setWindowTitle("Run Queue")
+        self.resize(560, 360)
+
+        self.table = QtWidgets.QTableWidget(0, 3, self)
+        self.table.setHorizontalHeaderLabels(["Config File", "Time Budget (min)", "Status"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+
+        self.add_button = QtWidgets.QPushButton("Add...", self)
+        self.remove_button = QtWidgets.QPushButton("Remove", self)
+        self.up_button = QtWidgets.QPushButton("Up", self)
+        self.down_button = QtWidgets.QPushButton("Down", self)
+        self.start_button = QtWidgets.QPushButton("Start Queue", self)
+        self.stop_button = QtWidgets.QPushButton("Stop Queue", self)
+
+        button_layout = QtWidgets.QHBoxLayout()
+        for button in (self.add_button, self.remove_button, self.up_button, self.down_button):
+            button_layout.addWidget(button)
+        button_layout.addStretch()
+        button_layout.addWidget(self.start_button)
+        button_layout.addWidget(self.stop_button)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addLayout(button_layout)
+
+        self.add_button.clicked.connect(self.add_entry)
+        self.remove_button.clicked.connect(self.remove_entry)
+        self.up_button.clicked.connect(lambda: self.move_entry(-1))
+        self.down_button.clicked.connect(lambda: self.move_entry(1))
+        self.start_button.clicked.connect(self.start_queue)
+        self.stop_button.clicked.connect(self.run_queue.stop)
+        self.run_queue.entry_started.connect(self.refresh)
+        self.run_queue.entry_finished.connect(self.refresh)
+        self.run_queue.queue_finished.connect(self.refresh)
+
+        self.refresh()
+
+    def done(self, result):
+        # The queue outlives the dialog, so drop the connections made in __init__
+        self.run_queue.entry_started.disconnect(self.refresh)
+        self.run_queue.entry_finished.disconnect(self.refresh)
+        self.run_queue.queue_finished.disconnect(self.refresh)
+        super().done(result)
+
+    def refresh(self, *args):
+        """Redraw the table from the queue entries."""
+        self.table.setRowCount(len(self.run_queue.entries))
+        for row, entry in enumerate(self.run_queue.entries):
+            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(entry["config_file"]))
+            budget = QtWidgets.QSpinBox(self.table)
+            budget.setRange(1, 10080)
+            budget.setValue(entry["time_budget"])
+            budget.valueChanged.connect(lambda value, entry=entry: self.update_budget(entry, value))
+            self.table.setCellWidget(row, 1, budget)
+            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(entry["status"]))
+        editable = not self.run_queue.running
+        for button in (self.add_button, self.remove_button, self.up_button, self.down_button, self.start_button):
+            button.setEnabled(editable)
+        self.stop_button.setEnabled(not editable)
+
+    def update_budget(self, entry, value):
+        entry["time_budget"] = value
+        self.run_queue.save_entries()
+
+    def add_entry(self):
+        script_root = os.path.dirname(os.path.abspath(__file__))
+        start_dir = os.path.join(script_root, "configs")
+        file_paths, _ = QtWidgets.QFileDialog.getOpenFileNames(self, "Add Config Files", start_dir, "Config Files (*.ini)")
+        for file_path in file_paths:
+            # useConfigFile is resolved against the script folder, not the working directory
+            try:
+                config_file = os.path.relpath(file_path, script_root)
+            except ValueError:
+                config_file = os.path.abspath(file_path)  # On another drive
+            self.run_queue.entries.append({"config_file": config_file, "time_budget": 60, "status": "pending"})
+        self.run_queue.save_entries()
+        self.refresh()
+
+    def remove_entry(self):
+        row = self.table.currentRow()
+        if 0 <= row < len(self.run_queue.entries):
+            del self.run_queue.entries[row]
+            self.run_queue.save_entries()
+            self.refresh()
+
+    def move_entry(self, offset):
+        row = self.table.currentRow()
+        target = row + offset
+        entries = self.run_queue.entries
+        if 0 <= row < len(entries) and 0 <= target < len(entries):
+            entries[row], entries[target] = entries[target], entries[row]
+            self.run_queue.save_entries()
+            self.refresh()
+            self.table.selectRow(target)
+
+    def start_queue(self):
+        if not self.run_queue.entries:
+            QtWidgets.QMessageBox.warning(self, "Run Queue", "Add at least one config file to the queue first.")
+            return
+        self.run_queue.start()
+        self.refresh()
+
+
+# ===========================================
+# PresetLibraryDialog Class
+# ===========================================
+class PresetLibraryDialog(QtWidgets.QDialog):
+    def __init__(self, app):
+        """
+        Browse the preset config files and switch useConfigFile between them.
+
+        Args:
+            app (CoreCyclerApp): The main window, which owns the preset library
+        """
+        super().__init__(app)
+        self.app = app
+        self.library = app.preset_library
+        self.setWindowTitle("Preset Library")
+        self.resize(900, 560)
+
+        self.list_widget = QtWidgets.QListWidget(self)
+        self.list_widget.currentTextChanged.connect(self.show_preset)
+        self.details = QtWidgets.QPlainTextEdit(self)
+        self.details.setReadOnly(True)
+        self.details.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        font = self.details.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.details.setFont(font)
+
+        splitter = QtWidgets.QSplitter(self)
+        splitter.addWidget(self.list_widget)
+        splitter.addWidget(self.details)
+        splitter.setSizes([260, 640])
+
+        use_button = QtWidgets.QPushButton("Use Preset", self)
+        use_button.clicked.connect(self.use_preset)
+        clear_button = QtWidgets.QPushButton("Use config.ini", self)
+        clear_button.clicked.connect(self.clear_preset)
+        effective_button = QtWidgets.QPushButton("Effective Config", self)
+        effective_button.clicked.connect(self.show_effective_config)
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(use_button)
+        buttons.addWidget(clear_button)
+        buttons.addWidget(effective_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(splitter)
+        layout.addLayout(buttons)
+
+        self.refresh()
+
+    def refresh(self):
+        """Rescan the presets and keep the current selection."""
+        selected = self.list_widget.currentItem().text() if self.list_widget.currentItem() else None
+        names = self.library.scan()
+        self.list_widget.blockSignals(True)
+        self.list_widget.clear()
+        for name in names:
+            item = QtWidgets.QListWidgetItem(name)
+            if self.library.presets[name]["path"] == self.library.current_source:
+                font = item.font()
+                font.setBold(True)
+                item.setFont(font)
+            self.list_widget.addItem(item)
+        self.list_widget.blockSignals(False)
+
+        matches = self.list_widget.findItems(selected, QtCore.Qt.MatchExactly) if selected else []
+        if matches:
+            self.list_widget.setCurrentItem(matches[0])
+        elif names:
+            self.list_widget.setCurrentRow(0)
+        self.show_preset(self.list_widget.currentItem().text() if self.list_widget.currentItem() else "")
+
+    def show_preset(self, name):
+        if name in self.library.presets:
+            self.details.setPlainText(self.library.describe(name))
+        else:
+            self.details.setPlainText("")
+
+    def use_preset(self):
+        item = self.list_widget.currentItem()
+        if item is None:
+            return
+        self.app.set_config_file_path(self.library.presets[item.text()]["path"])
+        self.refresh()
+
+    def clear_preset(self):
+        self.app.set_config_file_path("")
+        self.refresh()
+
+    def show_effective_config(self):
+        dialog = TextReportDialog("Effective Config", self.library.resolver.describe(), self)
+        dialog.exec_()
+
+
+# ===========================================
+# RuntimeSuggestionDialog Class
+# ===========================================
+class RuntimeSuggestionDialog(QtWidgets.QDialog):
+    def __init__(self, app):
+        """
+        Show the time to the first error in the log history and suggest a runtimePerCore.
+
+        Args:
+            app (CoreCyclerApp): The main window, its runtime spin box is set on Apply
+        """
+        super().__init__(app)
+        self.app = app
+        self.setWindowTitle("Runtime Per Core Suggestion")
+        self.resize(720, 600)
+        log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.observations = planning.core_tests(planning.load_summaries(log_dir))
+        self.recommendation = None
+
+        self.program_combo = QtWidgets.QComboBox(self)
+        self.program_combo.addItem("All programs")
+        programs = sorted({observation["program"] for observation in self.observations})
+        self.program_combo.addItems(programs)
+        selected_program = app.config["General"].get("stressTestProgram", "").upper()
+        if selected_program in programs:
+            self.program_combo.setCurrentText(selected_program)
+        self.program_combo.currentIndexChanged.connect(self.update_report)
+
+        self.coverage_spin = QtWidgets.QSpinBox(self)
+        self.coverage_spin.setRange(50, 100)
+        self.coverage_spin.setSuffix("% of errors")
+        self.coverage_spin.setValue(round(planning.DEFAULT_COVERAGE * 100))
+        self.coverage_spin.valueChanged.connect(self.update_report)
+
+        self.report = QtWidgets.QPlainTextEdit(self)
+        self.report.setReadOnly(True)
+        self.report.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        font = self.report.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.report.setFont(font)
+
+        self.apply_button = QtWidgets.QPushButton("Apply", self)
+        self.apply_button.clicked.connect(self.apply_recommendation)
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+
+        options = QtWidgets.QHBoxLayout()
+        options.addWidget(QtWidgets.QLabel("Runs of:", self))
+        options.addWidget(self.program_combo)
+        options.addWidget(QtWidgets.QLabel("Catch:", self))
+        options.addWidget(self.coverage_spin)
+        options.addStretch()
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(self.apply_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(options)
+        layout.addWidget(self.report)
+        layout.addLayout(buttons)
+
+        self.update_report()
+
+    def selected_observations(self):
+        if self.program_combo.currentIndex() == 0:
+            return self.observations
+        program = self.program_combo.currentText()
+        return [observation for observation in self.observations if observation["program"] == program]
+
+    def update_report(self):
+        observations = self.selected_observations()
+        coverage = self.coverage_spin.value() / 100
+        current_minutes = self.app.spinBox_9.value() or None
+        self.recommendation = planning.recommend_runtime(observations, coverage)
+        self.report.setPlainText(planning.format_survival_report(observations, coverage, current_minutes))
+        minutes = self.recommendation["minutes"]
+        self.apply_button.setEnabled(minutes is not None)
+        self.apply_button.setText(f"Apply {minutes}m" if minutes is not None else "Apply")
+
+    def apply_recommendation(self):
+        minutes = self.recommendation["minutes"]
+        if minutes is None:
+            return
+        # The spin box handler writes runtimePerCore to the config
+        self.app.spinBox_9.setValue(min(minutes, self.app.spinBox_9.maximum()))
+        self.update_report()
+
+
+# ===========================================
+# BudgetPlannerDialog Class
+# ===========================================
+class BudgetPlannerDialog(QtWidgets.QDialog):
+    def __init__(self, app):
+        """
+        Plan runtimePerCore, maxIterations and coreTestOrder for a fixed time budget.
+
+        Args:
+            app (CoreCyclerApp): The main window, which owns the config resolver
+        """
+        super().__init__(app)
+        self.app = app
+        self.setWindowTitle("Time Budget Planner")
+        self.resize(720, 600)
+        self.log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.plan = None
+
+        self.hours_spin = QtWidgets.QDoubleSpinBox(self)
+        self.hours_spin.setRange(0.5, 168)
+        self.hours_spin.setSingleStep(0.5)
+        self.hours_spin.setDecimals(1)
+        self.hours_spin.setSuffix(" hours")
+        self.hours_spin.setValue(8)
+        self.hours_spin.valueChanged.connect(self.update_plan)
+
+        self.report = QtWidgets.QPlainTextEdit(self)
+        self.report.setReadOnly(True)
+        font = self.report.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.report.setFont(font)
+
+        self.save_button = QtWidgets.QPushButton("Save as Preset...", self)
+        self.save_button.clicked.connect(self.save_plan)
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+
+        options = QtWidgets.QHBoxLayout()
+        options.addWidget(QtWidgets.QLabel("Time budget:", self))
+        options.addWidget(self.hours_spin)
+        options.addStretch()
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(self.save_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(options)
+        layout.addWidget(self.report)
+        layout.addLayout(buttons)
+
+        self.update_plan()
+
+    def update_plan(self):
+        cores = sorted(self.app.topology.core_to_cpus) if self.app.topology is not None else None
+        self.plan = planning.plan_from_history(self.log_dir, self.hours_spin.value(), self.app.config_resolver, cores)
+        self.report.setPlainText(planning.format_plan(self.plan))
+        self.save_button.setEnabled(self.plan is not None)
+
+    def save_plan(self):
+        hours = self.hours_spin.value()
+        name, accepted = QtWidgets.QInputDialog.getText(self, "Save as Preset", "Preset name:", text=f"budget-{hours:g}h")
+        name = name.strip()
+        if not accepted or not name:
+            return
+        path = os.path.join(presets.CONFIG_DIR, f"{name}.config.ini")
+        # default.config.ini is refused by write_plan_preset, any other preset may be replaced after asking
+        overwrite = False
+        if os.path.exists(path) and os.path.abspath(path) != os.path.abspath(self.app.config_resolver.default_config):
+            answer = QtWidgets.QMessageBox.question(self, "Save as Preset", f"{path} already exists.\n\nReplace it?",
+                                                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                                                    QtWidgets.QMessageBox.No)
+            if answer != QtWidgets.QMessageBox.Yes:
+                return
+            overwrite = True
+        try:
+            planning.write_plan_preset(self.plan, path, self.app.config_resolver, f"Time budget plan for {hours:g} hours",
+                                       overwrite)
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, "Save as Preset", f"{e}.\n\nPlease choose another name.")
+            return
+        except OSError as e:
+            print(f"Error writing {path}: {e}")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save the preset: {str(e)}")
+            return
+        print(f"Saved the time budget plan as {path}")
+        answer = QtWidgets.QMessageBox.question(self, "Save as Preset", f"Saved {path}.\n\nUse this preset now?")
+        if answer == QtWidgets.QMessageBox.Yes:
+            self.app.set_config_file_path(self.app.preset_library.preset_path(f"{name}.config.ini"))
+
+
+# ===========================================
+# YCruncherMemoryDialog Class
+# ===========================================
+class YCruncherMemoryDialog(QtWidgets.QDialog):
+    TARGETS = [("In L2", "L2"), ("In L3", "L3"), ("Out of Cache", "RAM")]
+
+    def __init__(self, app):
+        """
+        Show where the y-cruncher tests run in the cache hierarchy for a memory setting.
+
+        Args:
+            app (CoreCyclerApp): The main window, its memory spin box is set on Apply
+        """
+        super().__init__(app)
+        self.app = app
+        self.setWindowTitle("y-cruncher Memory Planner")
+        self.resize(720, 600)
+        self.log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.targets = {}
+        caches, source = sizing.load_cache_sizes()
+
+        self.cache_edits = {}
+        for level in sizing.CACHE_LEVELS:
+            edit = QtWidgets.QLineEdit(sizing.format_bytes(caches[level]) if level in caches else "", self)
+            edit.setPlaceholderText("unknown")
+            edit.setMaximumWidth(90)
+            edit.editingFinished.connect(self.update_plan)
+            self.cache_edits[level] = edit
+
+        self.memory_spin = QtWidgets.QDoubleSpinBox(self)
+        self.memory_spin.setRange(0.1, self.app.doubleSpinBox_2.maximum())
+        self.memory_spin.setDecimals(1)
+        self.memory_spin.setSuffix(" MB")
+        if self.app.checkBox_48.isChecked():
+            self.app.config_resolver.resolve()
+            threads = self.app.config_resolver.get("General", "numberOfThreads", "1")
+            default_memory = sizing.ycruncher_memory("Default", 2 if threads.strip() == "2" else 1)
+            self.memory_spin.setValue(default_memory / 1000 ** 2)
+        else:
+            self.memory_spin.setValue(max(self.app.doubleSpinBox_2.value(), 0.1))
+        self.memory_spin.valueChanged.connect(self.update_plan)
+
+        self.report = QtWidgets.QPlainTextEdit(self)
+        self.report.setReadOnly(True)
+        self.report.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        font = self.report.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.report.setFont(font)
+
+        caches_row = QtWidgets.QHBoxLayout()
+        caches_row.addWidget(QtWidgets.QLabel("Cache per core:", self))
+        for level, edit in self.cache_edits.items():
+            caches_row.addWidget(QtWidgets.QLabel(level, self))
+            caches_row.addWidget(edit)
+        caches_row.addWidget(QtWidgets.QLabel(f"({source})" if source else "", self))
+        caches_row.addStretch()
+        memory_row = QtWidgets.QHBoxLayout()
+        memory_row.addWidget(QtWidgets.QLabel("Memory:", self))
+        memory_row.addWidget(self.memory_spin)
+        self.target_buttons = {}
+        for text, target in self.TARGETS:
+            button = QtWidgets.QPushButton(text, self)
+            button.clicked.connect(lambda checked, target=target: self.select_target(target))
+            memory_row.addWidget(button)
+            self.target_buttons[target] = button
+        memory_row.addStretch()
+
+        apply_button = QtWidgets.QPushButton("Apply", self)
+        apply_button.clicked.connect(self.apply_memory)
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(apply_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(caches_row)
+        layout.addLayout(memory_row)
+        layout.addWidget(self.report)
+        layout.addLayout(buttons)
+
+        self.update_plan()
+
+    def cache_sizes(self):
+        caches = {}
+        for level, edit in self.cache_edits.items():
+            size = sizing.parse_byte_size(edit.text()) if edit.text().strip() else None
+            if size:
+                caches[level] = size
+        return caches
+
+    def update_plan(self):
+        cores = len(self.app.topology.core_to_cpus) if self.app.topology is not None else None
+        plan, self.targets = sizing.ycruncher_plan_from_config(
+            self.app.config_resolver, self.log_dir, self.cache_sizes(), int(self.memory_spin.value() * 1000 ** 2), cores
+        )
+        self.report.setPlainText(sizing.format_ycruncher_plan(plan, self.targets))
+        for target, button in self.target_buttons.items():
+            button.setEnabled(bool(self.targets.get(target)))
+
+    def select_target(self, target):
+        memory = self.targets.get(target)
+        if memory:
+            # Round up, so the working set doesn't end up just short of the target
+            self.memory_spin.setValue(min(math.ceil(memory / 1000 ** 2 * 10) / 10, self.memory_spin.maximum()))
+
+    def apply_memory(self):
+        # The handlers of the memory widgets write the setting to the config
+        self.app.checkBox_48.setChecked(False)
+        self.app.doubleSpinBox_2.setValue(self.memory_spin.value())
+        print(f"Applied a yCruncher memory of {self.memory_spin.value():g} MB")
+
+
+# ===========================================
+# LogSearchDialog Class
+# ===========================================
+class LogSearchDialog(QtWidgets.QDialog):
+    index_updated = QtCore.pyqtSignal(dict)
+
+    SEARCH_DELAY_MS = 250
+
+    def __init__(self, app):
+        """
+        Search the text of all logs through the log index.
+
+        The index is brought up to date in a worker thread while the dialog is
+        open, searches use what is already indexed.
+
+        Args:
+            app (CoreCyclerApp): The main window
+        """
+        super().__init__(app)
+        self.setWindowTitle("Search Logs")
+        self.resize(900, 600)
+        self.log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.index = None
+
+        self.query_edit = QtWidgets.QLineEdit(self)
+        self.query_edit.setPlaceholderText('e.g. "Set to Core 11" or a rounding value')
+        self.debug_check = QtWidgets.QCheckBox("Include +++ lines", self)
+        self.status_label = QtWidgets.QLabel(self)
+
+        self.results = QtWidgets.QPlainTextEdit(self)
+        self.results.setReadOnly(True)
+        self.results.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        font = self.results.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.results.setFont(font)
+
+        # Search while typing, once the user pauses
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.search)
+        self.query_edit.textChanged.connect(self.search_timer.start)
+        self.query_edit.returnPressed.connect(self.search)
+        self.debug_check.toggled.connect(self.search)
+        self.index_updated.connect(self.on_index_updated)
+
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+        options = QtWidgets.QHBoxLayout()
+        options.addWidget(QtWidgets.QLabel("Search:", self))
+        options.addWidget(self.query_edit)
+        options.addWidget(self.debug_check)
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(self.status_label)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(options)
+        layout.addWidget(self.results)
+        layout.addLayout(buttons)
+
+        if not os.path.isdir(self.log_dir):
+            self.status_label.setText(f"No logs folder at {self.log_dir}")
+            self.query_edit.setEnabled(False)
+            return
+        try:
+            self.index = logindex.LogIndex(self.log_dir)
+        except Exception as e:
+            print(f"Error opening the log index: {e}")
+            self.status_label.setText(f"Could not open the log index: {e}")
+            self.query_edit.setEnabled(False)
+            return
+        self.status_label.setText("Updating the index...")
+        thread = threading.Thread(target=self.update_index, daemon=True)
+        thread.start()
+
+    def update_index(self):
+        """Runs in a worker thread, with its own connection to the index."""
+        try:
+            with logindex.LogIndex(self.log_dir) as index:
+                result = index.update()
+                result["stats"] = index.stats()
+        except Exception as e:
+            result = {"error": str(e)}
+        self.index_updated.emit(result)
+
+    def on_index_updated(self, result):
+        if "error" in result:
+            print(f"Error updating the log index: {result['error']}")
+            self.status_label.setText(f"Could not update the index: {result['error']}")
+            return
+        stats = result["stats"]
+        print(f"Indexed {result['lines']} new lines in {result['files']} logs")
+        self.status_label.setText(f"{stats['files']} logs, {stats['lines']} lines indexed")
+        if result["lines"] or result["removed"]:
+            self.search()
+
+    def search(self):
+        self.search_timer.stop()
+        query = self.query_edit.text()
+        if self.index is None or not query.strip():
+            self.results.clear()
+            return
+        started = time.perf_counter()
+        try:
+            results = self.index.search(query, include_debug=self.debug_check.isChecked())
+        except Exception as e:
+            print(f"Error searching the logs: {e}")
+            self.status_label.setText(f"Search failed: {e}")
+            return
+        elapsed = time.perf_counter() - started
+        self.results.setPlainText(logindex.format_results(results) if results else "No matches")
+        more = "+" if len(results) >= logindex.DEFAULT_MAX_RESULTS else ""
+        self.status_label.setText(f"{len(results)}{more} matches in {elapsed * 1000:.0f} ms")
+
+    def done(self, result):
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        super().done(result)
+
+
+# ===========================================
+# LogFileModel Class
+# ===========================================
+class LogFileModel(QtCore.QAbstractListModel):
+    """
+    List model over a memory-mapped log, for a QListView with uniform item sizes.
+
+    Only the rows the view asks for are read from the file. Lines are indexed in
+    batches as the view scrolls down (canFetchMore/fetchMore), or as far as a
+    jump needs them. A filter keeps the numbers of its matching lines.
+    """
+    FETCH_LINES = 5000
+    FILTERS = ["All lines", "Hide +++ lines", "Hide + and +++ lines", "Errors only"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.log = None
+        self.visible_lines = 0
+        self.rows = None  # Line numbers shown with a filter, None without one
+        self.debug_brush = QtGui.QBrush(QtGui.QColor("gray"))
+        self.error_brush = QtGui.QBrush(QtGui.QColor("red"))
+
+    def open(self, path):
+        log = loganalysis.MappedLog(path)
+        self.beginResetModel()
+        self.close_log()
+        self.log = log
+        self.rows = None
+        self.log.index_lines(self.FETCH_LINES)
+        self.visible_lines = self.log.line_count
+        self.endResetModel()
+
+    def close_log(self):
+        if self.log is not None:
+            self.log.close()
+        self.log = None
+        self.visible_lines = 0
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or self.log is None:
+            return 0
+        return len(self.rows) if self.rows is not None else self.visible_lines
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.log is not None and self.rows is None and not self.log.complete
+
+    def fetchMore(self, parent):
+        self.log.index_lines(self.FETCH_LINES)
+        self.show_indexed_lines()
+
+    def show_indexed_lines(self):
+        """Add the rows indexed since the last update, e.g. by a jump."""
+        if self.rows is not None or self.log.line_count == self.visible_lines:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self.visible_lines, self.log.line_count - 1)
+        self.visible_lines = self.log.line_count
+        self.endInsertRows()
+
+    def line_number(self, row):
+        return self.rows[row] if self.rows is not None else row
+
+    def row_for_line(self, line_number):
+        """The row showing a line, or the next shown one if the filter hides it."""
+        if self.rows is None:
+            return line_number
+        return min(bisect.bisect_left(self.rows, line_number), len(self.rows) - 1)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or self.log is None:
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            line_number = self.line_number(index.row())
+            return f"{line_number + 1:>7}  {self.log.line(line_number)}"
+        if role == QtCore.Qt.ForegroundRole:
+            text = self.log.line_bytes(self.line_number(index.row()))
+            if loganalysis.MAPPED_ERROR_PATTERN.match(text):
+                return self.error_brush
+            if text.lstrip().startswith(b"+"):
+                return self.debug_brush
+        return None
+
+    def set_filter(self, name):
+        if self.log is None:
+            return
+        self.beginResetModel()
+        if name == "All lines":
+            self.rows = None
+        else:
+            if name == "Errors only":
+                matches = loganalysis.MAPPED_ERROR_PATTERN.match
+            elif name == "Hide +++ lines":
+                matches = lambda text: not text.lstrip().startswith(b"+++")
+            else:
+                matches = lambda text: not text.lstrip().startswith(b"+")
+            self.rows = array.array("i", (line_number for line_number, text in self.log.iter_lines() if matches(text)))
+            self.visible_lines = self.log.line_count
+        self.endResetModel()
+
+
+# ===========================================
+# LogViewerDialog Class
+# ===========================================
+class LogViewerDialog(QtWidgets.QDialog):
+    def __init__(self, app, path=None):
+        """
+        Show a log of any size, with jumps to the tested cores and the errors.
+
+        Args:
+            app (CoreCyclerApp): The main window
+            path (str): The log to open, defaults to the newest CoreCycler log
+        """
+        super().__init__(app)
+        self.setWindowTitle("Log Viewer")
+        self.resize(1000, 700)
+        self.log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.model = LogFileModel(self)
+        self.model.rowsInserted.connect(self.update_status)
+
+        self.view = QtWidgets.QListView(self)
+        self.view.setUniformItemSizes(True)  # Lets the view skip measuring every row
+        self.view.setModel(self.model)
+        font = self.view.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        self.view.setFont(font)
+
+        open_button = QtWidgets.QPushButton("Open...", self)
+        open_button.clicked.connect(self.choose_log)
+        self.filter_combo = QtWidgets.QComboBox(self)
+        self.filter_combo.addItems(LogFileModel.FILTERS)
+        self.filter_combo.currentTextChanged.connect(self.change_filter)
+        self.core_combo = QtWidgets.QComboBox(self)
+        core_button = QtWidgets.QPushButton("Next Core Test", self)
+        core_button.clicked.connect(self.jump_to_core)
+        previous_error_button = QtWidgets.QPushButton("Previous Error", self)
+        previous_error_button.clicked.connect(lambda: self.jump_to_error(backwards=True))
+        next_error_button = QtWidgets.QPushButton("Next Error", self)
+        next_error_button.clicked.connect(self.jump_to_error)
+        self.status_label = QtWidgets.QLabel(self)
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+
+        options = QtWidgets.QHBoxLayout()
+        options.addWidget(open_button)
+        options.addWidget(QtWidgets.QLabel("Show:", self))
+        options.addWidget(self.filter_combo)
+        options.addStretch()
+        options.addWidget(QtWidgets.QLabel("Core:", self))
+        options.addWidget(self.core_combo)
+        options.addWidget(core_button)
+        options.addWidget(previous_error_button)
+        options.addWidget(next_error_button)
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(self.status_label)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(options)
+        layout.addWidget(self.view)
+        layout.addLayout(buttons)
+
+        path = path or loganalysis.find_newest_log(self.log_dir)
+        if path is not None:
+            self.open_log(path)
+
+    def open_log(self, path):
+        try:
+            self.model.open(path)
+        except (OSError, ValueError) as e:
+            print(f"Error opening {path}: {e}")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to open the log: {str(e)}")
+            return
+        print(f"Opened {path} in the log viewer")
+        self.setWindowTitle(f"Log Viewer - {os.path.basename(path)}")
+        self.core_combo.clear()
+        self.core_combo.addItems([str(core) for core in self.model.log.cores()])
+        self.change_filter(self.filter_combo.currentText())
+
+    def choose_log(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open Log", self.log_dir, "Log files (*.log);;All files (*)")
+        if path:
+            self.open_log(path)
+
+    def change_filter(self, name):
+        self.model.set_filter(name)
+        self.update_status()
+
+    def update_status(self):
+        log = self.model.log
+        if log is None:
+            self.status_label.clear()
+            return
+        lines = f"{log.line_count}" if log.complete else f"{log.line_count}+"
+        shown = f", {len(self.model.rows)} shown" if self.model.rows is not None else ""
+        self.status_label.setText(f"{lines} lines{shown}, {log.size / 1024:.0f} KB")
+
+    def current_line(self):
+        index = self.view.currentIndex()
+        if not index.isValid():
+            index = self.view.indexAt(QtCore.QPoint(0, 0))
+        return self.model.line_number(index.row()) if index.isValid() else -1
+
+    def jump_to_line(self, line_number):
+        self.model.show_indexed_lines()
+        if self.model.rowCount() == 0:
+            return
+        index = self.model.index(self.model.row_for_line(line_number))
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, QtWidgets.QAbstractItemView.PositionAtCenter)
+        self.update_status()
+
+    def jump_to_core(self):
+        if self.model.log is None or not self.core_combo.currentText():
+            return
+        pattern = re.compile(rb"Set to Core " + self.core_combo.currentText().encode() + rb" \(CPU ")
+        line_number = self.model.log.find(pattern, self.current_line())
+        if line_number is not None:
+            self.jump_to_line(line_number)
+
+    def jump_to_error(self, backwards=False):
+        if self.model.log is None:
+            return
+        line_number = self.model.log.find(loganalysis.MAPPED_ERROR_PATTERN, self.current_line(), backwards)
+        if line_number is None:
+            self.status_label.setText("No errors in this log")
+            return
+        self.jump_to_line(line_number)
+
+    def done(self, result):
+        self.model.close_log()
+        super().done(result)
+
+
+# ===========================================
+# ChartWidget Class
+# ===========================================
+class ChartWidget(QtWidgets.QWidget):
+    """
+    Line chart of a few long series, drawn from a charts.DownsampleCache.
+
+    The mouse wheel zooms around the cursor, dragging pans and a double click
+    shows the whole run again. A view that needs downsampled tiles which aren't
+    computed yet is drawn from coarser ones first and redrawn as the tiles are
+    computed, a few per pass of the event loop.
+    """
+    render_finished = QtCore.pyqtSignal(float)
+
+    MARGIN_LEFT = 60
+    MARGIN_RIGHT = 20
+    MARGIN_TOP = 20
+    MARGIN_BOTTOM = 30
+    COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f",
+              "#bcbd22", "#17becf"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(400, 250)
+        self.cache = None
+        self.unit = ""
+        self.x0 = self.x1 = 0.0
+        self.drag_start = None
+        self.refine_timer = QtCore.QTimer(self)
+        self.refine_timer.setSingleShot(True)
+        self.refine_timer.timeout.connect(self.refine)
+
+    def set_series(self, series, unit):
+        self.cache = charts.DownsampleCache(series) if series else None
+        self.unit = unit
+        self.reset_zoom()
+
+    def reset_zoom(self):
+        if self.cache is not None:
+            self.x0, self.x1 = self.cache.x_min, self.cache.x_max
+        self.update()
+
+    def plot_rect(self):
+        return QtCore.QRectF(self.MARGIN_LEFT, self.MARGIN_TOP,
+                             max(self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT, 1),
+                             max(self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM, 1))
+
+    def paintEvent(self, event):
+        started = time.perf_counter()
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtGui.QColor("white"))
+        if self.cache is None:
+            painter.drawText(self.rect(), QtCore.Qt.AlignCenter, "No data in this log")
+            return
+        rect = self.plot_rect()
+        y_min, y_max = self.cache.y_min, self.cache.y_max
+        if y_max <= y_min:
+            y_min, y_max = y_min - 1, y_max + 1
+        padding = (y_max - y_min) * 0.05  # Keeps the extremes off the frame
+        y_min, y_max = y_min - padding, y_max + padding
+        x_scale = rect.width() / (self.x1 - self.x0)
+        y_scale = rect.height() / (y_max - y_min)
+
+        for step in range(5):
+            y = rect.top() + rect.height() * step / 4
+            painter.setPen(QtGui.QColor("lightgray"))
+            painter.drawLine(QtCore.QPointF(rect.left(), y), QtCore.QPointF(rect.right(), y))
+            painter.setPen(QtGui.QColor("black"))
+            painter.drawText(QtCore.QRectF(0, y - 10, self.MARGIN_LEFT - 5, 20), QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter,
+                             f"{y_max - (y_max - y_min) * step / 4:.4g}")
+        for step in range(5):
+            x = rect.left() + rect.width() * step / 4
+            seconds = self.x0 + (self.x1 - self.x0) * step / 4
+            painter.drawText(QtCore.QRectF(min(x - 60, self.width() - 120), rect.bottom() + 5, 120, 20), QtCore.Qt.AlignCenter,
+                             automode.format_elapsed(seconds))
+        painter.drawRect(rect)
+        painter.drawText(QtCore.QRectF(5, 0, 200, self.MARGIN_TOP), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, self.unit)
+
+        painter.setClipRect(rect)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        for series_index, series in enumerate(self.cache.series):
+            xs, ys = self.cache.view(series_index, self.x0, self.x1)
+            color = QtGui.QColor(self.COLORS[series_index % len(self.COLORS)])
+            painter.setPen(QtGui.QPen(color, 1))
+            points = [QtCore.QPointF(rect.left() + (x - self.x0) * x_scale, rect.bottom() - (y - y_min) * y_scale)
+                      for x, y in zip(xs, ys)]
+            if len(points) == 1:
+                painter.setBrush(color)
+                painter.drawEllipse(points[0], 3, 3)
+            elif points:
+                painter.drawPolyline(QtGui.QPolygonF(points))
+        painter.setClipping(False)
+
+        # Legend
+        line_height = painter.fontMetrics().height()
+        for series_index, series in enumerate(self.cache.series[:len(self.COLORS)]):
+            color = QtGui.QColor(self.COLORS[series_index % len(self.COLORS)])
+            x = rect.right() - 80
+            y = rect.top() + 5 + series_index * line_height
+            painter.fillRect(QtCore.QRectF(x, y + line_height / 2 - 3, 10, 6), color)
+            painter.setPen(QtGui.QColor("black"))
+            painter.drawText(QtCore.QRectF(x + 14, y, 66, line_height), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                             series.name)
+        painter.end()
+
+        if self.cache.pending:
+            self.refine_timer.start(0)
+        self.render_finished.emit((time.perf_counter() - started) * 1000)
+
+    def refine(self):
+        if self.cache is not None and self.cache.pending:
+            self.cache.refine()
+            self.update()
+
+    def x_at(self, pixel):
+        rect = self.plot_rect()
+        return self.x0 + (pixel - rect.left()) / rect.width() * (self.x1 - self.x0)
+
+    def wheelEvent(self, event):
+        if self.cache is None:
+            return
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        center = self.x_at(event.pos().x())
+        span = min(max((self.x1 - self.x0) * factor, 1.0), self.cache.x_max - self.cache.x_min)
+        ratio = (center - self.x0) / (self.x1 - self.x0)
+        self.set_range(center - span * ratio, center - span * ratio + span)
+
+    def set_range(self, x0, x1):
+        span = x1 - x0
+        x0 = min(max(x0, self.cache.x_min), self.cache.x_max - span)
+        self.x0, self.x1 = x0, x0 + span
+        self.update()
+
+    def mousePressEvent(self, event):
+        self.drag_start = (event.pos().x(), self.x0, self.x1)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_start is None or self.cache is None:
+            return
+        start_pixel, x0, x1 = self.drag_start
+        shift = (start_pixel - event.pos().x()) / self.plot_rect().width() * (x1 - x0)
+        self.set_range(x0 + shift, x1 + shift)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_start = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.reset_zoom()
+
+
+# ===========================================
+# ChartDialog Class
+# ===========================================
+class ChartDialog(QtWidgets.QDialog):
+    def __init__(self, app, path=None):
+        """
+        Chart the tick data of a CoreCycler run or the trials of a Linpack run.
+
+        Args:
+            app (CoreCyclerApp): The main window
+            path (str): The log to chart, defaults to the newest CoreCycler log
+        """
+        super().__init__(app)
+        self.setWindowTitle("Charts")
+        self.resize(1000, 600)
+        self.log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        self.path = None
+        self.charts = []
+        self.points = 0
+
+        open_button = QtWidgets.QPushButton("Open...", self)
+        open_button.clicked.connect(self.choose_log)
+        self.chart_combo = QtWidgets.QComboBox(self)
+        self.chart_combo.currentIndexChanged.connect(self.show_chart)
+        self.chart = ChartWidget(self)
+        self.chart.render_finished.connect(self.on_render_finished)
+        self.status_label = QtWidgets.QLabel(self)
+        close_button = QtWidgets.QPushButton("Close", self)
+        close_button.clicked.connect(self.accept)
+
+        options = QtWidgets.QHBoxLayout()
+        options.addWidget(open_button)
+        options.addWidget(QtWidgets.QLabel("Chart:", self))
+        options.addWidget(self.chart_combo)
+        options.addStretch()
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(self.status_label)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addLayout(options)
+        layout.addWidget(self.chart)
+        layout.addLayout(buttons)
+
+        path = path or loganalysis.find_newest_log(self.log_dir)
+        if path is not None:
+            self.open_log(path)
+
+    def open_log(self, path):
+        info = loganalysis.parse_log_name(path)
+        if info is None or info["family"] not in charts.CHARTS:
+            QtWidgets.QMessageBox.warning(self, "Charts", "Charts are available for CoreCycler and Linpack logs.")
+            return
+        self.path = path
+        self.charts = charts.CHARTS[info["family"]]
+        self.setWindowTitle(f"Charts - {os.path.basename(path)}")
+        self.chart_combo.blockSignals(True)
+        self.chart_combo.clear()
+        self.chart_combo.addItems([title for title, _, _ in self.charts])
+        self.chart_combo.blockSignals(False)
+        self.show_chart()
+
+    def choose_log(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open Log", self.log_dir, "Log files (*.log)")
+        if path:
+            self.open_log(path)
+
+    def show_chart(self):
+        index = self.chart_combo.currentIndex()
+        if self.path is None or index < 0:
+            return
+        title, unit, reader = self.charts[index]
+        try:
+            series = reader(self.path)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {self.path}: {e}")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to read the log: {str(e)}")
+            return
+        self.points = sum(len(series_item.xs) for series_item in series)
+        self.chart.set_series(series, unit)
+
+    def on_render_finished(self, milliseconds):
+        self.status_label.setText(f"{self.points} points, drawn in {milliseconds:.0f} ms "
+                                  "(wheel to zoom, drag to pan, double-click to reset)")
+
+
+# ===========================================
+# ResumeStateDialog Class
+# ===========================================
+class ResumeStateDialog(QtWidgets.QDialog):
+    def __init__(self, app, state):
+        """
+        Show where a crashed Automatic Test Mode run stopped, and resume, restart or discard it.
+
+        Args:
+            app (CoreCyclerApp): The main window
+            state (dict): The resume state, see automode.inspect_resume_state()
+        """
+        super().__init__(app)
+        self.app = app
+        self.state = state
+        self.script_root = os.path.dirname(os.path.abspath(__file__))
+        self.setWindowTitle("Automatic Test Mode Resume State")
+        self.resize(640, 360)
+
+        details = QtWidgets.QPlainTextEdit(self)
+        details.setReadOnly(True)
+        font = details.font()
+        font.setFamily("Consolas")
+        font.setStyleHint(font.Monospace)
+        details.setFont(font)
+        details.setPlainText(automode.format_resume_state(state))
+
+        self.values_edit = QtWidgets.QLineEdit(" ".join(state["values"]), self)
+        self.values_edit.setToolTip("The Curve Optimizer / voltage offset values, separated by spaces")
+
+        resume_button = QtWidgets.QPushButton("Resume", self)
+        resume_button.setToolTip("Continue the run at the crashed core with the values above")
+        resume_button.clicked.connect(self.resume)
+        restart_button = QtWidgets.QPushButton("Start Over", self)
+        restart_button.setToolTip("Use the values above as startValues and discard the resume state")
+        restart_button.clicked.connect(self.start_over)
+        reset_button = QtWidgets.QPushButton("Reset", self)
+        reset_button.setToolTip("Discard the resume state")
+        reset_button.clicked.connect(self.reset)
+        close_button = QtWidgets.QPushButton("Later", self)
+        close_button.clicked.connect(self.reject)
+
+        values_row = QtWidgets.QHBoxLayout()
+        values_row.addWidget(QtWidgets.QLabel("Values:", self))
+        values_row.addWidget(self.values_edit)
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(resume_button)
+        buttons.addWidget(restart_button)
+        buttons.addWidget(reset_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(QtWidgets.QLabel("The last Automatic Test Mode run did not end normally.", self))
+        layout.addWidget(details)
+        layout.addLayout(values_row)
+        layout.addLayout(buttons)
+
+    def automode_file(self):
+        return os.path.join(self.script_root, automode.AUTOMODE_FILE)
+
+    def edited_values(self):
+        return self.values_edit.text().replace(",", " ").split()
+
+    def resume(self):
+        values = self.edited_values()
+        try:
+            if values != self.state["values"]:
+                automode.write_automode_values(self.automode_file(), values)
+                print(f"Updated the resume values to {' '.join(values)}")
+            bat_path = os.path.join(self.script_root, "Run CoreCycler.bat")
+            # The same call the startup task makes after a crash
+            self.app.launcher.launch("CoreCycler", bat_path, arguments=[str(self.state["core"])], elevated=True)
+        except Exception as e:
+            print(f"Error resuming the test: {e}")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to resume the test: {str(e)}")
+            return
+        self.accept()
+
+    def start_over(self):
+        values = self.edited_values()
+        if values:
+            self.app.lineEdit_3.setText(", ".join(values))  # Writes startValues
+        self.reset()
+
+    def reset(self):
+        try:
+            os.remove(self.automode_file())
+            print(f"Removed {self.automode_file()}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing {self.automode_file()}: {e}")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to remove the resume state: {str(e)}")
+            return
+        self.accept()
+
+
 # ===========================================
 # Main Application Class (already in main.py)
 # ===========================================
@@ -984,9 +2779,10 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
         
         # Configuration file setup
         self.config_file = "config.ini"
-        self.config = configparser.ConfigParser()
+        self.config = tracing.TracedConfigParser()
         self.config.read(self.config_file)
         self.general = GeneralSettings(self.config_file, self.config)  # Initialize General settings
+        self.bindings = SignalBindings()  # Change handlers, connected once all widgets are loaded
 
         # Initialize UI elements first
         self.setupUi(self)  # This attaches all UI elements to self
@@ -1001,12 +2797,13 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
         # Continue with other setup
         self.setup_test_buttons()
         self.load_settings()
-        self.setup_checkboxes()
-        self.setup_spinbox()
         self.setup_config_file_controls()
         self.setup_runtime_per_core()
         self.setup_update_frequency()
         self.general.setup_general_controls(self)  # Set up general controls including core test order
+        self.widget_registry = WidgetRegistry(self)  # Widgets bound to a single setting
+        self.widget_registry.load()
+        self.widget_registry.connect()
         
         # Connect push buttons
         self.pushButton_1.clicked.connect(self.launch_core_cycler)
@@ -1017,8 +2814,41 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
         self.pushButton_9.clicked.connect(self.launch_core_tuner_x)
         self.pushButton_10.clicked.connect(self.run_performance_counters)
         self.pushButton_12.clicked.connect(self.open_script_folder)
-
-        self.checkBox_14.stateChanged.connect(self.update_enable_update_check)
+        self.pushButton_13.clicked.connect(self.open_run_queue)
+
+        self.pushButton_14.clicked.connect(self.open_process_monitor)
+        self.pushButton_15.clicked.connect(self.open_preset_library)
+        self.pushButton_16.clicked.connect(self.open_runtime_suggestion)
+        self.pushButton_17.clicked.connect(self.open_budget_planner)
+        self.pushButton_18.clicked.connect(self.open_log_search)
+        self.pushButton_19.clicked.connect(self.open_log_viewer)
+        self.pushButton_20.clicked.connect(self.open_charts)
+        self.pushButton_21.clicked.connect(self.open_ycruncher_memory_planner)
+
+        self.launcher = ProcessLauncher(self)
+        self.launcher.output_received.connect(lambda record, line: print(f"[{record['name']}] {line}"))
+        self.launcher.process_finished.connect(self.on_process_finished)
+        self.run_queue = RunQueue(self)
+        self.config_resolver = presets.ConfigResolver(user_config=self.config_file)
+        self.preset_library = presets.PresetLibrary(self.config_resolver)
+        self.update_config_file_tooltip()
+
+        self.topology = None
+        self.lineEdit.textChanged.connect(self.update_cores_to_ignore_tooltip)
+        cached_topology = topology.load_cached_topology()
+        if cached_topology is not None:
+            self.set_topology(cached_topology)
+            print(f"Loaded cached CPU topology ({cached_topology.physical_cores} cores)")
+
+        self.bindings.add(self.checkBox_14.stateChanged, self.update_enable_update_check)
+
+        # All widgets show the config now, from here on changes are written to config.ini
+        startup_writes = config_writes[self.config_file]
+        self.bindings.connect_all()
+        print(f"Loaded settings with {startup_writes} writes to {self.config_file}")
+
+        # Ask about a crashed Automatic Test Mode run once the window is shown
+        QtCore.QTimer.singleShot(0, self.check_resume_state)
 
     def setup_test_buttons(self):
         self.testButtonGroup = QtWidgets.QButtonGroup(self)
@@ -1027,44 +2857,15 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
         self.testButtonGroup.addButton(self.radioButton_3, id=3)  # AIDA64
         self.testButtonGroup.addButton(self.radioButton_4, id=4)  # YCRUNCHER
         self.testButtonGroup.addButton(self.radioButton_5, id=5)  # YCRUNCHER_OLD
-        self.testButtonGroup.buttonToggled.connect(self.on_test_selection)
-
-    def setup_checkboxes(self):
-        general_checkboxes = {
-            "skipCoreOnError": self.checkBox_2,
-            "stopOnError": self.checkBox_3,
-            "assignBothVirtualCoresForSingleThread": self.checkBox_4,
-            "suspendPeriodically": self.checkBox_5,
-            "beepOnError": self.checkBox_6,
-            "flashOnError": self.checkBox_7,
-            "lookForWheaErrors": self.checkBox_8,
-            "treatWheaWarningAsError": self.checkBox_9,
-            "restartTestProgramForEachCore": self.checkBox_10
-        }
-        settings = self.general.load_checkbox_settings(general_checkboxes)
-        for option, value in settings.items():
-            general_checkboxes[option].setChecked(value)
-
-        self.checkBox_2.stateChanged.connect(lambda state: self.general.update_config("skipCoreOnError", 1 if state else 0))
-        self.checkBox_3.stateChanged.connect(lambda state: self.general.update_config("stopOnError", 1 if state else 0))
-        self.checkBox_4.stateChanged.connect(lambda state: self.general.update_config("assignBothVirtualCoresForSingleThread", 1 if state else 0))
-        self.checkBox_5.stateChanged.connect(lambda state: self.general.update_config("suspendPeriodically", 1 if state else 0))
-        self.checkBox_6.stateChanged.connect(lambda state: self.general.update_config("beepOnError", 1 if state else 0))
-        self.checkBox_7.stateChanged.connect(lambda state: self.general.update_config("flashOnError", 1 if state else 0))
-        self.checkBox_8.stateChanged.connect(lambda state: self.general.update_config("lookForWheaErrors", 1 if state else 0))
-        self.checkBox_9.stateChanged.connect(lambda state: self.general.update_config("treatWheaWarningAsError", 1 if state else 0))
-        self.checkBox_10.stateChanged.connect(lambda state: self.general.update_config("restartTestProgramForEachCore", 1 if state else 0))
-
-    def setup_spinbox(self):
-        self.spinBox1.valueChanged.connect(lambda value: self.general.update_config("numberOfThreads", value))
+        self.bindings.add(self.testButtonGroup.buttonToggled, self.on_test_selection)
 
     def setup_config_file_controls(self):
         try:
             config_file_path = self.general.get_config_file_path()
             self.lineEdit_11.setText(config_file_path)
             self.checkBox_12.setChecked(bool(config_file_path))
-            self.checkBox_12.stateChanged.connect(self.on_config_checkbox_changed)
-            self.lineEdit_11.textChanged.connect(self.on_config_path_changed)
+            self.bindings.add(self.checkBox_12.stateChanged, self.on_config_checkbox_changed)
+            self.bindings.add(self.lineEdit_11.textChanged, self.on_config_path_changed)
             print("Successfully set up config file controls")
         except Exception as e:
             print(f"Error setting up config file controls: {e}")
@@ -1081,7 +2882,7 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
                 except ValueError:
                     self.spinBox_9.setValue(0)
             self.spinBox_9.setSuffix("m")
-            self.spinBox_9.valueChanged.connect(self.on_runtime_changed)
+            self.bindings.add(self.spinBox_9.valueChanged, self.on_runtime_changed)
             print("Successfully set up runtime per core control")
         except Exception as e:
             print(f"Error setting up runtime per core control: {e}")
@@ -1095,7 +2896,7 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
                 frequency_days = 1
             self.spinBox_3.setValue(frequency_days)
             self.spinBox_3.setMinimum(1)
-            self.spinBox_3.valueChanged.connect(self.update_check_frequency)
+            self.bindings.add(self.spinBox_3.valueChanged, self.update_check_frequency)
             print("Successfully set up update frequency control")
         except Exception as e:
             print(f"Error setting up update frequency control: {e}")
@@ -1121,8 +2922,7 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
             if section not in self.config:
                 self.config[section] = {}
             self.config[section][option] = str(value)
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            save_config(self.config, self.config_file)
             print(f"Updated config.ini: [{section}] {option} = {value}")
         except Exception as e:
             print(f"Error writing to config.ini: {e}")
@@ -1156,11 +2956,38 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
                 self.general.update_config("useConfigFile", config_path)
         else:
             self.general.update_config("useConfigFile", "")
+        self.update_config_file_tooltip()
 
     def on_config_path_changed(self, text):
         if self.checkBox_12.isChecked():
             config_path = text.strip()
             self.general.update_config("useConfigFile", config_path)
+            self.update_config_file_tooltip()
+
+    def set_config_file_path(self, config_path):
+        """Set useConfigFile and mirror it in lineEdit_11/checkBox_12 without re-triggering their handlers."""
+        self.general.update_config("useConfigFile", config_path)
+        for widget in (self.lineEdit_11, self.checkBox_12):
+            widget.blockSignals(True)
+        self.lineEdit_11.setText(config_path)
+        self.checkBox_12.setChecked(bool(config_path))
+        for widget in (self.lineEdit_11, self.checkBox_12):
+            widget.blockSignals(False)
+        self.update_config_file_tooltip()
+
+    def update_config_file_tooltip(self):
+        """Warn on lineEdit_11 when the settings shown in the GUI are not the ones the script will use."""
+        shown = {section: dict(self.config[section]) for section in self.config.sections()}
+        differences = self.config_resolver.differences_from(shown)
+        if self.config_resolver.source == self.config_file or not differences:
+            self.lineEdit_11.setToolTip(f"Effective config: {self.config_resolver.source}")
+            return
+        lines = [f"{self.config_resolver.source} is active, these settings differ from config.ini:"]
+        lines += [f"[{section}] {name}: {value} (config.ini: {shown_value})"
+                  for section, name, shown_value, value, source in differences[:20]]
+        if len(differences) > 20:
+            lines.append(f"... and {len(differences) - 20} more")
+        self.lineEdit_11.setToolTip("\n".join(lines))
 
     def update_enable_update_check(self, state):
         enabled = state == QtCore.Qt.Checked
@@ -1170,19 +2997,30 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
         hours = days * 24
         self.update_config("Update", "updateCheckFrequency", hours)
 
-    def launch_core_cycler(self):
+    def launch_tool(self, name, path, elevated=False, callback=None):
+        """Start a tool through the shared launcher and report problems to the user."""
         try:
-            working_dir = os.path.dirname(os.path.abspath(__file__))
-            bat_path = os.path.join(working_dir, "Run CoreCycler.bat")
-            command = f'Start-Process "{bat_path}" -Verb RunAs'
-            subprocess.Popen(["powershell", "-Command", command], shell=True)
-            print(f"Requested admin launch for {bat_path}")
+            record = self.launcher.launch(name, path, elevated=elevated, callback=callback)
+            print(f"Requested {'admin ' if elevated else ''}launch for {path}")
+            return record
         except FileNotFoundError:
-            print(f"Error: {bat_path} not found.")
-            QtWidgets.QMessageBox.warning(self, "Error", f"Could not find {bat_path}")
+            print(f"Error: {path} not found.")
+            QtWidgets.QMessageBox.warning(self, "Error", f"Could not find {path}")
         except Exception as e:
-            print(f"Error launching Run CoreCycler.bat: {e}")
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch Run CoreCycler.bat: {str(e)}")
+            print(f"Error launching {name}: {e}")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch {name}: {str(e)}")
+        return None
+
+    def on_process_finished(self, record):
+        if record["status"] == "failed to start":
+            self.statusbar.showMessage(f"Failed to start {record['name']}", 10000)
+        elif record["exit_code"]:
+            self.statusbar.showMessage(f"{record['name']} exited with code {record['exit_code']}", 10000)
+
+    def launch_core_cycler(self):
+        working_dir = os.path.dirname(os.path.abspath(__file__))
+        bat_path = os.path.join(working_dir, "Run CoreCycler.bat")
+        return self.launch_tool("CoreCycler", bat_path, elevated=True)
 
     def launch_boost_tester(self):
         try:
@@ -1197,61 +3035,47 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch BoostTester: {str(e)}")
 
     def launch_pbo2_tuner(self):
-        try:
-            exe_path = r"tools\PBO2Tuner\PBO2Tuner.exe"
-            command = f'Start-Process "{exe_path}" -Verb RunAs'
-            subprocess.Popen(["powershell", "-Command", command], shell=True)
-            print(f"Requested admin launch for {exe_path}")
-        except FileNotFoundError:
-            print(f"Error: {exe_path} not found.")
-            QtWidgets.QMessageBox.warning(self, "Error", f"Could not find {exe_path}")
-        except Exception as e:
-            print(f"Error launching PBO2Tuner: {e}")
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch PBO2Tuner: {str(e)}")
+        return self.launch_tool("PBO2Tuner", r"tools\PBO2Tuner\PBO2Tuner.exe", elevated=True)
 
     def launch_intel_voltage_control(self):
-        try:
-            exe_path = r"tools\IntelVoltageControl\IntelVoltageControl.exe"
-            command = f'Start-Process "{exe_path}" -Verb RunAs'
-            subprocess.Popen(["powershell", "-Command", command], shell=True)
-            print(f"Requested admin launch for {exe_path}")
-        except FileNotFoundError:
-            print(f"Error: {exe_path} not found.")
-            QtWidgets.QMessageBox.warning(self, "Error", f"Could not find {exe_path}")
-        except Exception as e:
-            print(f"Error launching IntelVoltageControl: {e}")
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch IntelVoltageControl: {str(e)}")
+        return self.launch_tool("IntelVoltageControl", r"tools\IntelVoltageControl\IntelVoltageControl.exe", elevated=True)
 
     def launch_apicid(self):
-        try:
-            exe_path = r"tools\APICID.exe"
-            working_dir = os.path.dirname(exe_path)
-            generated_file_name = "APICID.txt"
-            generated_file_path = os.path.join(working_dir, generated_file_name)
-            before_files = set(glob.glob(os.path.join(working_dir, "*.txt")))
-            subprocess.run(exe_path, cwd=working_dir, check=True)
-            print(f"Executed {exe_path}")
-            if os.path.exists(generated_file_path):
-                os.startfile(generated_file_path)
-                print(f"Opened {generated_file_path}")
-            else:
-                after_files = set(glob.glob(os.path.join(working_dir, "*.txt")))
-                new_files = after_files - before_files
-                if new_files:
-                    new_file = new_files.pop()
-                    os.startfile(new_file)
-                    print(f"Opened newly generated file: {new_file}")
-                else:
-                    raise FileNotFoundError("No new .txt file was generated.")
-        except FileNotFoundError as e:
-            print(f"Error: {str(e)}")
-            QtWidgets.QMessageBox.warning(self, "Error", str(e))
-        except subprocess.CalledProcessError as e:
-            print(f"Error: APICID.exe failed with exit code {e.returncode}")
-            QtWidgets.QMessageBox.critical(self, "Error", f"APICID.exe failed with exit code {e.returncode}")
-        except Exception as e:
-            print(f"Error launching APICID or opening file: {e}")
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch APICID or open file: {str(e)}")
+        """Run APICID.exe in the background; its output is parsed into the cached topology."""
+        self.pushButton_8.setEnabled(False)
+        if self.launch_tool("APICID", r"tools\APICID.exe", callback=self.on_apicid_finished) is None:
+            self.pushButton_8.setEnabled(True)
+
+    def on_apicid_finished(self, record):
+        self.pushButton_8.setEnabled(True)
+        if record["status"] != "finished":
+            QtWidgets.QMessageBox.critical(self, "Error", f"APICID.exe {record['status']}")
+            return
+        output = "\n".join(record["output"])
+        entries = topology.parse_apicid_output(output)
+        if not entries:
+            print("Error: APICID.exe didn't output any APIC IDs")
+            QtWidgets.QMessageBox.warning(self, "Error", "APICID.exe didn't output any APIC IDs")
+            return
+        processor = os.environ.get("PROCESSOR_IDENTIFIER", "")
+        self.set_topology(topology.CpuTopology(entries, processor=processor))
+        self.topology.save()
+        dialog = TextReportDialog("APIC ID", self.topology.describe() + "\n\n" + output, self)
+        dialog.exec_()
+
+    def set_topology(self, cpu_topology):
+        self.topology = cpu_topology
+        self.update_cores_to_ignore_tooltip(self.lineEdit.text())
+
+    def update_cores_to_ignore_tooltip(self, text):
+        """Show which logical CPUs the coresToIgnore entries map to."""
+        if self.topology is None:
+            return
+        cores = [int(value) for value in re.findall(r"\d+", text)]
+        mapping = self.topology.cpus_for_cores(cores)
+        self.lineEdit.setToolTip("\n".join(
+            f"Core {core} -> CPU {', '.join(str(cpu) for cpu in cpus) or '?'}" for core, cpus in mapping.items()
+        ))
 
     def launch_core_tuner_x(self):
         try:
@@ -1266,17 +3090,56 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch CoreTunerX: {str(e)}")
 
     def run_performance_counters(self):
+        return self.launch_tool("PerformanceCounters", r"tools\enable_performance_counter.bat", elevated=True)
+
+    def open_run_queue(self):
+        dialog = RunQueueDialog(self.run_queue, self)
+        dialog.exec_()
+
+    def open_process_monitor(self):
+        dialog = ProcessMonitorDialog(self.launcher, self)
+        dialog.exec_()
+
+    def open_preset_library(self):
+        dialog = PresetLibraryDialog(self)
+        dialog.exec_()
+
+    def check_resume_state(self):
+        script_root = os.path.dirname(os.path.abspath(__file__))
         try:
-            bat_path = r"tools\enable_performance_counter.bat"
-            command = f'Start-Process "{bat_path}" -Verb RunAs'
-            subprocess.Popen(["powershell", "-Command", command], shell=True)
-            print(f"Requested admin launch for {bat_path}")
-        except FileNotFoundError:
-            print(f"Error: {bat_path} not found.")
-            QtWidgets.QMessageBox.warning(self, "Error", f"Could not find {bat_path}")
-        except Exception as e:
-            print(f"Error running PerformanceCounters.bat: {e}")
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to run PerformanceCounters.bat: {str(e)}")
+            state = automode.inspect_resume_state(script_root)
+        except (OSError, ValueError) as e:
+            print(f"Error reading the resume state: {e}")
+            return
+        if state is None:
+            return
+        print(f"Found a resume state for core {state['core']}")
+        dialog = ResumeStateDialog(self, state)
+        dialog.exec_()
+
+    def open_runtime_suggestion(self):
+        dialog = RuntimeSuggestionDialog(self)
+        dialog.exec_()
+
+    def open_budget_planner(self):
+        dialog = BudgetPlannerDialog(self)
+        dialog.exec_()
+
+    def open_log_search(self):
+        dialog = LogSearchDialog(self)
+        dialog.exec_()
+
+    def open_log_viewer(self):
+        dialog = LogViewerDialog(self)
+        dialog.exec_()
+
+    def open_charts(self):
+        dialog = ChartDialog(self)
+        dialog.exec_()
+
+    def open_ycruncher_memory_planner(self):
+        dialog = YCruncherMemoryDialog(self)
+        dialog.exec_()
 
     def open_script_folder(self):
         try:
@@ -1298,6 +3161,9 @@ class CoreCyclerApp(QtWidgets.QMainWindow, Ui_CoreCycler):
 # Entry point
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
+    if "--trace" in sys.argv or os.environ.get(tracing.TRACE_ENV):
+        tracing.tracer.enable()
+        app.aboutToQuit.connect(lambda: export_trace(tracing.tracer))
     window = CoreCyclerApp()
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,294 @@
+# monitor.py
+import os
+import sys
+import json
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import loganalysis
+
+# ===========================================
+# RunMonitor Class
+# ===========================================
+# A companion daemon for watching a test rig: it follows the newest CoreCycler
+# log, feeds the appended lines to a RunState and serves the state as JSON on
+# localhost. Requests are answered from the last snapshot, they never touch the log.
+DEFAULT_PORT = 8777
+DEFAULT_INTERVAL = 2.0
+LISTEN_ADDRESS = "127.0.0.1"
+METRICS_PREFIX = "corecycler_"
+
+
+class RunMonitor:
+    def __init__(self, log_dir, interval=DEFAULT_INTERVAL, metrics_file=None):
+        """
+        Follow the active CoreCycler log of a logs directory.
+
+        Args:
+            log_dir (str): The logs directory of the CoreCycler installation
+            interval (float): Seconds between two looks at the log
+            metrics_file (str): Also write the metrics to this file after every update,
+                e.g. for the textfile collector of the Prometheus node exporter
+        """
+        self.log_dir = log_dir
+        self.interval = interval
+        self.metrics_file = metrics_file
+        self.log_path = None
+        self.tail = None
+        self.run_state = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.snapshot = {"status": "waiting", "log": None}
+        self.snapshot_json = self.encode(self.snapshot)
+        self.metrics_text = format_metrics(self.snapshot).encode("utf-8")
+
+    def encode(self, snapshot):
+        return json.dumps(snapshot, indent=2).encode("utf-8")
+
+    def poll(self):
+        """Read what was appended to the log since the last poll and update the snapshot."""
+        newest = loganalysis.find_newest_log(self.log_dir)
+        if newest is not None and newest != self.log_path:
+            # A new run was started, follow its log from the beginning
+            self.log_path = newest
+            self.tail = loganalysis.LogTail(newest)
+            self.run_state = loganalysis.RunState(newest)
+            print(f"Following {newest}")
+        if self.run_state is None:
+            return
+
+        lines = self.tail.read_lines()
+        if not lines and self.snapshot.get("log") == self.run_state.state["log"]:
+            return
+        self.run_state.feed(lines)
+        snapshot = self.run_state.snapshot()
+        snapshot["updated"] = datetime.now().isoformat(timespec="seconds")
+        snapshot_json = self.encode(snapshot)
+        metrics_text = format_metrics(snapshot).encode("utf-8")
+        with self.lock:
+            self.snapshot = snapshot
+            self.snapshot_json = snapshot_json
+            self.metrics_text = metrics_text
+        if self.metrics_file:
+            self.write_metrics_file(metrics_text)
+
+    def write_metrics_file(self, metrics_text):
+        """Replace the metrics file in one step, so a scraper never reads half of it."""
+        temporary_file = self.metrics_file + ".tmp"
+        try:
+            with open(temporary_file, "wb") as metrics:
+                metrics.write(metrics_text)
+            os.replace(temporary_file, self.metrics_file)
+        except OSError as e:
+            print(f"Error writing the metrics file {self.metrics_file}: {e}")
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                self.poll()
+            except OSError as e:
+                print(f"Error reading {self.log_path}: {e}")
+            self.stopped.wait(self.interval)
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name="RunMonitor", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self.stopped.set()
+
+    def status_json(self):
+        with self.lock:
+            return self.snapshot_json
+
+    def metrics(self):
+        with self.lock:
+            return self.metrics_text
+
+
+# ===========================================
+# Prometheus metrics
+# ===========================================
+# The metrics are derived from the same incrementally updated snapshot as the
+# JSON status. Counters restart at zero with every new run, which Prometheus
+# treats as a counter reset.
+CORE_METRICS = [
+    # (name, type, help, key in the per-core counters)
+    ("core_tests_total", "counter", "Number of times the core was set for testing", "tests"),
+    ("core_ticks_total", "counter", "Test ticks logged while the core was tested", "ticks"),
+    ("core_cpu_usage_samples_total", "counter", "CPU usage checks of the stress test process", "cpu_samples"),
+    ("core_cpu_usage_dips_total", "counter", "CPU usage checks below the lower limit", "cpu_usage_dips"),
+    ("core_cpu_usage_last", "gauge", "Last measured CPU usage (ms, or % for the percentage check)", "cpu_usage_last"),
+    ("core_suspended_seconds_total", "counter", "Test time lost to periodically suspending the stress test", "suspended_seconds"),
+    ("core_fft_sizes_passed", "gauge", "Distinct FFT sizes passed on the core", "fft_sizes_passed"),
+]
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_metrics(snapshot):
+    """
+    Format a RunState snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot (dict): A RunState snapshot
+
+    Returns:
+        str: The metrics
+    """
+    lines = []
+    run_labels = {"program": snapshot.get("program", ""), "mode": snapshot.get("mode", "")}
+
+    def metric(name, metric_type, help_text, samples):
+        samples = [(labels, value) for labels, value in samples if value is not None]
+        if not samples:
+            return
+        lines.append(f"# HELP {METRICS_PREFIX}{name} {help_text}")
+        lines.append(f"# TYPE {METRICS_PREFIX}{name} {metric_type}")
+        for labels, value in samples:
+            label_text = ",".join(f'{key}="{escape_label(label)}"' for key, label in labels.items())
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{METRICS_PREFIX}{name}{label_text} {float(value):g}")
+
+    metric("up", "gauge", "1 while a CoreCycler log is followed",
+           [({"log": snapshot.get("log") or ""}, 1 if snapshot.get("log") else 0)])
+    metric("running", "gauge", "1 while the followed run is testing",
+           [(run_labels, 1 if snapshot.get("status") == "running" else 0)])
+    metric("elapsed_seconds", "gauge", "Run time according to the log", [(run_labels, snapshot.get("elapsed_seconds"))])
+    metric("iteration", "gauge", "Current iteration", [(run_labels, snapshot.get("iteration"))])
+    metric("current_core", "gauge", "Core being tested", [(run_labels, snapshot.get("core"))])
+    metric("tick", "gauge", "Current tick of the tested core", [(run_labels, snapshot.get("tick"))])
+    metric("remaining_max_runtime_seconds", "gauge", "Remaining maximum runtime of the tested core",
+           [(run_labels, snapshot.get("remaining_max_runtime"))])
+    metric("fft_sizes_tested", "gauge", "FFT sizes already tested on the current core",
+           [(run_labels, snapshot.get("fft_sizes_tested"))])
+    metric("fft_sizes_total", "gauge", "FFT sizes to test on the current core",
+           [(run_labels, snapshot.get("fft_sizes_total"))])
+
+    cores = snapshot.get("cores", {})
+    for name, metric_type, help_text, key in CORE_METRICS:
+        metric(name, metric_type, help_text,
+               [(dict(run_labels, core=core), counters[key]) for core, counters in sorted(cores.items(), key=core_sort_key)])
+
+    errors_per_core = snapshot.get("errors_per_core", {})
+    metric("errors_total", "counter", "Stress test errors", [(run_labels, snapshot.get("errors"))])
+    metric("core_errors_total", "counter", "Stress test errors per core",
+           [(dict(run_labels, core=core), errors_per_core.get(core, 0))
+            for core, _ in sorted(dict.fromkeys(list(cores) + list(errors_per_core), None).items(), key=core_sort_key)])
+    metric("fatal_error", "gauge", "1 if the script stopped with a fatal error",
+           [(run_labels, 1 if snapshot.get("fatal_error") else 0)])
+
+    whea = snapshot.get("whea", {})
+    metric("whea_lookups_total", "counter", "Event log lookups for new WHEA errors", [({}, whea.get("lookups"))])
+    metric("whea_new_errors_total", "counter", "New WHEA errors found", [({}, whea.get("new_errors"))])
+    metric("whea_cores_with_errors", "gauge", "Cores with a WHEA error so far", [({}, whea.get("cores_with_errors"))])
+
+    metric("co_value", "gauge", "Curve Optimizer value of the core",
+           [({"core": str(core)}, value) for core, value in enumerate(snapshot.get("co_values", []))])
+    return "\n".join(lines) + "\n"
+
+
+def core_sort_key(item):
+    return int(item[0]) if item[0].lstrip("-").isdigit() else -1
+
+
+# ===========================================
+# Status server
+# ===========================================
+class StatusRequestHandler(BaseHTTPRequestHandler):
+    monitor = None
+    routes = {}
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/") or "/"
+        route = self.routes.get(path)
+        if route is None:
+            self.send_error(404, "Unknown path")
+            return
+        content_type, body = route(self.monitor)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Status polls would flood the console
+
+
+def status_route(monitor):
+    return "application/json", monitor.status_json()
+
+
+def metrics_route(monitor):
+    return "text/plain; version=0.0.4; charset=utf-8", monitor.metrics()
+
+
+StatusRequestHandler.routes = {
+    "/": status_route,
+    "/status": status_route,
+    "/metrics": metrics_route,
+}
+
+
+def serve(monitor, port=DEFAULT_PORT):
+    """
+    Serve the monitor's snapshot on localhost.
+
+    Only the loopback address is bound, the status is not reachable from other machines.
+    """
+    handler = type("MonitorRequestHandler", (StatusRequestHandler,), {"monitor": monitor})
+    server = ThreadingHTTPServer((LISTEN_ADDRESS, port), handler)
+    server.daemon_threads = True
+    print(f"Serving the run status on http://{LISTEN_ADDRESS}:{server.server_port}/status")
+    print(f"Serving the metrics on http://{LISTEN_ADDRESS}:{server.server_port}/metrics")
+    return server
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def build_parser():
+    parser = argparse.ArgumentParser(description="Serve the state of the running CoreCycler test as JSON and Prometheus metrics on localhost.")
+    parser.add_argument("--logs", default="logs", help="The logs directory of the CoreCycler installation")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between two looks at the log")
+    parser.add_argument("--metrics-file", help="Also write the Prometheus metrics to this file after every update")
+    parser.add_argument("--once", action="store_true", help="Print the current state once and exit")
+    return parser
+
+
+def main(args):
+    if not os.path.isdir(args.logs):
+        print(f"The logs directory {args.logs} does not exist")
+        return 1
+    monitor = RunMonitor(args.logs, args.interval, args.metrics_file)
+    if args.once:
+        monitor.poll()
+        print(monitor.status_json().decode("utf-8"))
+        return 0
+
+    monitor.start()
+    try:
+        server = serve(monitor, args.port)
+    except OSError as e:
+        print(f"Could not listen on port {args.port}: {e}")
+        return 1
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        monitor.stop()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(build_parser().parse_args()))
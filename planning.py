@@ -0,0 +1,493 @@
+# planning.py
+import os
+import re
+import sys
+import glob
+import math
+import argparse
+import configparser
+from datetime import datetime
+
+import loganalysis
+import presets
+
+# ===========================================
+# Time to first error
+# ===========================================
+# Every test of a core in the log history is one observation: either the
+# time from "Set to Core" to the first error, or, for a test that passed, the
+# time it ran without an error (a censored observation). The Kaplan-Meier
+# estimate over these observations is the chance that a test is still
+# error-free after a given time.
+DEFAULT_COVERAGE = 0.95
+MIN_ERRORS_FOR_ADVICE = 5
+CURVE_MINUTES = [1, 2, 3, 5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 240, 360]
+
+
+def load_summaries(log_dir):
+    """Yield the (cached) summaries of all runs in the logs folder."""
+    for corecycler_log in sorted(glob.glob(os.path.join(glob.escape(log_dir), "CoreCycler_*.log"))):
+        try:
+            yield loganalysis.load_run_summary(corecycler_log)
+        except (OSError, ValueError) as e:
+            print(f"Skipping {corecycler_log}: {e}")
+
+
+def core_tests(summaries):
+    """
+    Turn run summaries into one observation per core test.
+
+    Returns:
+        list: Dicts with "program", "mode", "core", "duration" (seconds) and "failed"
+    """
+    observations = []
+    for summary in summaries:
+        for core, core_summary in summary["cores"].items():
+            errors = core_summary["errors"]
+            passed_tests = core_summary["tests"] - len(errors)
+            for error in errors:
+                observations.append({
+                    "program": summary["program"],
+                    "mode": summary["mode"],
+                    "core": int(core),
+                    "duration": error["time_to_error"],
+                    "failed": True,
+                })
+            if passed_tests > 0:
+                # The summary only has the total runtime of the core, spread it over the passed tests
+                passed_runtime = core_summary["runtime"] - sum(error["time_to_error"] for error in errors)
+                for _ in range(passed_tests):
+                    observations.append({
+                        "program": summary["program"],
+                        "mode": summary["mode"],
+                        "core": int(core),
+                        "duration": max(passed_runtime, 0.0) / passed_tests,
+                        "failed": False,
+                    })
+    return observations
+
+
+def kaplan_meier(observations):
+    """
+    Estimate the survival curve of the observations.
+
+    Returns:
+        list: (seconds, survival, at_risk, errors) at every time an error happened
+    """
+    curve = []
+    at_risk = len(observations)
+    survival = 1.0
+    ordered = sorted(observations, key=lambda observation: (observation["duration"], not observation["failed"]))
+    index = 0
+    while index < len(ordered):
+        duration = ordered[index]["duration"]
+        errors = 0
+        leaving = 0
+        while index < len(ordered) and ordered[index]["duration"] == duration:
+            errors += ordered[index]["failed"]
+            leaving += 1
+            index += 1
+        if errors:
+            survival *= 1 - errors / at_risk
+            curve.append((duration, survival, at_risk, errors))
+        at_risk -= leaving
+    return curve
+
+
+def survival_at(curve, seconds):
+    survival = 1.0
+    for duration, value, _, _ in curve:
+        if duration > seconds:
+            break
+        survival = value
+    return survival
+
+
+def runtime_for_coverage(observations, coverage=DEFAULT_COVERAGE):
+    """
+    The shortest runtime per core that would have caught the given share of the historical errors.
+
+    Returns:
+        float: Seconds, or None if there are no errors in the history
+    """
+    error_times = sorted(observation["duration"] for observation in observations if observation["failed"])
+    if not error_times:
+        return None
+    return error_times[max(math.ceil(coverage * len(error_times)) - 1, 0)]
+
+
+def errors_caught(observations, seconds):
+    """Share of the historical errors that happened within the given runtime."""
+    error_times = [observation["duration"] for observation in observations if observation["failed"]]
+    if not error_times:
+        return None
+    return sum(1 for duration in error_times if duration <= seconds) / len(error_times)
+
+
+def recommend_runtime(observations, coverage=DEFAULT_COVERAGE):
+    """
+    Recommend a runtimePerCore in whole minutes.
+
+    Returns:
+        dict: {"minutes", "errors", "tests", "coverage", "enough_data"}, "minutes" is None without errors
+    """
+    errors = sum(1 for observation in observations if observation["failed"])
+    seconds = runtime_for_coverage(observations, coverage)
+    return {
+        "minutes": None if seconds is None else max(1, math.ceil(seconds / 60)),
+        "errors": errors,
+        "tests": len(observations),
+        "coverage": coverage,
+        "enough_data": errors >= MIN_ERRORS_FOR_ADVICE,
+    }
+
+
+def group_observations(observations, keys):
+    groups = {}
+    for observation in observations:
+        groups.setdefault(tuple(observation[key] for key in keys), []).append(observation)
+    return groups
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "-"
+    return f"{seconds / 60:.1f}m"
+
+
+def format_survival_report(observations, coverage=DEFAULT_COVERAGE, current_minutes=None):
+    """
+    Describe the time to the first error, per test program and mode and per core.
+
+    Args:
+        observations (list): The core tests, see core_tests()
+        coverage (float): Share of the historical errors the recommendation has to catch
+        current_minutes (int): The configured runtimePerCore, None for "auto"
+    """
+    if not observations:
+        return "No core tests found in the log history."
+    lines = []
+    recommendation = recommend_runtime(observations, coverage)
+    if recommendation["minutes"] is None:
+        lines.append(f"No errors in {recommendation['tests']} core tests, there is nothing to base a runtime on.")
+    else:
+        lines.append(f"Recommended runtimePerCore: {recommendation['minutes']}m, which would have caught "
+                     f"{coverage:.0%} of {recommendation['errors']} errors in {recommendation['tests']} core tests")
+        if not recommendation["enough_data"]:
+            lines.append(f"Note: less than {MIN_ERRORS_FOR_ADVICE} errors, the recommendation is a rough guess")
+    if current_minutes:
+        caught = errors_caught(observations, current_minutes * 60)
+        if caught is not None:
+            lines.append(f"The current runtimePerCore of {current_minutes}m would have caught {caught:.0%} of them")
+
+    lines.append("")
+    lines.append(f"{'Program / mode / core':<32} {'Tests':>6} {'Errors':>6} {'Median':>8} {f'{coverage:.0%}':>8} {'Longest':>8}")
+    for keys in (("program", "mode"), ("program", "mode", "core")):
+        for group, members in sorted(group_observations(observations, keys).items()):
+            error_times = sorted(observation["duration"] for observation in members if observation["failed"])
+            name = " / ".join(str(value) for value in group)
+            median = error_times[(len(error_times) - 1) // 2] if error_times else None
+            lines.append(f"{name[:32]:<32} {len(members):>6} {len(error_times):>6} "
+                         f"{format_duration(median):>8} "
+                         f"{format_duration(runtime_for_coverage(members, coverage)):>8} "
+                         f"{format_duration(error_times[-1] if error_times else None):>8}")
+        lines.append("")
+
+    curve = kaplan_meier(observations)
+    longest = max(observation["duration"] for observation in observations)
+    lines.append("Survival curve (share of core tests still without an error)")
+    for minutes in CURVE_MINUTES:
+        if minutes * 60 > longest and minutes != CURVE_MINUTES[0]:
+            break
+        survival = survival_at(curve, minutes * 60)
+        lines.append(f"{minutes:>5}m {survival:>7.1%} {'#' * round(survival * 40)}")
+    return "\n".join(lines)
+
+
+# ===========================================
+# Time budget planner
+# ===========================================
+# The script has one runtimePerCore for all cores, but a custom coreTestOrder
+# may list a core several times, so riskier cores get more time by getting more
+# slots. Every core is modelled with a constant error rate taken from the log
+# history, shrunk towards the average rate so cores with little history get
+# the average. The chance to see an error on a core within T seconds is then
+# 1 - exp(-rate * T), and the slots are handed out greedily to the core where
+# one more slot adds the most risk-weighted detection chance.
+RUNTIME_CANDIDATES = [1, 2, 3, 5, 6, 10, 15, 20, 30, 45, 60]
+PRIOR_HOURS = 1.0
+CORE_SWITCH_SECONDS = 5
+PROGRAM_START_SECONDS = 10
+
+
+def core_risks(observations, cores):
+    """
+    Estimate the error rate of every core.
+
+    Args:
+        observations (list): The core tests, see core_tests()
+        cores (list): The cores to plan for
+
+    Returns:
+        dict: {core: errors per hour}
+    """
+    total_errors = sum(1 for observation in observations if observation["failed"])
+    total_hours = sum(observation["duration"] for observation in observations) / 3600
+    # Without any error in the history, assume one error in the tested time as a pessimistic average
+    average_rate = max(total_errors, 1) / (total_hours + PRIOR_HOURS)
+    risks = {}
+    for core in cores:
+        members = [observation for observation in observations if observation["core"] == core]
+        errors = sum(1 for observation in members if observation["failed"])
+        hours = sum(observation["duration"] for observation in members) / 3600
+        risks[core] = (errors + average_rate * PRIOR_HOURS) / (hours + PRIOR_HOURS)
+    return risks
+
+
+def switch_overhead(restart_program, delay_between_cores):
+    """Seconds lost every time the script moves on to the next core."""
+    if restart_program:
+        return CORE_SWITCH_SECONDS + delay_between_cores + PROGRAM_START_SECONDS
+    return CORE_SWITCH_SECONDS
+
+
+def detection_chance(rate_per_hour, seconds):
+    return 1 - math.exp(-rate_per_hour * seconds / 3600)
+
+
+def plan_coverage(risks, seconds_per_core):
+    """Risk-weighted average chance to see an error on a core within its planned time."""
+    total_risk = sum(risks.values())
+    return sum(risk * detection_chance(risk, seconds_per_core.get(core, 0)) for core, risk in risks.items()) / total_risk
+
+
+def allocate_slots(risks, slot_count, slot_seconds):
+    """Give every core one slot, then hand out the rest where they add the most detection chance."""
+    slots = {core: 1 for core in risks}
+    for _ in range(slot_count - len(slots)):
+        core = max(risks, key=lambda core: risks[core] * (
+            detection_chance(risks[core], (slots[core] + 1) * slot_seconds)
+            - detection_chance(risks[core], slots[core] * slot_seconds)))
+        slots[core] += 1
+    return slots
+
+
+def compact_slots(slots):
+    """
+    Express the slots as an order that is repeated maxIterations times.
+
+    Returns:
+        tuple: (iterations, {core: slots per iteration})
+    """
+    iterations = min(slots.values())
+    return iterations, {core: max(1, round(count / iterations)) for core, count in slots.items()}
+
+
+def interleaved_order(per_iteration, risks):
+    """Spread the repeated cores over the iteration, the riskiest core first in every round."""
+    order = []
+    for round_number in range(max(per_iteration.values())):
+        order += [core for core in sorted(per_iteration, key=lambda core: (-risks[core], core))
+                  if per_iteration[core] > round_number]
+    return order
+
+
+def plan_budget(budget_seconds, risks, overhead_seconds, runtime_candidates=None):
+    """
+    Find the runtimePerCore, maxIterations and coreTestOrder with the highest coverage that fit the budget.
+
+    Args:
+        budget_seconds (float): The time available for the whole run
+        risks (dict): {core: errors per hour}, see core_risks()
+        overhead_seconds (float): Seconds lost per core switch, see switch_overhead()
+        runtime_candidates (list): runtimePerCore values to try, in minutes
+
+    Returns:
+        dict: The best plan, or None if not even one slot per core fits
+    """
+    best = None
+    for minutes in runtime_candidates or RUNTIME_CANDIDATES:
+        slot_seconds = minutes * 60
+        slot_count = int(budget_seconds // (slot_seconds + overhead_seconds))
+        if slot_count < len(risks):
+            continue
+        iterations, per_iteration = compact_slots(allocate_slots(risks, slot_count, slot_seconds))
+        # Rounding to whole slots per iteration may overshoot, take slots from the safest cores
+        while iterations * sum(per_iteration.values()) > slot_count:
+            core = min((core for core in per_iteration if per_iteration[core] > 1),
+                       key=lambda core: risks[core], default=None)
+            if core is None:
+                iterations -= 1
+            else:
+                per_iteration[core] -= 1
+        seconds_per_core = {core: count * iterations * slot_seconds for core, count in per_iteration.items()}
+        plan = {
+            "runtime_minutes": minutes,
+            "max_iterations": iterations,
+            "order": interleaved_order(per_iteration, risks),
+            "seconds_per_core": seconds_per_core,
+            "total_seconds": iterations * sum(per_iteration.values()) * (slot_seconds + overhead_seconds),
+            "budget_seconds": budget_seconds,
+            "overhead_seconds": overhead_seconds,
+            "coverage": plan_coverage(risks, seconds_per_core),
+            "risks": dict(risks),
+        }
+        if best is None or plan["coverage"] > best["coverage"] + 1e-9:
+            best = plan
+    return best
+
+
+def format_plan(plan):
+    if plan is None:
+        return "The budget is too short to test every core once."
+    lines = [
+        f"runtimePerCore = {plan['runtime_minutes']}m",
+        f"maxIterations = {plan['max_iterations']}",
+        f"coreTestOrder = {', '.join(str(core) for core in plan['order'])}",
+        "",
+        f"Planned time: {plan['total_seconds'] / 3600:.2f}h of {plan['budget_seconds'] / 3600:.2f}h "
+        f"({plan['overhead_seconds']:.0f}s overhead per core switch)",
+        f"Expected coverage: {plan['coverage']:.1%} (risk-weighted chance to see an error on a core)",
+        "",
+        f"{'Core':>4} {'Errors/h':>9} {'Minutes':>8} {'Chance':>7}",
+    ]
+    for core, risk in sorted(plan["risks"].items(), key=lambda item: (-item[1], item[0])):
+        seconds = plan["seconds_per_core"][core]
+        lines.append(f"{core:>4} {risk:>9.3f} {seconds / 60:>8.0f} {detection_chance(risk, seconds):>7.1%}")
+    return "\n".join(lines)
+
+
+def write_plan_preset(plan, path, resolver, title, overwrite=False):
+    """
+    Save a plan as a preset in the configs folder.
+
+    A preset replaces config.ini, so it carries every effective setting that
+    differs from default.config.ini, with the planned values on top.
+
+    Raises:
+        ValueError: If the path is default.config.ini, which the script loads first
+        FileExistsError: If the preset exists and overwrite isn't set
+    """
+    if os.path.abspath(path) == os.path.abspath(resolver.default_config):
+        raise ValueError(f"{path} holds the default settings and can't be replaced by a plan")
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(f"The preset {path} already exists")
+    effective = resolver.resolve()
+    try:
+        defaults = presets.read_settings(resolver.default_config)
+    except (OSError, configparser.Error):
+        defaults = {}
+    planned = {
+        "runtimePerCore": f"{plan['runtime_minutes']}m",
+        "maxIterations": str(plan["max_iterations"]),
+        "coreTestOrder": ", ".join(str(core) for core in plan["order"]),
+    }
+
+    settings = {}
+    for section, values in effective.items():
+        for name, value in values.items():
+            if section.lower() == "general" and name.lower() in ("useconfigfile",) + tuple(key.lower() for key in planned):
+                continue
+            if presets.get_setting(defaults, section, name) != value:
+                settings.setdefault(section, {})[name] = value
+    settings.setdefault("General", {}).update(planned)
+
+    header = [
+        title,
+        f"Created by the time budget planner on {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"Planned time: {plan['total_seconds'] / 3600:.2f}h of {plan['budget_seconds'] / 3600:.2f}h, "
+        f"expected coverage: {plan['coverage']:.1%}",
+    ]
+    # Write next to the preset and replace it, so an existing preset is never left half written
+    temporary_file = path + ".tmp"
+    with open(temporary_file, "w", encoding="utf-8") as configfile:
+        configfile.write("".join(f"# {line}\n" for line in header) + "\n")
+        for section, values in settings.items():
+            configfile.write(f"[{section}]\n")
+            for name, value in values.items():
+                configfile.write(f"{name} = {value}\n")
+            configfile.write("\n")
+    os.replace(temporary_file, path)
+    return path
+
+
+def plan_from_history(log_dir, budget_hours, resolver, cores=None):
+    """
+    Plan a run for the selected test program from the log history and the effective config.
+
+    Args:
+        log_dir (str): Folder with the CoreCycler logs
+        budget_hours (float): The time available
+        resolver (presets.ConfigResolver): The effective configuration
+        cores (list): The cores of the CPU, defaults to the cores seen in the history
+
+    Returns:
+        dict: The plan, see plan_budget()
+    """
+    program = (resolver.get("General", "stressTestProgram", "") or "").upper()
+    observations = [observation for observation in core_tests(load_summaries(log_dir))
+                    if not program or observation["program"] == program]
+    if cores is None:
+        cores = sorted({observation["core"] for observation in observations})
+    ignored = {int(value) for value in re.findall(r"\d+", resolver.get("General", "coresToIgnore", "") or "")}
+    cores = [core for core in cores if core not in ignored]
+    if not cores:
+        return None
+    overhead = switch_overhead(
+        (resolver.get("General", "restartTestProgramForEachCore", "0") or "0").strip() == "1",
+        int(resolver.get("General", "delayBetweenCores", "15") or 15),
+    )
+    return plan_budget(budget_hours * 3600, core_risks(observations, cores), overhead)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def run_survival_command(args):
+    observations = core_tests(load_summaries(args.logs))
+    if args.program:
+        observations = [observation for observation in observations if observation["program"] == args.program.upper()]
+    print(format_survival_report(observations, args.coverage))
+    return 0
+
+
+def run_budget_command(args):
+    resolver = presets.ConfigResolver()
+    cores = list(range(args.cores)) if args.cores else None
+    plan = plan_from_history(args.logs, args.hours, resolver, cores)
+    print(format_plan(plan))
+    if plan is not None and args.save:
+        path = os.path.join(presets.CONFIG_DIR, f"{args.save}.config.ini")
+        try:
+            write_plan_preset(plan, path, resolver, f"Time budget plan for {args.hours:g} hours", args.force)
+        except (ValueError, FileExistsError) as e:
+            print(f"\n{e}" + (", use --force to replace it" if isinstance(e, FileExistsError) else ""))
+            return 1
+        print(f"\nSaved the plan as {path}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Plan CoreCycler test runs from the log history.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    survival_parser = subparsers.add_parser("survival", help="Time to the first error and a runtimePerCore recommendation")
+    survival_parser.add_argument("--logs", default="logs", help="Folder with the CoreCycler logs")
+    survival_parser.add_argument("--program", help="Only use runs of this test program, e.g. PRIME95")
+    survival_parser.add_argument("--coverage", type=float, default=DEFAULT_COVERAGE,
+                                 help="Share of the historical errors the runtime has to catch (default: 0.95)")
+    survival_parser.set_defaults(handler=run_survival_command)
+
+    budget_parser = subparsers.add_parser("budget", help="Plan a run that fits a time budget")
+    budget_parser.add_argument("hours", type=float, help="The time available, e.g. 8 for a night")
+    budget_parser.add_argument("--logs", default="logs", help="Folder with the CoreCycler logs")
+    budget_parser.add_argument("--cores", type=int, help="Number of physical cores (default: the cores in the history)")
+    budget_parser.add_argument("--save", metavar="NAME", help="Save the plan as configs\\NAME.config.ini")
+    budget_parser.add_argument("--force", action="store_true", help="Replace an existing preset of that name")
+    budget_parser.set_defaults(handler=run_budget_command)
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
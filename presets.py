@@ -0,0 +1,455 @@
+# presets.py
+import os
+import sys
+import json
+import argparse
+import configparser
+
+# ===========================================
+# Config file reading
+# ===========================================
+# The script merges the settings the same way for every config file:
+# default.config.ini first, then either config.ini or the file set in
+# [General] useConfigFile on top of it. Empty values don't overwrite anything,
+# and the setting names are case-insensitive.
+CONFIG_DIR = "configs"
+DEFAULT_CONFIG_FILE = os.path.join(CONFIG_DIR, "default.config.ini")
+USER_CONFIG_FILE = "config.ini"
+
+# Program sections and the [General] settings shown as the key settings of a preset
+PROGRAM_SECTIONS = {
+    "PRIME95": "Prime95",
+    "LINPACK": "Linpack",
+    "AIDA64": "Aida64",
+    "YCRUNCHER": "yCruncher",
+    "YCRUNCHER_OLD": "yCruncher",
+}
+KEY_GENERAL_SETTINGS = [
+    "stressTestProgram",
+    "runtimePerCore",
+    "numberOfThreads",
+    "coreTestOrder",
+    "maxIterations",
+    "suspendPeriodically",
+    "skipCoreOnError",
+    "stopOnError",
+]
+
+
+def read_settings(path):
+    """
+    Read a config file into nested dicts, keeping the spelling of the setting names.
+
+    Returns:
+        dict: {section: {setting: value}}
+
+    Raises:
+        OSError: If the file can't be read
+        configparser.Error: If the file can't be parsed
+    """
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = str
+    with open(path, "r", encoding="utf-8", errors="replace") as configfile:
+        parser.read_file(configfile)
+    return {section: dict(parser[section]) for section in parser.sections()}
+
+
+def read_header_comment(path):
+    """Return the leading comment block of a config file, which describes most presets."""
+    lines = []
+    with open(path, "r", encoding="utf-8", errors="replace") as configfile:
+        for line in configfile:
+            if not line.startswith("#"):
+                if lines or line.strip():
+                    break
+                continue
+            lines.append(line.lstrip("#").strip())
+    return "\n".join(lines).strip()
+
+
+def merge_settings(*layers):
+    """
+    Merge config files the way the script does, later layers winning.
+
+    Setting names are compared case-insensitively (config.ini is written in lowercase
+    by the GUI); the first spelling seen is kept.
+
+    Returns:
+        dict: {section: {setting: value}}
+    """
+    merged = {}
+    names = {}
+    for layer in layers:
+        for section, settings in layer.items():
+            target = merged.setdefault(section, {})
+            for name, value in settings.items():
+                if not value.strip():
+                    continue
+                name = names.setdefault((section, name.lower()), name)
+                target[name] = value
+    return merged
+
+
+def get_setting(settings, section, name, fallback=None):
+    """Look up a setting case-insensitively."""
+    for key, value in settings.get(section, {}).items():
+        if key.lower() == name.lower():
+            return value
+    return fallback
+
+
+def diff_settings(before, after):
+    """
+    Compare two merged configurations.
+
+    Returns:
+        list: (section, setting, before value, after value) tuples for every difference
+    """
+    differences = []
+    for section in sorted(set(before) | set(after), key=str.lower):
+        before_section = {name.lower(): (name, value) for name, value in before.get(section, {}).items()}
+        after_section = {name.lower(): (name, value) for name, value in after.get(section, {}).items()}
+        for key in sorted(set(before_section) | set(after_section)):
+            name, before_value = before_section.get(key, (None, None))
+            after_name, after_value = after_section.get(key, (None, None))
+            if before_value != after_value:
+                differences.append((section, name or after_name, before_value, after_value))
+    return differences
+
+
+def key_settings(settings):
+    """
+    Pick the settings that characterize a configuration: the main [General]
+    settings and the section of the selected stress test program.
+
+    Returns:
+        list: (section, setting, value) tuples
+    """
+    result = []
+    for name in KEY_GENERAL_SETTINGS:
+        value = get_setting(settings, "General", name)
+        if value is not None:
+            result.append(("General", name, value))
+    program = (get_setting(settings, "General", "stressTestProgram", "") or "").upper()
+    section = PROGRAM_SECTIONS.get(program)
+    for name, value in settings.get(section, {}).items():
+        result.append((section, name, value))
+    return result
+
+
+# ===========================================
+# ConfigFileCache Class
+# ===========================================
+class ConfigFileCache:
+    def __init__(self):
+        """Parsed config files, re-read only when their modification time or size changes."""
+        self.entries = {}
+        self.files_read = 0
+
+    @staticmethod
+    def signature(path):
+        """Return the (mtime, size) of a file, or None if it doesn't exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def read(self, path):
+        """
+        Return the parsed settings and header of a config file, re-reading it only if it changed.
+
+        Returns:
+            dict: {"signature", "settings", "description", "error"}, or None if the file doesn't exist
+        """
+        signature = self.signature(path)
+        if signature is None:
+            self.entries.pop(path, None)
+            return None
+        cached = self.entries.get(path)
+        if cached is not None and cached["signature"] == signature:
+            return cached
+
+        entry = {"signature": signature, "settings": {}, "description": "", "error": None}
+        try:
+            entry["settings"] = read_settings(path)
+            entry["description"] = read_header_comment(path)
+        except (OSError, configparser.Error) as e:
+            entry["error"] = str(e)
+            print(f"Error reading config file {path}: {e}")
+        self.entries[path] = entry
+        self.files_read += 1
+        return entry
+
+
+# ===========================================
+# ConfigResolver Class
+# ===========================================
+class ConfigResolver:
+    def __init__(self, default_config=DEFAULT_CONFIG_FILE, user_config=USER_CONFIG_FILE, cache=None):
+        """
+        The effective configuration the script will run with, and where each value comes from.
+
+        The merged settings are built once and only rebuilt when resolve() finds that
+        default.config.ini, config.ini or the file set in useConfigFile changed; lookups
+        are dict accesses and don't touch the files.
+        Like the script, a valid useConfigFile replaces config.ini completely, and
+        default.config.ini fills in everything that is missing or empty.
+
+        Args:
+            default_config (str): Path of default.config.ini
+            user_config (str): Path of config.ini
+            cache (ConfigFileCache): Shared cache of parsed config files
+        """
+        self.default_config = default_config
+        self.user_config = user_config
+        self.cache = cache if cache is not None else ConfigFileCache()
+        self.signatures = None
+        self.values = {}
+        self.settings = {}
+        self.source = user_config
+        self.builds = 0
+
+    @staticmethod
+    def config_file_path(value):
+        """Turn a useConfigFile value (relative to the script folder, with backslashes) into a path."""
+        return value.strip(" \"'\t").replace("\\", os.sep)
+
+    def current_signatures(self):
+        user_entry = self.cache.read(self.user_config)
+        use_config_file = ""
+        if user_entry is not None:
+            use_config_file = (get_setting(user_entry["settings"], "General", "useConfigFile", "") or "").strip(" \"'\t")
+        signatures = [
+            self.cache.signature(self.default_config),
+            user_entry["signature"] if user_entry else None,
+            use_config_file,
+        ]
+        if use_config_file:
+            custom_path = self.config_file_path(use_config_file)
+            signatures += [custom_path, self.cache.signature(custom_path)]
+        return tuple(signatures)
+
+    def resolve(self):
+        """
+        Rebuild the effective configuration if one of its source files changed.
+
+        Returns:
+            dict: {section: {setting: value}}
+        """
+        signatures = self.current_signatures()
+        if signatures == self.signatures:
+            return self.settings
+
+        layers = []
+        default_entry = self.cache.read(self.default_config)
+        if default_entry is not None:
+            layers.append((os.path.basename(self.default_config), default_entry["settings"]))
+
+        user_entry = self.cache.read(self.user_config)
+        self.source = self.user_config
+        user_layer = (os.path.basename(self.user_config), user_entry["settings"] if user_entry else {})
+        use_config_file = signatures[2]
+        if use_config_file:
+            custom_entry = self.cache.read(signatures[3])
+            if custom_entry is not None and custom_entry["error"] is None:
+                user_layer = (use_config_file, custom_entry["settings"])
+                self.source = use_config_file
+        layers.append(user_layer)
+
+        values = {}
+        names = {}
+        for source, layer in layers:
+            for section, settings in layer.items():
+                for name, value in settings.items():
+                    if not value.strip():
+                        continue
+                    key = (section.lower(), name.lower())
+                    section_name, setting_name = names.setdefault(key, (section, name))
+                    values[key] = (section_name, setting_name, value, source)
+
+        self.values = values
+        self.settings = {}
+        for section, name, value, source in values.values():
+            self.settings.setdefault(section, {})[name] = value
+        self.signatures = signatures
+        self.builds += 1
+        return self.settings
+
+    def get(self, section, name, fallback=None):
+        """Return the effective value of a setting, as of the last resolve()."""
+        if self.signatures is None:
+            self.resolve()
+        entry = self.values.get((section.lower(), name.lower()))
+        return entry[2] if entry else fallback
+
+    def source_of(self, section, name):
+        """Return the file the effective value of a setting comes from, or None if it isn't set."""
+        if self.signatures is None:
+            self.resolve()
+        entry = self.values.get((section.lower(), name.lower()))
+        return entry[3] if entry else None
+
+    def differences_from(self, settings):
+        """
+        Compare the effective configuration with e.g. the config.ini the GUI edits.
+
+        Returns:
+            list: (section, setting, value in settings, effective value, source) tuples
+        """
+        self.resolve()
+        differences = []
+        for (section_key, name_key), (section, name, value, source) in sorted(self.values.items()):
+            shown = get_setting(settings, section, name)
+            if shown is not None and shown != value:
+                differences.append((section, name, shown, value, source))
+        return differences
+
+    def describe(self):
+        """Render the effective configuration with the source of every value."""
+        self.resolve()
+        lines = [f"Effective configuration (from {self.source} on top of {os.path.basename(self.default_config)})", ""]
+        current_section = None
+        for section, name, value, source in sorted(self.values.values(), key=lambda entry: (entry[0].lower(), entry[1].lower())):
+            if section != current_section:
+                if current_section is not None:
+                    lines.append("")
+                lines.append(f"[{section}]")
+                current_section = section
+            lines.append(f"  {name} = {value}".ljust(60) + f"  ({source})")
+        return "\n".join(lines)
+
+
+# ===========================================
+# PresetLibrary Class
+# ===========================================
+class PresetLibrary:
+    def __init__(self, resolver, config_dir=CONFIG_DIR):
+        """
+        Index of the preset config files, cached by modification time.
+
+        Each preset is parsed once; a rescan only re-reads the files whose
+        modification time or size changed. The differences to the current
+        configuration are computed during the scan, so switching between
+        presets in the GUI doesn't touch the disk.
+
+        Args:
+            resolver (ConfigResolver): The effective configuration; its file cache is shared
+            config_dir (str): Folder with the preset config files
+        """
+        self.resolver = resolver
+        self.cache = resolver.cache
+        self.config_dir = config_dir
+        self.presets = {}
+        self.current = {}
+        self.current_source = resolver.user_config
+
+    def preset_path(self, name):
+        """Return the useConfigFile value for a preset, relative to the script folder."""
+        return self.config_dir + "\\" + name
+
+    def scan(self):
+        """
+        Update the index and the differences of every preset to the current configuration.
+
+        Returns:
+            list: The preset file names, sorted
+        """
+        files_read = self.cache.files_read
+        default_entry = self.cache.read(self.resolver.default_config)
+        defaults = default_entry["settings"] if default_entry else {}
+
+        # The current configuration is config.ini, or the preset config.ini points to
+        self.current = self.resolver.resolve()
+        self.current_source = self.resolver.source
+
+        try:
+            names = sorted(
+                entry.name for entry in os.scandir(self.config_dir)
+                if entry.is_file() and entry.name.lower().endswith(".ini")
+            )
+        except OSError as e:
+            print(f"Error reading {self.config_dir}: {e}")
+            names = []
+
+        presets = {}
+        for name in names:
+            entry = self.cache.read(os.path.join(self.config_dir, name))
+            if entry is None:
+                continue
+            settings = merge_settings(defaults, entry["settings"])
+            presets[name] = {
+                "name": name,
+                "path": self.preset_path(name),
+                "description": entry["description"],
+                "error": entry["error"],
+                "settings": settings,
+                "key_settings": key_settings(settings),
+                "diff": diff_settings(self.current, settings),
+            }
+        self.presets = presets
+        print(f"Preset library: read {self.cache.files_read - files_read} changed file(s), {len(presets)} presets indexed")
+        return names
+
+    def describe(self, name):
+        """Render the description, key settings and differences of a preset as text."""
+        preset = self.presets[name]
+        lines = [preset["path"], ""]
+        if preset["error"]:
+            lines += [f"Error: {preset['error']}", ""]
+        if preset["description"]:
+            lines += [preset["description"], ""]
+
+        lines.append("Key settings:")
+        for section, setting, value in preset["key_settings"]:
+            lines.append(f"  [{section}] {setting} = {value}")
+
+        lines += ["", f"Changes compared to the current configuration ({self.current_source}):"]
+        if not preset["diff"]:
+            lines.append("  (none)")
+        for section, setting, before, after in preset["diff"]:
+            before = "(not set)" if before is None else before
+            after = "(not set)" if after is None else after
+            lines.append(f"  [{section}] {setting}: {before} -> {after}")
+        return "\n".join(lines)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def run_effective_command(args):
+    resolver = ConfigResolver(user_config=args.config)
+    if args.setting:
+        section, _, name = args.setting.partition(".")
+        value = resolver.get(section, name)
+        if value is None:
+            print(f"[{section}] {name} is not set")
+            return 1
+        print(f"{value}  ({resolver.source_of(section, name)})")
+        return 0
+    if args.json:
+        settings = resolver.resolve()
+        sources = {
+            f"{section}.{name}": source for section, name, value, source in resolver.values.values()
+        }
+        print(json.dumps({"source": resolver.source, "settings": settings, "sources": sources}, indent=2))
+    else:
+        print(resolver.describe())
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Inspect the CoreCycler config files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    effective_parser = subparsers.add_parser("effective", help="Show the settings the script will run with")
+    effective_parser.add_argument("setting", nargs="?", help="Only show one setting, e.g. General.runtimePerCore")
+    effective_parser.add_argument("--config", default=USER_CONFIG_FILE, help="Path to the config.ini")
+    effective_parser.add_argument("--json", action="store_true", help="Print the settings and their sources as JSON")
+    effective_parser.set_defaults(handler=run_effective_command)
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
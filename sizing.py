@@ -0,0 +1,604 @@
+# sizing.py
+import os
+import re
+import sys
+import glob
+import argparse
+import configparser
+
+import loganalysis
+import presets
+import topology
+
+# ===========================================
+# Byte sizes
+# ===========================================
+# Memory settings are either a plain number of bytes or a "short" notation such
+# as "64MB" or "12.8 MiB", like Get-ByteValueFromString in the script reads them.
+# The sysfs cache sizes ("48K", "2048K") use K and M for KiB and MiB.
+BYTE_UNITS = {
+    "tb": 1000 ** 4, "gb": 1000 ** 3, "mb": 1000 ** 2, "kb": 1000,
+    "tib": 1024 ** 4, "gib": 1024 ** 3, "mib": 1024 ** 2, "kib": 1024,
+    "m": 1024 ** 2, "k": 1024, "b": 1,
+}
+BYTE_SIZE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(tib|gib|mib|kib|tb|gb|mb|kb|m|k|b)\b", re.IGNORECASE)
+
+
+def parse_byte_size(text):
+    """
+    Convert a memory setting to bytes.
+
+    Returns:
+        int: The number of bytes, or None if the text has no number
+    """
+    text = str(text).strip()
+    matches = BYTE_SIZE_PATTERN.findall(text)
+    if matches:
+        return int(sum(float(number) * BYTE_UNITS[unit.lower()] for number, unit in matches))
+    match = re.search(r"\d+", text)
+    return int(match.group(0)) if match else None
+
+
+def format_bytes(value):
+    for unit, size in (("GiB", 1024 ** 3), ("MiB", 1024 ** 2), ("KiB", 1024)):
+        if value >= size:
+            return f"{value / size:.1f} {unit}"
+    return f"{value:.0f} B"
+
+
+# ===========================================
+# Cache sizes
+# ===========================================
+# The sizes of the caches of one core: L1 (data) and L2 belong to the core, L3
+# is shared with the other cores of the CCD / cluster, which are idle while
+# CoreCycler tests a single core. They come from a [Caches] section in the
+# topology file, or from sysfs:
+#   [Caches]
+#   L1 = 48KiB
+#   L2 = 1MiB
+#   L3 = 32MiB
+CACHE_SECTION = "Caches"
+CACHE_LEVELS = ["L1", "L2", "L3"]
+SYSFS_CACHE_DIR = "/sys/devices/system/cpu/cpu0/cache"
+
+
+def caches_from_topology_file(path=topology.TOPOLOGY_FILE):
+    parser = configparser.ConfigParser()
+    parser.optionxform = str
+    try:
+        if not parser.read(path, encoding="utf-8") or CACHE_SECTION not in parser:
+            return None
+    except configparser.Error as e:
+        print(f"Error reading {path}: {e}")
+        return None
+    caches = {}
+    for level, value in parser[CACHE_SECTION].items():
+        size = parse_byte_size(value)
+        if level.upper() in CACHE_LEVELS and size:
+            caches[level.upper()] = size
+    return caches or None
+
+
+def caches_from_sysfs(cache_dir=SYSFS_CACHE_DIR):
+    caches = {}
+    for index_dir in sorted(glob.glob(os.path.join(cache_dir, "index*"))):
+        try:
+            with open(os.path.join(index_dir, "type")) as type_file:
+                if type_file.read().strip() == "Instruction":
+                    continue
+            with open(os.path.join(index_dir, "level")) as level_file:
+                level = f"L{level_file.read().strip()}"
+            with open(os.path.join(index_dir, "size")) as size_file:
+                size = parse_byte_size(size_file.read())
+        except OSError:
+            continue
+        if level in CACHE_LEVELS and size:
+            caches[level] = size
+    return caches or None
+
+
+def load_cache_sizes(path=topology.TOPOLOGY_FILE, cache_dir=SYSFS_CACHE_DIR):
+    """
+    Find the cache sizes of a core, the topology file taking precedence.
+
+    Returns:
+        tuple: ({"L1": bytes, "L2": bytes, "L3": bytes}, source), or ({}, None) if unknown
+    """
+    caches = caches_from_topology_file(path)
+    if caches:
+        return caches, path
+    caches = caches_from_sysfs(cache_dir)
+    if caches:
+        return caches, "sysfs"
+    return {}, None
+
+
+# ===========================================
+# y-cruncher memory planner
+# ===========================================
+# y-cruncher splits the memory setting between its threads. The small in-cache
+# tests use a fixed working set, the large ones scale with the memory per
+# thread. Both are calibrated from the "Mem/Thread" column the stress tester
+# prints at the start of every yCruncher_*.log; until a test has been seen in a
+# log, the sizes measured for SFTv4 and FFTv4 stand in.
+YCRUNCHER_TESTS = {
+    # tag: (name, scales with the memory setting)
+    "BKT": ("Basecase + Karatsuba", False),
+    "BBP": ("BBP Digit Extraction", False),
+    "SFT": ("Small In-Cache FFT", False),
+    "SFTv4": ("Small In-Cache FFTv4", False),
+    "SNT": ("Small In-Cache N63", False),
+    "SVT": ("Small In-Cache VT3", False),
+    "FFT": ("Fast Fourier Transform", True),
+    "FFTv4": ("Fast Fourier Transform (v4)", True),
+    "N63": ("Classic NTT (v2)", True),
+    "VT3": ("Vector Transform (v3)", True),
+    "N32": ("Classic NTT (32-bit)", True),
+    "N64": ("Classic NTT (64-bit)", True),
+    "HNT": ("Hybrid NTT", True),
+    "VST": ("Vector Transform", True),
+    "C17": ("Code 17 Experiment", True),
+}
+YCRUNCHER_DEFAULT_MEMORY = {1: 13418572, 2: 26567600}  # "memory = Default" in the script
+DEFAULT_SCALED_SHARE = 0.88  # FFTv4: 11.2 MiB of 12.7 MiB per thread
+DEFAULT_IN_CACHE_SIZE = 237 * 1024  # SFTv4
+YCRUNCHER_START_SECONDS = 5  # Starting y-cruncher and allocating the memory, per core
+
+YCRUNCHER_MEMORY_PATTERN = re.compile(r"Memory:\s+([\d.]+ [KMG]iB)\s+\(\s*([\d.]+ [KMG]iB) per thread")
+YCRUNCHER_TEST_ROW_PATTERN = re.compile(r"^\s*\d+\s+([A-Za-z0-9]+)\s+.+?\s+(Disabled|[\d.]+ [KMG]iB)\s{2,}\S")
+
+# Where the per-thread working set should land, as (cache level, share of the
+# per-thread cache) for in-cache targets, or a multiple of the whole L3 for RAM
+TARGETS = {
+    "L2": ("L2", 0.5),
+    "L3": ("L3", 0.5),
+    "RAM": ("L3", 4.0),
+}
+
+
+def calibrate_ycruncher(log_dir):
+    """
+    Collect the working set of every test from the y-cruncher logs.
+
+    Returns:
+        dict: {tag: {"size": bytes, "share": of the memory per thread, "samples": count}}
+    """
+    totals = {}
+    for path in glob.glob(os.path.join(glob.escape(log_dir), "yCruncher_*.log")):
+        per_thread = None
+        try:
+            with loganalysis.open_log(path) as log:
+                for number, line in enumerate(log):
+                    if number > 200:
+                        break  # The test table is at the start
+                    match = YCRUNCHER_MEMORY_PATTERN.search(line)
+                    if match:
+                        per_thread = parse_byte_size(match.group(2))
+                        continue
+                    match = YCRUNCHER_TEST_ROW_PATTERN.match(line)
+                    if match and match.group(2) != "Disabled" and per_thread:
+                        size = parse_byte_size(match.group(2))
+                        entry = totals.setdefault(match.group(1), {"size": 0, "share": 0.0, "samples": 0})
+                        entry["size"] += size
+                        entry["share"] += size / per_thread
+                        entry["samples"] += 1
+        except OSError as e:
+            print(f"Error reading {path}: {e}")
+    return {
+        tag: {"size": entry["size"] / entry["samples"], "share": entry["share"] / entry["samples"],
+              "samples": entry["samples"]}
+        for tag, entry in totals.items()
+    }
+
+
+def working_set(tag, per_thread, calibration):
+    """
+    The per-thread working set of a test.
+
+    Returns:
+        tuple: (bytes, "log" or "estimate")
+    """
+    scales = YCRUNCHER_TESTS.get(tag, ("", True))[1]
+    measured = calibration.get(tag)
+    if scales:
+        return per_thread * (measured["share"] if measured else DEFAULT_SCALED_SHARE), "log" if measured else "estimate"
+    return (measured["size"] if measured else DEFAULT_IN_CACHE_SIZE), "log" if measured else "estimate"
+
+
+def cache_level(size, caches, threads):
+    """The smallest cache level holding a per-thread working set, or "RAM"."""
+    for level in CACHE_LEVELS:
+        if level in caches and size <= caches[level] / threads:
+            return level
+    return "RAM" if caches else "?"
+
+
+def ycruncher_memory(value, threads):
+    """The bytes y-cruncher allocates for a memory setting."""
+    if value is None or str(value).strip().lower() == "default":
+        return YCRUNCHER_DEFAULT_MEMORY[2 if threads > 1 else 1]
+    return parse_byte_size(value) or YCRUNCHER_DEFAULT_MEMORY[2 if threads > 1 else 1]
+
+
+def memory_for_target(target, tests, threads, caches, calibration):
+    """
+    The memory setting that puts the working set of the scaling tests into a cache level, or beyond the L3.
+
+    Returns:
+        int: Bytes, or None without the cache size or any scaling test
+    """
+    level, factor = TARGETS[target]
+    scaled = [tag for tag in tests if YCRUNCHER_TESTS.get(tag, ("", True))[1]]
+    if level not in caches or not scaled:
+        return None
+    if target == "RAM":
+        per_thread_set = caches[level] * factor
+    else:
+        per_thread_set = caches[level] / threads * factor
+    # The test with the largest share decides, so none of them spills over
+    share = max(working_set(tag, 1.0, calibration)[0] for tag in scaled)
+    return int(per_thread_set / share * threads)
+
+
+def plan_ycruncher(memory, threads, tests, caches, calibration, test_duration, cores=None):
+    """
+    Work out the working sets, memory footprint and runtime of a y-cruncher configuration.
+
+    Args:
+        memory (int): The memory setting in bytes
+        threads (int): numberOfThreads
+        tests (list): The test tags
+        caches (dict): {"L1", "L2", "L3": bytes} of one core
+        calibration (dict): See calibrate_ycruncher()
+        test_duration (int): Seconds per test
+        cores (int): Number of cores tested per iteration
+
+    Returns:
+        dict: The plan
+    """
+    per_thread = memory / threads
+    rows = []
+    for tag in tests:
+        size, source = working_set(tag, per_thread, calibration)
+        rows.append({
+            "tag": tag,
+            "name": YCRUNCHER_TESTS.get(tag, ("Unknown test", True))[0],
+            "working_set": size,
+            "source": source,
+            "level": cache_level(size, caches, threads),
+        })
+    core_seconds = len(tests) * test_duration + YCRUNCHER_START_SECONDS
+    return {
+        "memory": memory,
+        "threads": threads,
+        "per_thread": per_thread,
+        "caches": caches,
+        "tests": rows,
+        "core_seconds": core_seconds,
+        "cores": cores,
+        "iteration_seconds": core_seconds * cores if cores else None,
+    }
+
+
+def format_memory_setting(memory):
+    """Memory in MB with one decimal, the unit of the memory field in the GUI."""
+    return f"{memory / 1000 ** 2:.1f}MB"
+
+
+def format_ycruncher_plan(plan, targets=None):
+    threads = plan["threads"]
+    caches = plan["caches"]
+    lines = [
+        f"Memory:             {format_bytes(plan['memory'])} ({format_bytes(plan['per_thread'])} per thread, "
+        f"{threads} thread{'s' if threads > 1 else ''})",
+    ]
+    if caches:
+        lines.append("Cache per thread:   " + ", ".join(
+            f"{level} {format_bytes(caches[level] / threads)}" for level in CACHE_LEVELS if level in caches))
+    else:
+        lines.append("Cache per thread:   unknown, add a [Caches] section to the topology file")
+    lines.append("")
+    lines.append(f"{'Test':<6} {'Name':<28} {'Mem/Thread':>11}  Lands in")
+    for row in plan["tests"]:
+        estimate = " (estimated)" if row["source"] == "estimate" else ""
+        lines.append(f"{row['tag']:<6} {row['name']:<28} {format_bytes(row['working_set']):>11}  {row['level']}{estimate}")
+    lines.append("")
+    lines.append(f"Runtime per core:   {plan['core_seconds'] // 60}m {plan['core_seconds'] % 60:02d}s "
+                 f"({len(plan['tests'])} tests)")
+    if plan["iteration_seconds"]:
+        minutes = plan["iteration_seconds"] / 60
+        lines.append(f"Runtime per iteration: {minutes:.0f}m for {plan['cores']} cores")
+    if targets:
+        lines.append("")
+        lines.append("Memory settings for the scaling tests:")
+        for target, memory in targets.items():
+            description = "out of cache" if target == "RAM" else f"in {target}"
+            lines.append(f"  {description:<14} " + (format_memory_setting(memory) if memory else "unknown cache size"))
+    return "\n".join(lines)
+
+
+def ycruncher_plan_from_config(resolver, log_dir, caches, memory=None, cores=None):
+    """
+    Plan the effective y-cruncher configuration.
+
+    Args:
+        resolver (presets.ConfigResolver): The effective configuration
+        log_dir (str): The logs folder, for the calibration
+        caches (dict): The cache sizes of one core
+        memory (int): Plan this memory setting instead of the configured one
+        cores (int): Number of cores tested per iteration
+
+    Returns:
+        tuple: (plan, {target: memory setting in bytes})
+    """
+    threads = 2 if (resolver.get("General", "numberOfThreads", "1") or "1").strip() == "2" else 1
+    tests = [tag.strip() for tag in (resolver.get("yCruncher", "tests", "") or "").split(",") if tag.strip()]
+    test_duration = int(resolver.get("yCruncher", "testDuration", "60") or 60)
+    if memory is None:
+        memory = ycruncher_memory(resolver.get("yCruncher", "memory", "Default"), threads)
+    calibration = calibrate_ycruncher(log_dir) if os.path.isdir(log_dir) else {}
+    plan = plan_ycruncher(memory, threads, tests, caches, calibration, test_duration, cores)
+    targets = {target: memory_for_target(target, tests, threads, caches, calibration) for target in TARGETS}
+    return plan, targets
+
+
+# ===========================================
+# Linpack model
+# ===========================================
+# The script turns the memory setting into the problem size N = floor(sqrt(bytes / 8))
+# and the leading dimension (LDA), the next odd multiple of 8 (16 with FAST and
+# FASTEST, so every 2021 and 2024 run) from N, see Get-LinpackProblemSize and
+# Get-LinpackLeadingDimensionValue. A trial takes 2/3 N^3 + 2 N^2
+# floating point operations, so its runtime follows from the GFlops of the mode.
+# These are calibrated from the timing tables of past Linpack_*.log files; the
+# 1 thread numbers of a Ryzen 5900X from the config file stand in until then.
+LINPACK_VERSIONS = ["2018", "2019", "2021", "2024"]
+LINPACK_MODES = ["SLOWEST", "SLOW", "MEDIUM", "FAST", "FASTEST"]
+LINPACK_MEMORY_PRESETS = ["100MB", "250MB", "500MB", "750MB", "1GB", "2GB", "4GB", "6GB", "30GB"]
+LINPACK_DEFAULT_GFLOPS = {"SLOWEST": 21, "SLOW": 25, "MEDIUM": 27, "FAST": 45, "FASTEST": 66}
+LINPACK_BASE_MEMORY = 25 * 1000 ** 2  # Besides the matrix, 22 to 27 MB in the table of the script
+LINPACK_AUTO_RUNTIME = 10 * 60  # runtimePerCore = auto runs Linpack for 10 minutes per core
+
+LINPACK_HEADER_PATTERN = re.compile(r"\[CoreCycler\] Linpack v(\d+) - (\w+) - (\d) Threads? - (\d+) bytes")
+LINPACK_TRIAL_ROW_PATTERN = re.compile(r"^\s*(\d+)\s+(\d+)\s+\d+\s+([\d.]+)\s+([\d.]+)\s")
+RUNTIME_PART_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([hms]?)")
+
+
+def linpack_mode(version, mode):
+    """Only the 2018 and 2019 versions have modes, the newer ones always run FASTEST."""
+    return mode.upper() if version in ("2018", "2019") else "FASTEST"
+
+
+def linpack_problem_size(memory, mode):
+    """
+    The problem size and leading dimension the script writes for a memory setting.
+
+    Args:
+        memory (int): The memory setting in bytes
+        mode (str): The effective mode, see linpack_mode()
+
+    Returns:
+        tuple: (problem size, LDA)
+    """
+    problem_size = int((memory / 8) ** 0.5)
+    uses_avx = mode in ("FAST", "FASTEST")
+    divisor, odd_divisor = (16, 32) if uses_avx else (8, 16)
+    leading_dimension = -(-problem_size // divisor) * divisor
+    while leading_dimension % odd_divisor == 0:
+        leading_dimension += divisor
+    return problem_size, leading_dimension
+
+
+def linpack_flops(problem_size):
+    return 2 / 3 * problem_size ** 3 + 2 * problem_size ** 2
+
+
+def calibrate_linpack(log_dir):
+    """
+    Collect the GFlops of every trial in the Linpack logs.
+
+    Returns:
+        dict: {(version, mode, threads): [(problem size, GFlops), ...]}
+    """
+    samples = {}
+    for path in glob.glob(os.path.join(glob.escape(log_dir), "Linpack_*.log")):
+        key = None
+        try:
+            with loganalysis.open_log(path) as log:
+                for line in log:
+                    match = LINPACK_HEADER_PATTERN.search(line)
+                    if match:
+                        key = (match.group(1), linpack_mode(match.group(1), match.group(2)), int(match.group(3)))
+                        continue
+                    match = LINPACK_TRIAL_ROW_PATTERN.match(line)
+                    if match and key is not None and float(match.group(4)) > 0:
+                        samples.setdefault(key, []).append((int(match.group(1)), float(match.group(4))))
+        except OSError as e:
+            print(f"Error reading {path}: {e}")
+    return samples
+
+
+def linpack_gflops(version, mode, threads, problem_size, calibration):
+    """
+    The expected GFlops, from the logged trials with the closest problem size.
+
+    Returns:
+        tuple: (GFlops, "log" or "estimate")
+    """
+    samples = calibration.get((version, mode, threads))
+    if not samples:
+        # SMT siblings share the FPU, two threads are estimated at the GFlops of one
+        return LINPACK_DEFAULT_GFLOPS[mode], "estimate"
+    closest = min(abs(size - problem_size) for size, _ in samples)
+    gflops = sorted(value for size, value in samples if abs(size - problem_size) == closest)
+    return gflops[len(gflops) // 2], "log"
+
+
+def linpack_estimate(version, mode, memory, threads, calibration):
+    """
+    Model one Linpack configuration.
+
+    Args:
+        version (str): The Linpack version
+        mode (str): The mode setting, ignored by the versions after 2019
+        memory (str): The memory setting, e.g. "2GB"
+        threads (int): numberOfThreads
+        calibration (dict): See calibrate_linpack()
+
+    Returns:
+        dict: "mode", "problem_size", "lda", "footprint", "gflops", "trial_seconds" and "source", or None
+              if the memory setting is too small
+    """
+    mode = linpack_mode(version, mode)
+    memory_bytes = parse_byte_size(memory)
+    if not memory_bytes:
+        return None
+    problem_size, leading_dimension = linpack_problem_size(memory_bytes, mode)
+    if problem_size < 1:
+        return None
+    gflops, source = linpack_gflops(version, mode, threads, problem_size, calibration)
+    return {
+        "mode": mode,
+        "problem_size": problem_size,
+        "lda": leading_dimension,
+        "footprint": 8 * leading_dimension * problem_size + LINPACK_BASE_MEMORY,
+        "gflops": gflops,
+        "trial_seconds": linpack_flops(problem_size) / (gflops * 1e9),
+        "source": source,
+    }
+
+
+def linpack_model(calibration):
+    """
+    Precompute every combination of version, mode, memory preset and number of threads.
+
+    Returns:
+        dict: {(version, mode, memory, threads): estimate}, see linpack_estimate()
+    """
+    return {
+        (version, mode, memory, threads): linpack_estimate(version, mode, memory, threads, calibration)
+        for version in LINPACK_VERSIONS
+        for mode in LINPACK_MODES
+        for memory in LINPACK_MEMORY_PRESETS
+        for threads in (1, 2)
+    }
+
+
+def parse_runtime_per_core(value):
+    """
+    The runtimePerCore setting in seconds: a plain number of seconds or e.g. "6m", "1h30m", "1.5m".
+
+    Returns:
+        float: Seconds, None for "auto"
+    """
+    value = str(value).strip().lower()
+    if value == "auto":
+        return None
+    seconds = 0.0
+    for number, unit in RUNTIME_PART_PATTERN.findall(value):
+        seconds += float(number) * {"h": 3600, "m": 60}.get(unit, 1)
+    return seconds
+
+
+def linpack_trials(estimate, runtime_seconds):
+    """The number of trials that finish within runtimePerCore, None for "auto"."""
+    return int((runtime_seconds or LINPACK_AUTO_RUNTIME) // estimate["trial_seconds"])
+
+
+def format_linpack_estimate(estimate, runtime_seconds, cores=None):
+    """One line for the Linpack tab: problem size, footprint, time per trial and trials per core."""
+    if estimate is None:
+        return "The memory size is too small for Linpack"
+    runtime = runtime_seconds or LINPACK_AUTO_RUNTIME
+    trials = linpack_trials(estimate, runtime_seconds)
+    lines = [
+        f"Problem size {estimate['problem_size']} (LDA {estimate['lda']}), {format_bytes(estimate['footprint'])} "
+        f"of memory",
+        f"~{estimate['trial_seconds']:.1f}s per trial at {estimate['gflops']:g} GFlops"
+        + (" (estimated)" if estimate["source"] == "estimate" else " (from the logs)"),
+        f"{trials} trial{'s' if trials != 1 else ''} per {runtime / 60:g}m core"
+        + (" (auto)" if runtime_seconds is None else ""),
+    ]
+    if trials == 0:
+        lines[-1] += ", a trial doesn't finish within the runtime per core"
+    if cores:
+        lines.append(f"Runtime per iteration: {runtime * cores / 60:.0f}m for {cores} cores")
+    return "\n".join(lines)
+
+
+def format_linpack_model(model, runtime_seconds, threads):
+    lines = [f"{'Version':<8} {'Mode':<8} {'Memory':>6} {'Size':>6} {'LDA':>6} {'Footprint':>10} {'s/trial':>8} "
+             f"{'Trials':>6}"]
+    for (version, mode, memory, model_threads), estimate in model.items():
+        if model_threads != threads or estimate is None or (version not in ("2018", "2019") and mode != "FASTEST"):
+            continue
+        lines.append(f"{version:<8} {mode:<8} {memory:>6} {estimate['problem_size']:>6} {estimate['lda']:>6} "
+                     f"{format_bytes(estimate['footprint']):>10} {estimate['trial_seconds']:>8.1f} "
+                     f"{linpack_trials(estimate, runtime_seconds):>6}")
+    return "\n".join(lines)
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def run_ycruncher_command(args):
+    caches, source = load_cache_sizes()
+    for level in CACHE_LEVELS:
+        value = getattr(args, level.lower())
+        if value:
+            caches[level] = parse_byte_size(value)
+            source = "command line"
+    resolver = presets.ConfigResolver()
+    memory = parse_byte_size(args.memory) if args.memory else None
+    plan, targets = ycruncher_plan_from_config(resolver, args.logs, caches, memory, args.cores)
+    if source:
+        print(f"Cache sizes from {source}")
+    print(format_ycruncher_plan(plan, targets))
+    return 0
+
+
+def run_linpack_command(args):
+    resolver = presets.ConfigResolver()
+    threads = args.threads or (2 if (resolver.get("General", "numberOfThreads", "1") or "1").strip() == "2" else 1)
+    runtime = parse_runtime_per_core(args.runtime or resolver.get("General", "runtimePerCore", "auto") or "auto")
+    calibration = calibrate_linpack(args.logs) if os.path.isdir(args.logs) else {}
+    if args.table:
+        print(format_linpack_model(linpack_model(calibration), runtime, threads))
+        return 0
+    version = args.version or resolver.get("Linpack", "version", "2018")
+    mode = args.mode or resolver.get("Linpack", "mode", "MEDIUM")
+    memory = args.memory or resolver.get("Linpack", "memory", "2GB")
+    estimate = linpack_estimate(version, mode, memory, threads, calibration)
+    print(f"Linpack {version} - {linpack_mode(version, mode)} - {memory} - {threads} thread{'s' if threads > 1 else ''}")
+    print(format_linpack_estimate(estimate, runtime, args.cores))
+    return 0 if estimate is not None else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Size the memory settings of the stress test programs.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ycruncher_parser = subparsers.add_parser("ycruncher", help="Where the y-cruncher tests run in the cache hierarchy")
+    ycruncher_parser.add_argument("--memory", help="Plan this memory setting, e.g. 64MB (default: the config)")
+    ycruncher_parser.add_argument("--logs", default="logs", help="Folder with the yCruncher logs")
+    ycruncher_parser.add_argument("--cores", type=int, help="Number of cores tested per iteration")
+    for level in CACHE_LEVELS:
+        ycruncher_parser.add_argument(f"--{level.lower()}", help=f"{level} size of one core, e.g. 1MiB")
+    ycruncher_parser.set_defaults(handler=run_ycruncher_command)
+
+    linpack_parser = subparsers.add_parser("linpack", help="Problem size, memory footprint and time per trial of Linpack")
+    linpack_parser.add_argument("--version", choices=LINPACK_VERSIONS, help="Linpack version (default: the config)")
+    linpack_parser.add_argument("--mode", type=str.upper, choices=LINPACK_MODES, help="Linpack mode (default: the config)")
+    linpack_parser.add_argument("--memory", help="Memory setting, e.g. 2GB (default: the config)")
+    linpack_parser.add_argument("--threads", type=int, choices=[1, 2], help="numberOfThreads (default: the config)")
+    linpack_parser.add_argument("--runtime", help="runtimePerCore, e.g. 6m (default: the config)")
+    linpack_parser.add_argument("--cores", type=int, help="Number of cores tested per iteration")
+    linpack_parser.add_argument("--logs", default="logs", help="Folder with the Linpack logs")
+    linpack_parser.add_argument("--table", action="store_true", help="Show every version, mode and memory preset")
+    linpack_parser.set_defaults(handler=run_linpack_command)
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
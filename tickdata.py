@@ -0,0 +1,307 @@
+# tickdata.py
+import os
+import re
+import sys
+import ast
+import glob
+import array
+import zipfile
+import argparse
+from datetime import datetime
+
+import loganalysis
+
+# ===========================================
+# Tick columns
+# ===========================================
+# Every tick of a CoreCycler run becomes one row, with one column per metric.
+# The columns are stored as a compressed NumPy .npz file (a zip archive of .npy
+# files), written and read with the standard library, so numpy.load() opens
+# the files directly but isn't needed to create them.
+#
+# Timestamps are the wall-clock times of the log as seconds since 1970-01-01,
+# without a time zone, like the log itself. Values a tick didn't log are -1.
+TICK_DATA_DIR = ".ticks"
+MISSING = -1
+WHEA_NOT_CHECKED, WHEA_NO_NEW_ERROR, WHEA_NEW_ERROR = -1, 0, 1
+EPOCH = datetime(1970, 1, 1)
+
+TICK_COLUMNS = [
+    # (name, array typecode)
+    ("timestamp", "d"),
+    ("core", "h"),
+    ("iteration", "i"),
+    ("tick", "i"),
+    ("remaining_runtime", "i"),
+    ("cpu_usage_ms", "i"),
+    ("cpu_expected_ms", "i"),
+    ("suspended_ms", "i"),
+    ("suspended_threads", "h"),
+    ("resumed_threads", "h"),
+    ("whea", "b"),
+]
+
+TICK_START_PATTERN = re.compile(r"- Tick (\d+) of max \d+")
+SUSPENDED_THREADS_PATTERN = re.compile(r"^Suspended: (\d+)$")
+RESUMED_THREADS_PATTERN = re.compile(r"^Resumed: (\d+)$")
+
+
+def new_columns():
+    return {name: array.array(typecode) for name, typecode in TICK_COLUMNS}
+
+
+def read_ticks(corecycler_log):
+    """
+    Collect the ticks of a run into columns.
+
+    Args:
+        corecycler_log (str): Path to the CoreCycler_*.log file
+
+    Returns:
+        dict: Column name -> array.array, all of the same length
+    """
+    info = loganalysis.parse_log_name(corecycler_log)
+    if info is None or info["family"] != "CoreCycler":
+        raise ValueError(f"Not a CoreCycler log file: {corecycler_log}")
+
+    columns = new_columns()
+    core = MISSING
+    iteration = MISSING
+    row = None
+
+    def finish_row():
+        if row is not None:
+            for name, _ in TICK_COLUMNS:
+                columns[name].append(row[name])
+
+    for event in loganalysis.read_corecycler_log(corecycler_log, info["started"], include_debug=True):
+        text = event.text.lstrip("+").strip()
+        match = TICK_START_PATTERN.search(text)
+        if match:
+            finish_row()
+            row = {name: MISSING for name, _ in TICK_COLUMNS}
+            row.update({
+                "timestamp": (event.timestamp - EPOCH).total_seconds(),
+                "core": core,
+                "iteration": iteration,
+                "tick": int(match.group(1)),
+                "suspended_ms": 0,
+                "whea": WHEA_NOT_CHECKED,
+            })
+            continue
+        match = loganalysis.CORE_SET_PATTERN.search(text)
+        if match:
+            finish_row()
+            row = None
+            core = int(match.group(1))
+            continue
+        match = loganalysis.ITERATION_PATTERN.search(text)
+        if match:
+            iteration = int(match.group(1))
+            continue
+        if row is None:
+            continue
+
+        match = loganalysis.REMAINING_RUNTIME_PATTERN.search(text)
+        if match:
+            row["remaining_runtime"] = int(match.group(1))
+            continue
+        match = loganalysis.CPU_CHECK_PATTERN.search(text)
+        if match and match.group(2) == "ms":
+            row["cpu_usage_ms"] = int(match.group(1))
+            row["cpu_expected_ms"] = int(match.group(3))
+            continue
+        match = loganalysis.SUSPEND_PATTERN.search(text)
+        if match:
+            row["suspended_ms"] += int(match.group(1))
+            continue
+        match = SUSPENDED_THREADS_PATTERN.match(text)
+        if match:
+            row["suspended_threads"] = int(match.group(1))
+            continue
+        match = RESUMED_THREADS_PATTERN.match(text)
+        if match:
+            row["resumed_threads"] = int(match.group(1))
+            continue
+        if text == "No new WHEA error":
+            row["whea"] = max(row["whea"], WHEA_NO_NEW_ERROR)
+        elif text == "New WHEA error found!":
+            row["whea"] = WHEA_NEW_ERROR
+    finish_row()
+    return columns
+
+
+# ===========================================
+# .npz files
+# ===========================================
+NPY_MAGIC = b"\x93NUMPY"
+NPY_DESCRIPTORS = {"b": "|i1", "h": "<i2", "i": "<i4", "q": "<i8", "d": "<f8"}
+NPY_TYPECODES = {descriptor: typecode for typecode, descriptor in NPY_DESCRIPTORS.items()}
+
+
+def npy_bytes(values):
+    """Encode an array.array as a version 1.0 .npy file."""
+    header = f"{{'descr': '{NPY_DESCRIPTORS[values.typecode]}', 'fortran_order': False, 'shape': ({len(values)},), }}"
+    # The header is padded with spaces so the data starts at a multiple of 64 bytes
+    padding = 64 - (len(NPY_MAGIC) + 4 + len(header) + 1) % 64
+    header = (header + " " * padding + "\n").encode("latin1")
+    if sys.byteorder == "big":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return NPY_MAGIC + b"\x01\x00" + len(header).to_bytes(2, "little") + header + values.tobytes()
+
+
+def read_npy(data):
+    """Decode a one-dimensional .npy file written by npy_bytes() or NumPy."""
+    if not data.startswith(NPY_MAGIC):
+        raise ValueError("Not a .npy file")
+    major = data[6]
+    header_size_bytes = 2 if major == 1 else 4
+    header_size = int.from_bytes(data[8:8 + header_size_bytes], "little")
+    start = 8 + header_size_bytes + header_size
+    header = ast.literal_eval(data[8 + header_size_bytes:start].decode("latin1"))
+    typecode = NPY_TYPECODES.get(header["descr"])
+    if typecode is None or len(header["shape"]) != 1:
+        raise ValueError(f"Unsupported .npy array: {header['descr']} {header['shape']}")
+    values = array.array(typecode)
+    values.frombytes(data[start:])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_npz(path, columns):
+    """Write the columns as a compressed .npz file, replacing it in one step."""
+    temporary_file = path + ".tmp"
+    with zipfile.ZipFile(temporary_file, "w", compression=zipfile.ZIP_DEFLATED) as npz:
+        for name, values in columns.items():
+            npz.writestr(name + ".npy", npy_bytes(values))
+    os.replace(temporary_file, path)
+
+
+def read_npz(path, names=None):
+    """
+    Read the columns of a .npz file.
+
+    Args:
+        path (str): The .npz file
+        names (list): Only read these columns
+
+    Returns:
+        dict: Column name -> array.array
+    """
+    columns = {}
+    with zipfile.ZipFile(path) as npz:
+        for member in npz.namelist():
+            name = member[:-len(".npy")]
+            if names is None or name in names:
+                columns[name] = read_npy(npz.read(member))
+    return columns
+
+
+# ===========================================
+# Export and history
+# ===========================================
+def tick_file(corecycler_log, out_dir=None):
+    if out_dir is None:
+        out_dir = os.path.join(os.path.dirname(os.path.abspath(corecycler_log)), TICK_DATA_DIR)
+    return os.path.join(out_dir, os.path.splitext(os.path.basename(corecycler_log))[0] + ".npz")
+
+
+def export_run(corecycler_log, out_dir=None, force=False):
+    """
+    Export the ticks of a run, unless the exported file is newer than the log.
+
+    Returns:
+        str: The .npz file, or None if it was up to date
+    """
+    path = tick_file(corecycler_log, out_dir)
+    if not force and os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(corecycler_log):
+        return None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_npz(path, read_ticks(corecycler_log))
+    return path
+
+
+def load_tick_history(tick_dir, since=None, names=None):
+    """
+    Load the exported ticks of many runs into one set of columns.
+
+    Args:
+        tick_dir (str): Folder with the .npz files
+        since (datetime): Skip runs started before this time
+        names (list): Only load these columns
+
+    Returns:
+        tuple: (columns, runs), where the "run" column indexes the list of run names
+    """
+    columns = {}
+    runs = []
+    run_column = array.array("i")
+    for path in sorted(glob.glob(os.path.join(glob.escape(tick_dir), "CoreCycler_*.npz"))):
+        info = loganalysis.parse_log_name(path[:-len(".npz")] + ".log")
+        if since is not None and (info is None or info["started"] < since):
+            continue
+        run_columns = read_npz(path, names)
+        for name, values in run_columns.items():
+            columns.setdefault(name, array.array(values.typecode)).extend(values)
+        rows = len(next(iter(run_columns.values()), ()))
+        run_column.extend([len(runs)] * rows)
+        runs.append(os.path.basename(path)[:-len(".npz")])
+    columns["run"] = run_column
+    return columns, runs
+
+
+# ===========================================
+# Command line interface
+# ===========================================
+def run_export_command(args):
+    text_size = 0
+    exported_size = 0
+    exported = 0
+    for corecycler_log in sorted(glob.glob(os.path.join(glob.escape(args.logs), "CoreCycler_*.log"))):
+        try:
+            path = export_run(corecycler_log, args.out, args.force)
+        except (OSError, ValueError) as e:
+            print(f"Skipping {corecycler_log}: {e}")
+            continue
+        if path is None:
+            continue
+        exported += 1
+        text_size += os.path.getsize(corecycler_log)
+        exported_size += os.path.getsize(path)
+    if exported:
+        print(f"Exported {exported} runs, {text_size / 1024:.0f} KB of logs to {exported_size / 1024:.0f} KB of tick data")
+    else:
+        print("All runs are up to date")
+    return 0
+
+
+def run_info_command(args):
+    columns = read_npz(args.file)
+    rows = len(next(iter(columns.values()), ()))
+    print(f"{args.file}: {rows} ticks")
+    for name, values in columns.items():
+        print(f"  {name:<20} {NPY_DESCRIPTORS[values.typecode]}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Export the tick-level data of CoreCycler runs to .npz column files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export the runs that changed since the last export")
+    export_parser.add_argument("--logs", default="logs", help="Folder with the CoreCycler logs")
+    export_parser.add_argument("--out", help="Where to write the .npz files, defaults to .ticks in the logs folder")
+    export_parser.add_argument("--force", action="store_true", help="Export all runs again")
+    export_parser.set_defaults(handler=run_export_command)
+
+    info_parser = subparsers.add_parser("info", help="Show the columns of an exported run")
+    info_parser.add_argument("file", help="A .npz file written by the export")
+    info_parser.set_defaults(handler=run_info_command)
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
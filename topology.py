@@ -0,0 +1,434 @@
+# topology.py
+import os
+import re
+import json
+import platform
+import configparser
+from collections import Counter
+
+# ===========================================
+# Topology sources
+# ===========================================
+# APICID.exe prints one line per logical CPU:
+#   Logical CPU 12 - Physical Core 6 - APIC ID 16 - SMT On
+# The CoreCycler log has an equivalent block in its header:
+#   CPU  8:  ACPI ID =  8  -> Core  4 (SMT On)
+APICID_LINE_PATTERN = re.compile(
+    r"Logical CPU\s+(\d+)\s+-\s+Physical Core\s+(\d+)\s+-\s+APIC ID\s+(\d+)\s+-\s+SMT (On|Off)"
+)
+LOG_APIC_LINE_PATTERN = re.compile(r"CPU\s+(\d+):\s+ACPI ID =\s+(\d+)\s+->\s+Core\s+(\d+) \(SMT (On|Off)\)")
+CPU_LIST_PATTERN = re.compile(r"\(CPU ([\d ,and]+)\)")
+
+TOPOLOGY_CACHE_FILE = "topology.json"
+TOPOLOGY_VERSION = 1
+
+
+def parse_apicid_output(text):
+    """
+    Parse the output of APICID.exe.
+
+    Returns:
+        list: (logical_cpu, physical_core, apic_id, smt) tuples
+    """
+    entries = []
+    for match in APICID_LINE_PATTERN.finditer(text):
+        cpu, core, apic_id, smt = match.groups()
+        entries.append((int(cpu), int(core), int(apic_id), smt == "On"))
+    return entries
+
+
+def parse_log_apic_block(lines):
+    """
+    Parse the "APIC IDs:" block of a CoreCycler log.
+
+    Args:
+        lines (iterable): Lines of the log; reading stops after the block
+
+    Returns:
+        list: (logical_cpu, physical_core, apic_id, smt) tuples
+    """
+    entries = []
+    for line in lines:
+        match = LOG_APIC_LINE_PATTERN.search(line)
+        if match:
+            cpu, apic_id, core, smt = match.groups()
+            entries.append((int(cpu), int(core), int(apic_id), smt == "On"))
+        elif entries:
+            break
+    return entries
+
+
+def hardware_fingerprint():
+    """
+    Identify the current hardware, so a cached topology is dropped when it changes.
+
+    Uses the processor identifier and the logical CPU count, which is enough to
+    notice a CPU swap or SMT being toggled in the BIOS.
+    """
+    identifier = os.environ.get("PROCESSOR_IDENTIFIER") or platform.processor() or platform.machine()
+    return f"{identifier.strip()}|{os.cpu_count()}"
+
+
+# ===========================================
+# CpuTopology Class
+# ===========================================
+class CpuTopology:
+    def __init__(self, entries, processor="", fingerprint=None, clusters=None):
+        """
+        Map physical cores to logical CPUs, SMT siblings and CCD/cluster groups.
+
+        All lookups are backed by dicts built once here, so they are O(1).
+
+        Args:
+            entries (list): (logical_cpu, physical_core, apic_id, smt) tuples
+            processor (str): Processor name, used to guess CCD groups
+            fingerprint (str): Hardware fingerprint, defaults to the current machine
+            clusters (dict): Optional {core: cluster name}, overrides the guessed groups
+        """
+        self.entries = sorted(entries)
+        self.processor = processor
+        self.fingerprint = fingerprint if fingerprint is not None else hardware_fingerprint()
+
+        self.cpu_to_core = {}
+        self.core_to_cpus = {}
+        self.core_apic_ids = {}
+        self.core_smt = {}
+        for cpu, core, apic_id, smt in self.entries:
+            self.cpu_to_core[cpu] = core
+            self.core_to_cpus.setdefault(core, []).append(cpu)
+            self.core_apic_ids.setdefault(core, []).append(apic_id)
+            self.core_smt[core] = smt
+
+        self.core_to_cluster = dict(clusters) if clusters else self.guess_clusters()
+        self.cluster_to_cores = {}
+        for core in sorted(self.core_to_cpus):
+            self.cluster_to_cores.setdefault(self.core_to_cluster.get(core, "0"), []).append(core)
+
+    def guess_clusters(self):
+        """
+        Guess the CCD / cluster of every core.
+
+        - Hybrid Intel CPUs: cores without SMT next to cores with SMT are E-cores,
+          grouped in modules of four; the others are P-cores.
+        - Otherwise a jump in the APIC IDs larger than the regular step between
+          cores marks a new CCD/CCX (e.g. 5900X: ..., 10, 16, ...).
+        - If the APIC IDs are contiguous, AMD CPUs with more than 8 cores are
+          split into CCDs of 8 cores.
+        """
+        cores = sorted(self.core_to_cpus)
+        if not cores:
+            return {}
+
+        smt_values = set(self.core_smt.values())
+        if smt_values == {True, False}:
+            clusters = {}
+            e_cores = [core for core in cores if not self.core_smt[core]]
+            for core in cores:
+                if self.core_smt[core]:
+                    clusters[core] = "P"
+                else:
+                    clusters[core] = f"E{e_cores.index(core) // 4}"
+            return clusters
+
+        first_ids = [min(self.core_apic_ids[core]) for core in cores]
+        steps = [later - earlier for earlier, later in zip(first_ids, first_ids[1:])]
+        clusters = {}
+        group = 0
+        if steps:
+            regular_step = Counter(steps).most_common(1)[0][0]
+            if any(step > regular_step for step in steps):
+                clusters[cores[0]] = "CCD0"
+                for core, step in zip(cores[1:], steps):
+                    if step > regular_step:
+                        group += 1
+                    clusters[core] = f"CCD{group}"
+                return clusters
+
+        if "AMD" in self.processor.upper() and len(cores) > 8:
+            return {core: f"CCD{index // 8}" for index, core in enumerate(cores)}
+        return {core: "CCD0" for core in cores}
+
+    def core_for_cpu(self, cpu):
+        """Return the physical core of a logical CPU, or None."""
+        return self.cpu_to_core.get(cpu)
+
+    def cpus_for_core(self, core):
+        """Return the logical CPUs of a physical core."""
+        return self.core_to_cpus.get(core, [])
+
+    def siblings(self, cpu):
+        """Return the SMT siblings of a logical CPU (excluding itself)."""
+        core = self.cpu_to_core.get(cpu)
+        return [other for other in self.core_to_cpus.get(core, []) if other != cpu]
+
+    def cluster_of(self, core):
+        """Return the CCD / cluster name of a physical core."""
+        return self.core_to_cluster.get(core)
+
+    def cpus_for_cores(self, cores):
+        """Map e.g. the coresToIgnore entries to their logical CPUs."""
+        return {core: self.cpus_for_core(core) for core in cores}
+
+    def resolve_core_line(self, text):
+        """
+        Resolve a "Set to Core 4 (CPU 8)" style line to its core and cluster.
+
+        Returns:
+            dict: {"core", "cpus", "cluster"}, or None if the line has no CPU list
+        """
+        match = CPU_LIST_PATTERN.search(text)
+        if not match:
+            return None
+        cpus = [int(value) for value in re.findall(r"\d+", match.group(1))]
+        core = self.cpu_to_core.get(cpus[0])
+        return {"core": core, "cpus": cpus, "cluster": self.core_to_cluster.get(core)}
+
+    @property
+    def physical_cores(self):
+        return len(self.core_to_cpus)
+
+    @property
+    def logical_cpus(self):
+        return len(self.cpu_to_core)
+
+    def describe(self):
+        """Render the topology as a text table."""
+        lines = [f"{self.processor or 'Unknown processor'}: "
+                 f"{self.physical_cores} physical cores / {self.logical_cpus} logical CPUs", ""]
+        for cluster, cores in self.cluster_to_cores.items():
+            lines.append(f"{cluster}:")
+            for core in cores:
+                cpus = ", ".join(str(cpu) for cpu in self.core_to_cpus[core])
+                apic_ids = ", ".join(str(apic_id) for apic_id in self.core_apic_ids[core])
+                smt = "SMT On" if self.core_smt[core] else "SMT Off"
+                lines.append(f"  Core {core:>2}: CPU {cpus:<8} APIC ID {apic_ids:<8} {smt}")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            "version": TOPOLOGY_VERSION,
+            "fingerprint": self.fingerprint,
+            "processor": self.processor,
+            "entries": [list(entry) for entry in self.entries],
+            "clusters": {str(core): cluster for core, cluster in self.core_to_cluster.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        clusters = {int(core): cluster for core, cluster in data.get("clusters", {}).items()}
+        return cls(
+            [tuple(entry) for entry in data["entries"]],
+            processor=data.get("processor", ""),
+            fingerprint=data.get("fingerprint"),
+            clusters=clusters,
+        )
+
+    def save(self, path=TOPOLOGY_CACHE_FILE):
+        """Save the topology so it can be reused without running APICID.exe again."""
+        try:
+            with open(path, "w", encoding="utf-8") as cachefile:
+                json.dump(self.to_dict(), cachefile, indent=2)
+            print(f"Saved CPU topology to {path}")
+        except OSError as e:
+            print(f"Error writing {path}: {e}")
+
+
+def load_cached_topology(path=TOPOLOGY_CACHE_FILE):
+    """
+    Load the cached topology if it was recorded on the current hardware.
+
+    Returns:
+        CpuTopology: The cached topology, or None if missing, invalid or stale
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as cachefile:
+            data = json.load(cachefile)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != TOPOLOGY_VERSION or data.get("fingerprint") != hardware_fingerprint():
+        return None
+    try:
+        return CpuTopology.from_dict(data)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def topology_from_log(corecycler_log):
+    """
+    Build a topology from the "APIC IDs:" block and processor line of a CoreCycler log.
+
+    The fingerprint is left empty because the log may come from another machine.
+
+    Returns:
+        CpuTopology: The topology, or None if the log has no APIC ID block
+    """
+    processor = ""
+    with open(corecycler_log, "r", encoding="utf-8", errors="replace") as log:
+        entries = parse_log_apic_block(log)
+        for line in log:
+            if line.startswith("Detected processor:"):
+                processor = line.split(":", 1)[1].strip(" .\r\n")
+                break
+    if not entries:
+        return None
+    return CpuTopology(entries, processor=processor, fingerprint="")
+
+
+# ===========================================
+# Topology-aware core ordering
+# ===========================================
+# A user supplied topology file overrides the guessed CCD / cluster groups:
+#   [Topology]
+#   CCD0 = 0, 1, 2, 3, 4, 5, 6, 7
+#   CCD1 = 8, 9, 10, 11, 12, 13, 14, 15
+TOPOLOGY_FILE = "topology.ini"
+
+# How much heat a tested core passes on to another core, relative to itself
+COUPLING_SAME_CORE = 1.0
+COUPLING_NEIGHBOUR = 0.6
+COUPLING_SAME_CLUSTER = 0.3
+COUPLING_OTHER_CLUSTER = 0.05
+HEAT_DECAY = 0.5
+
+
+def load_topology_file(path=TOPOLOGY_FILE):
+    """
+    Load a {core: cluster} map from a user supplied topology file.
+
+    Returns:
+        dict: {core: cluster name}, or None if the file is missing or empty
+    """
+    parser = configparser.ConfigParser()
+    parser.optionxform = str
+    try:
+        if not parser.read(path, encoding="utf-8") or "Topology" not in parser:
+            return None
+    except configparser.Error as e:
+        print(f"Error reading {path}: {e}")
+        return None
+
+    clusters = {}
+    for cluster, cores in parser["Topology"].items():
+        for core in re.findall(r"\d+", cores):
+            clusters[int(core)] = cluster
+    return clusters or None
+
+
+def core_coupling(core, other, core_to_cluster):
+    """Return how much of the heat of one core reaches another core."""
+    if core == other:
+        return COUPLING_SAME_CORE
+    if core_to_cluster.get(core) != core_to_cluster.get(other):
+        return COUPLING_OTHER_CLUSTER
+    if abs(core - other) == 1:
+        return COUPLING_NEIGHBOUR
+    return COUPLING_SAME_CLUSTER
+
+
+def simulate_thermal_adjacency(order, core_to_cluster, iterations=2, decay=HEAT_DECAY):
+    """
+    Predict how warm each core is when its test starts.
+
+    Every tested core heats itself and, weaker, its neighbours and the rest of its
+    CCD / cluster; the heat decays with every core that is tested after it.
+    The order is repeated for a number of iterations, so the wrap-around from the
+    last core to the first core is scored as well.
+
+    Args:
+        order (list): Core test order
+        core_to_cluster (dict): {core: cluster name}
+        iterations (int): How often the order is repeated
+        decay (float): Fraction of the heat that is left after each core
+
+    Returns:
+        list: (core, start temperature) tuples, in test order
+    """
+    cores = set(order) | set(core_to_cluster)
+    temperatures = dict.fromkeys(cores, 0.0)
+    starts = []
+    for _ in range(iterations):
+        for core in order:
+            starts.append((core, temperatures[core]))
+            for other in cores:
+                temperatures[other] = temperatures[other] * decay + core_coupling(core, other, core_to_cluster)
+    return starts
+
+
+def score_core_order(order, core_to_cluster, iterations=2, decay=HEAT_DECAY):
+    """
+    Score a core test order by its predicted thermal adjacency.
+
+    Returns:
+        float: Average start temperature of a core, lower is better
+    """
+    starts = simulate_thermal_adjacency(order, core_to_cluster, iterations, decay)
+    if not starts:
+        return 0.0
+    return sum(temperature for _, temperature in starts) / len(starts)
+
+
+def interleave_cores(cluster_to_cores, cores_to_ignore=(), decay=HEAT_DECAY):
+    """
+    Build a core test order that takes turns between the CCDs / clusters.
+
+    Within a cluster the next core is the one the simulator predicts to be the
+    coolest, which spreads the tests as far apart as possible (0, 4, 2, 6, ...).
+
+    Args:
+        cluster_to_cores (dict): {cluster name: [cores]}
+        cores_to_ignore (iterable): Cores that are left out of the order
+
+    Returns:
+        list: Core test order
+    """
+    ignored = set(cores_to_ignore)
+    remaining = {
+        cluster: [core for core in cores if core not in ignored]
+        for cluster, cores in cluster_to_cores.items()
+    }
+    remaining = {cluster: cores for cluster, cores in remaining.items() if cores}
+    core_to_cluster = {core: cluster for cluster, cores in remaining.items() for core in cores}
+    temperatures = dict.fromkeys(core_to_cluster, 0.0)
+
+    order = []
+    while remaining:
+        for cluster in list(remaining):
+            core = min(remaining[cluster], key=lambda candidate: (temperatures[candidate], candidate))
+            remaining[cluster].remove(core)
+            if not remaining[cluster]:
+                del remaining[cluster]
+            order.append(core)
+            for other in temperatures:
+                temperatures[other] = temperatures[other] * decay + core_coupling(core, other, core_to_cluster)
+    return order
+
+
+def alternate_order(cores):
+    """Reproduce the "Alternate" coreTestOrder of the script (0, half, 1, half + 1, ...)."""
+    cores = sorted(cores)
+    half = (len(cores) + 1) // 2
+    order = []
+    for first, second in zip(cores[:half], cores[half:] + [None] * half):
+        order.append(first)
+        if second is not None:
+            order.append(second)
+    return order
+
+
+def compare_core_orders(cluster_to_cores, cores_to_ignore=()):
+    """
+    Score the Sequential, Alternate and Interleaved orders against each other.
+
+    Returns:
+        list: (name, order, score) tuples, best score first
+    """
+    ignored = set(cores_to_ignore)
+    core_to_cluster = {core: cluster for cluster, cores in cluster_to_cores.items() for core in cores}
+    cores = sorted(core for core in core_to_cluster if core not in ignored)
+    orders = {
+        "Sequential": cores,
+        "Alternate": alternate_order(cores),
+        "Interleaved": interleave_cores(cluster_to_cores, ignored),
+    }
+    results = [(name, order, score_core_order(order, core_to_cluster)) for name, order in orders.items()]
+    return sorted(results, key=lambda result: result[2])
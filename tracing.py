@@ -0,0 +1,162 @@
+# tracing.py
+import os
+import json
+import time
+import inspect
+import threading
+import configparser
+from collections import deque
+from contextlib import contextmanager
+
+# ===========================================
+# Tracer Class
+# ===========================================
+# Tracing is opt-in: start the GUI with --trace or with CORECYCLER_TRACE=1 set.
+# The events are kept in a ring buffer in the Chrome trace event format, so an
+# exported file can be opened in chrome://tracing or https://ui.perfetto.dev
+TRACE_ENV = "CORECYCLER_TRACE"
+TRACE_CAPACITY = 20000
+
+
+class Tracer:
+    def __init__(self, capacity=TRACE_CAPACITY):
+        """
+        Record handled signals, config mutations and disk writes with their durations.
+
+        Args:
+            capacity (int): Number of events kept, older events are dropped
+        """
+        self.enabled = False
+        self.events = deque(maxlen=capacity)
+        self.origin = time.perf_counter()
+        self.local = threading.local()
+
+    def enable(self):
+        self.enabled = True
+        print(f"Tracing enabled, keeping the last {self.events.maxlen} events")
+
+    def timestamp(self):
+        """Microseconds since the tracer was created."""
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def frames(self):
+        """The open spans of the current thread."""
+        if not hasattr(self.local, "frames"):
+            self.local.frames = []
+        return self.local.frames
+
+    def count(self, counter):
+        """Count e.g. a disk write for every open span of the current thread."""
+        if not self.enabled:
+            return
+        for frame in self.frames():
+            frame[counter] = frame.get(counter, 0) + 1
+
+    @contextmanager
+    def span(self, name, category, **args):
+        """Record the duration of a block, with the writes and mutations that happened inside it."""
+        if not self.enabled:
+            yield
+            return
+        frame = dict(args)
+        frames = self.frames()
+        frames.append(frame)
+        start = self.timestamp()
+        try:
+            yield
+        finally:
+            frames.pop()
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start,
+                "dur": self.timestamp() - start,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": frame,
+            })
+
+    def instant(self, name, category, **args):
+        """Record an event without a duration."""
+        if not self.enabled:
+            return
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "i",
+            "s": "t",
+            "ts": self.timestamp(),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+    def wrap(self, slot, name=None, category="signal"):
+        """
+        Wrap a slot so every call is recorded as a span.
+
+        Qt drops signal arguments a slot doesn't accept; the wrapper takes all
+        arguments, so it drops them itself.
+        """
+        name = name or getattr(slot, "__qualname__", repr(slot))
+        try:
+            parameters = inspect.signature(slot).parameters.values()
+            if any(parameter.kind == parameter.VAR_POSITIONAL for parameter in parameters):
+                accepted = None
+            else:
+                accepted = sum(1 for parameter in parameters
+                               if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD))
+        except (TypeError, ValueError):
+            accepted = None
+
+        def traced_slot(*args):
+            with self.span(name, category):
+                return slot(*(args if accepted is None else args[:accepted]))
+
+        return traced_slot
+
+    def export_chrome_trace(self, path):
+        """Write the buffered events as a Chrome trace file."""
+        with open(path, "w", encoding="utf-8") as tracefile:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, tracefile)
+        print(f"Wrote {len(self.events)} trace events to {path}")
+
+    def summary(self):
+        """
+        Summarize the handled signals, slowest first.
+
+        Handlers that wrote the config more than once per call are marked, those
+        writes are redundant as every write saves the whole file.
+        """
+        handlers = {}
+        for event in self.events:
+            if event["cat"] != "signal":
+                continue
+            stats = handlers.setdefault(event["name"], {"calls": 0, "total": 0.0, "max": 0.0, "writes": 0, "max_writes": 0})
+            writes = event["args"].get("writes", 0)
+            stats["calls"] += 1
+            stats["total"] += event["dur"]
+            stats["max"] = max(stats["max"], event["dur"])
+            stats["writes"] += writes
+            stats["max_writes"] = max(stats["max_writes"], writes)
+
+        lines = [f"{'Handler':<60} {'Calls':>6} {'Total ms':>9} {'Max ms':>8} {'Writes':>7}"]
+        for name, stats in sorted(handlers.items(), key=lambda item: item[1]["total"], reverse=True):
+            marker = "  <- writes more than once per call" if stats["max_writes"] > 1 else ""
+            lines.append(f"{name[:60]:<60} {stats['calls']:>6} {stats['total'] / 1000:>9.2f} "
+                         f"{stats['max'] / 1000:>8.2f} {stats['writes']:>7}{marker}")
+        return "\n".join(lines)
+
+
+tracer = Tracer()
+
+
+class TracedConfigParser(configparser.ConfigParser):
+    """ConfigParser that records every value set while tracing is enabled."""
+
+    def set(self, section, option, value=None):
+        if tracer.enabled:
+            tracer.instant(f"set [{section}] {option}", "config", value=value)
+            tracer.count("mutations")
+        super().set(section, option, value)